@@ -12,7 +12,7 @@ and valid before the server starts operation.
 """
 import json
 import os
-from typing import Optional
+from typing import Dict, Optional, Tuple
 from .models import Config
 
 def load_config(config_path: Optional[str] = None) -> Config:
@@ -63,12 +63,48 @@ def load_config(config_path: Optional[str] = None) -> Config:
         raise ValueError("PROXMOX_MCP_CONFIG environment variable must be set")
 
     try:
-        with open(config_path) as f:
-            config_data = json.load(f)
-            if not config_data.get('proxmox', {}).get('host'):
-                raise ValueError("Proxmox host cannot be empty")
-            return Config(**config_data)
+        # Read raw bytes; json.loads detects the UTF encoding itself, which
+        # avoids the text-mode decoding layer
+        with open(config_path, 'rb') as f:
+            config_data = json.loads(f.read())
+        if not config_data.get('proxmox', {}).get('host'):
+            raise ValueError("Proxmox host cannot be empty")
+        return Config(**config_data)
     except json.JSONDecodeError as e:
         raise ValueError(f"Invalid JSON in config file: {e}")
     except Exception as e:
         raise ValueError(f"Failed to load config: {e}")
+
+# Parsed configs by absolute path, tagged with the file's (mtime_ns, size)
+# so reloading an unchanged file skips reading and re-validating it.
+# Kept in memory only: a cache file would duplicate the API token on disk
+_CONFIG_CACHE: Dict[str, Tuple[int, int, Config]] = {}
+
+def load_config_cached(config_path: Optional[str]) -> Config:
+    """Load configuration, reusing the last result while the file is unchanged.
+
+    Args:
+        config_path: Path to configuration file
+
+    Returns:
+        Validated Config object
+
+    Raises:
+        ValueError: If the configuration cannot be loaded (see load_config)
+    """
+    if not config_path:
+        return load_config(config_path)
+    try:
+        st = os.stat(config_path)
+    except OSError:
+        # Let load_config report the missing/unreadable file
+        return load_config(config_path)
+
+    path = os.path.abspath(config_path)
+    cached = _CONFIG_CACHE.get(path)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+
+    config = load_config(config_path)
+    _CONFIG_CACHE[path] = (st.st_mtime_ns, st.st_size, config)
+    return config
@@ -0,0 +1,108 @@
+"""
+In-process result caching for the Proxmox MCP server.
+
+This module provides a small time-to-live cache used to answer repeated
+read-only tool calls without another Proxmox API round trip:
+- Per-entry expiry after a fixed TTL
+- Bounded size with oldest-first eviction
+- Explicit invalidation after state-changing operations
+- Hit/miss counters for observability
+
+Cluster inventory (nodes, storage, templates) changes on a scale of
+minutes, while an agent often queries it several times within seconds.
+"""
+import threading
+import time
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """Bounded mapping whose entries expire a fixed time after being set.
+
+    All operations take an internal lock, so tool methods running in
+    worker threads can share one cache.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 128):
+        """Initialize the cache.
+
+        Args:
+            ttl: Seconds an entry stays valid after it is stored
+            maxsize: Maximum number of entries kept at once
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: Dict[Hashable, tuple] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Get a cached value if present and not expired.
+
+        Args:
+            key: Cache key
+            default: Value returned on a miss
+
+        Returns:
+            Cached value, or default when missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > time.monotonic():
+                    self.hits += 1
+                    return entry[1]
+                del self._entries[key]
+            self.misses += 1
+            return default
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value, evicting expired or oldest entries when full.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Optional lifetime for this entry, overriding the cache TTL
+        """
+        expires = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            entries = self._entries
+            if key not in entries and len(entries) >= self.maxsize:
+                now = time.monotonic()
+                for stale in [k for k, (expiry, _) in entries.items() if expiry <= now]:
+                    del entries[stale]
+                if len(entries) >= self.maxsize:
+                    del entries[next(iter(entries))]
+            entries[key] = (expires, value)
+
+    def invalidate(self, prefix: Tuple[Hashable, ...]) -> None:
+        """Drop all tuple keys starting with the given elements.
+
+        Args:
+            prefix: Leading key elements, e.g. ("container_config", "pve1")
+        """
+        size = len(prefix)
+        with self._lock:
+            for key in [k for k in self._entries
+                        if isinstance(k, tuple) and k[:size] == prefix]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with size, limits and hit/miss counters
+        """
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
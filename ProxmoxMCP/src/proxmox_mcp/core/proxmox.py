@@ -12,12 +12,49 @@ interactions, ensuring consistent connection handling and authentication
 across the MCP server.
 """
 import logging
+import os
 import urllib3
 import warnings
 from typing import Dict, Any
 from proxmoxer import ProxmoxAPI
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from ..config.models import ProxmoxConfig, AuthConfig
 
+# HTTP connection pool for the shared API session. Tool calls run in worker
+# threads, so keep enough pooled connections for them to reuse TLS sessions
+# instead of reconnecting once more than the requests default (10) overlap.
+# FANOUT_WORKERS bounds the threads tools use for per-node calls; they draw
+# from the same pool as the tool worker threads.
+POOL_CONNECTIONS = 16
+FANOUT_WORKERS = 16
+
+_DEFAULT_MAX_INFLIGHT = 12
+
+def _max_inflight() -> int:
+    """Read the in-flight request limit from PROXMOX_MAX_INFLIGHT.
+
+    Returns:
+        Configured limit (at least 1), or the default when unset or invalid
+    """
+    raw = os.getenv("PROXMOX_MAX_INFLIGHT")
+    if raw is None:
+        return _DEFAULT_MAX_INFLIGHT
+    try:
+        return max(1, int(raw))
+    except ValueError:
+        logging.getLogger("proxmox-mcp.proxmox").warning(
+            f"Ignoring invalid PROXMOX_MAX_INFLIGHT={raw!r}; using {_DEFAULT_MAX_INFLIGHT}"
+        )
+        return _DEFAULT_MAX_INFLIGHT
+
+# Maximum number of concurrent requests to the Proxmox API. The pool holds
+# this many connections and blocks further requests until one is free, so
+# parallel tool calls cannot overwhelm pveproxy on large clusters. The server
+# sizes its tool worker threads to match. Tune via the PROXMOX_MAX_INFLIGHT
+# environment variable.
+MAX_INFLIGHT = _max_inflight()
+
 class ProxmoxManager:
     """Manager class for Proxmox API operations.
     
@@ -97,6 +134,7 @@ class ProxmoxManager:
                 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
                 
             api = ProxmoxAPI(**self.config)
+            self._configure_session(api)
             
             # Test connection
             api.version.get()
@@ -107,6 +145,37 @@ class ProxmoxManager:
             self.logger.error(f"Failed to connect to Proxmox: {e}")
             raise RuntimeError(f"Failed to connect to Proxmox: {e}")
 
+    def _configure_session(self, api: ProxmoxAPI) -> None:
+        """Mount a larger, bounded, retrying connection pool on the API's HTTP session.
+
+        proxmoxer's https backend keeps a single requests session for the
+        lifetime of the ProxmoxAPI object; this widens its pool so that
+        concurrent tool calls keep reusing established connections, and
+        makes requests wait for a free connection once MAX_INFLIGHT are in
+        use. Retries only apply to read-only requests; PUT and DELETE are
+        left out even though urllib3 treats them as idempotent, since Proxmox
+        may already have started a task for them.
+
+        Args:
+            api: Freshly created ProxmoxAPI instance
+        """
+        session = getattr(api, "_store", {}).get("session")
+        if session is None or not hasattr(session, "mount"):
+            self.logger.debug("Proxmox backend has no HTTP session; using defaults")
+            return
+
+        adapter = HTTPAdapter(
+            pool_connections=POOL_CONNECTIONS,
+            pool_maxsize=MAX_INFLIGHT,
+            pool_block=True,
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.1,
+                allowed_methods=frozenset({"GET", "HEAD", "OPTIONS"}),
+            ),
+        )
+        session.mount("https://", adapter)
+
     def get_api(self) -> ProxmoxAPI:
         """Get the initialized Proxmox API instance.
         
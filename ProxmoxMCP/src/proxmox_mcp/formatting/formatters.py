@@ -1,16 +1,25 @@
 """
 Core formatting functions for Proxmox MCP output.
 """
+from functools import lru_cache
 from typing import List, Union, Dict, Any
 from .theme import ProxmoxTheme
 from .colors import ProxmoxColors
 
+# Theme icons used on hot formatting paths, resolved once at import
+_UPTIME_ICON = ProxmoxTheme.METRICS['uptime']
+_COMMAND_ICON = ProxmoxTheme.ACTIONS['command']
+
 class ProxmoxFormatters:
     """Core formatting functions for Proxmox data."""
     
     @staticmethod
+    @lru_cache(maxsize=2048, typed=True)
     def format_bytes(bytes_value: int) -> str:
         """Format bytes with proper units.
+
+        Results are memoized since the same capacities recur across nodes,
+        VMs and repeated calls.
         
         Args:
             bytes_value: Number of bytes
@@ -18,13 +27,19 @@ class ProxmoxFormatters:
         Returns:
             Formatted string with appropriate unit
         """
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if bytes_value < 1024:
-                return f"{bytes_value:.2f} {unit}"
-            bytes_value /= 1024
-        return f"{bytes_value:.2f} TB"
+        # Proxmox capacities are almost always GB/TB, so test largest first
+        if bytes_value >= 1 << 40:
+            return f"{bytes_value / (1 << 40):.2f} TB"
+        if bytes_value >= 1 << 30:
+            return f"{bytes_value / (1 << 30):.2f} GB"
+        if bytes_value >= 1 << 20:
+            return f"{bytes_value / (1 << 20):.2f} MB"
+        if bytes_value >= 1 << 10:
+            return f"{bytes_value / (1 << 10):.2f} KB"
+        return f"{bytes_value:.2f} B"
     
     @staticmethod
+    @lru_cache(maxsize=2048, typed=True)
     def format_uptime(seconds: int) -> str:
         """Format uptime in seconds to human readable format.
         
@@ -46,7 +61,7 @@ class ProxmoxFormatters:
         if minutes > 0:
             parts.append(f"{minutes}m")
             
-        return f"{ProxmoxTheme.METRICS['uptime']} " + " ".join(parts) if parts else "0m"
+        return f"{_UPTIME_ICON} " + " ".join(parts) if parts else "0m"
     
     @staticmethod
     def format_percentage(value: float, warning: float = 80.0, critical: float = 90.0) -> str:
@@ -139,7 +154,7 @@ class ProxmoxFormatters:
             Formatted command output string
         """
         result = [
-            f"{ProxmoxTheme.ACTIONS['command']} Console Command Result",
+            f"{_COMMAND_ICON} Console Command Result",
             f"  • Status: {'SUCCESS' if success else 'FAILED'}",
             f"  • Command: {command}",
             "",
@@ -1,602 +1,654 @@
 """
 Output templates for Proxmox MCP resource types.
 """
-from typing import Dict, List, Any
+import io
+import sys
+from typing import Any, Callable, Dict, List
+
 from .formatters import ProxmoxFormatters
 from .theme import ProxmoxTheme
-from .colors import ProxmoxColors
-from .components import ProxmoxComponents
-
-class ProxmoxTemplates:
-    """Output templates for different Proxmox resource types."""
-
-    @staticmethod
-    def node_list(nodes: List[Dict[str, Any]]) -> str:
-        """Template for node list output.
-
-        Args:
-            nodes: List of node data dictionaries
-
-        Returns:
-            Formatted node list string
-        """
-        result = [f"{ProxmoxTheme.RESOURCES['node']} Proxmox Nodes"]
-
-        for node in nodes:
-            # Get node status
-            status = node.get("status", "unknown")
-
-            # Get memory info
-            memory = node.get("memory", {})
-            memory_used = memory.get("used", 0)
-            memory_total = memory.get("total", 0)
-            memory_percent = (memory_used / memory_total * 100) if memory_total > 0 else 0
-
-            # Format node info
-            result.extend([
-                "",  # Empty line between nodes
-                f"{ProxmoxTheme.RESOURCES['node']} {node['node']}",
-                f"  • Status: {status.upper()}",
-                f"  • Uptime: {ProxmoxFormatters.format_uptime(node.get('uptime', 0))}",
-                f"  • CPU Cores: {node.get('maxcpu', 'N/A')}",
-                f"  • Memory: {ProxmoxFormatters.format_bytes(memory_used)} / "
-                f"{ProxmoxFormatters.format_bytes(memory_total)} ({memory_percent:.1f}%)"
-            ])
-
-            # Add disk usage if available
-            disk = node.get("disk", {})
-            if disk:
-                disk_used = disk.get("used", 0)
-                disk_total = disk.get("total", 0)
-                disk_percent = (disk_used / disk_total * 100) if disk_total > 0 else 0
-                result.append(
-                    f"  • Disk: {ProxmoxFormatters.format_bytes(disk_used)} / "
-                    f"{ProxmoxFormatters.format_bytes(disk_total)} ({disk_percent:.1f}%)"
-                )
-
-        return "\n".join(result)
 
-    @staticmethod
-    def node_status(node: str, status: Dict[str, Any]) -> str:
-        """Template for detailed node status output.
-
-        Args:
-            node: Node name
-            status: Node status data
-
-        Returns:
-            Formatted node status string
-        """
-        memory = status.get("memory", {})
-        memory_used = memory.get("used", 0)
-        memory_total = memory.get("total", 0)
-        memory_percent = (memory_used / memory_total * 100) if memory_total > 0 else 0
-
-        result = [
-            f"{ProxmoxTheme.RESOURCES['node']} Node: {node}",
-            f"  • Status: {status.get('status', 'unknown').upper()}",
-            f"  • Uptime: {ProxmoxFormatters.format_uptime(status.get('uptime', 0))}",
-            f"  • CPU Cores: {status.get('maxcpu', 'N/A')}",
-            f"  • Memory: {ProxmoxFormatters.format_bytes(memory_used)} / "
-            f"{ProxmoxFormatters.format_bytes(memory_total)} ({memory_percent:.1f}%)"
-        ]
-
-        # Add disk usage if available
-        disk = status.get("disk", {})
-        if disk:
-            disk_used = disk.get("used", 0)
-            disk_total = disk.get("total", 0)
-            disk_percent = (disk_used / disk_total * 100) if disk_total > 0 else 0
+# Theme icons and static headers are constant, so resolve (and intern) them
+# once at import
+_NODE_ICON = sys.intern(ProxmoxTheme.RESOURCES['node'])
+_VM_ICON = sys.intern(ProxmoxTheme.RESOURCES['vm'])
+_CT_ICON = sys.intern(ProxmoxTheme.RESOURCES['container'])
+_STORAGE_ICON = sys.intern(ProxmoxTheme.RESOURCES['storage'])
+_TEMPLATE_ICON = sys.intern(ProxmoxTheme.RESOURCES['template'])
+
+_SECTION_CONFIG = sys.intern(ProxmoxTheme.SECTIONS['configuration'])
+_SECTION_NET = sys.intern(ProxmoxTheme.SECTIONS['network'])
+_SECTION_STORAGE = sys.intern(ProxmoxTheme.SECTIONS['storage'])
+_SECTION_SUCCESS = sys.intern(ProxmoxTheme.SECTIONS['success'])
+_SECTION_ERROR = sys.intern(ProxmoxTheme.SECTIONS['error'])
+_SECTION_PERF = sys.intern(ProxmoxTheme.SECTIONS['performance'])
+
+_HEADER_NODES = f"{_NODE_ICON} Proxmox Nodes"
+_HEADER_VMS = f"{_VM_ICON} Virtual Machines"
+_HEADER_STORAGE = f"{_STORAGE_ICON} Storage Pools"
+_HEADER_CONTAINERS = f"{_CT_ICON} Containers"
+_HEADER_CONTAINER_TEMPLATES = f"{_TEMPLATE_ICON} Container Templates"
+_HEADER_VM_TEMPLATES = f"{_TEMPLATE_ICON} VM Templates"
+_HEADER_CLUSTER = f"{_SECTION_CONFIG} Proxmox Cluster"
+
+# Shared read-only default for missing sub-dicts
+_EMPTY: Dict[str, Any] = {}
+
+# Byte-counter lines as (data key, label, first field, first word,
+# second field, second word)
+_CT_STATUS_IO = (
+    ('network', "  • Network", 'in_bytes', 'in', 'out_bytes', 'out'),
+    ('disk', "  • Disk", 'read_bytes', 'read', 'write_bytes', 'write'),
+)
+_CT_PERF_IO = (
+    ('disk_io', "  • Disk I/O", 'read_bytes', 'read', 'write_bytes', 'write'),
+    ('network', "  • Network I/O", 'in_bytes', 'in', 'out_bytes', 'out'),
+)
+
+# Upper-cased forms of the status values the API reports, so rendering
+# reuses one string per status instead of calling .upper() per item
+_STATUS_UP = {s: s.upper() for s in (
+    "running", "stopped", "paused", "suspended",
+    "online", "offline", "unknown", "available", "active",
+)}
+
+def _pct(used: Any, total: Any) -> str:
+    """Format a usage ratio as a percentage with one decimal place.
+
+    Byte counters from the API are integers, so the common case is computed
+    with integer arithmetic (rounding half to even, like ``:.1f``) instead of
+    going through float division and float formatting.
+
+    Args:
+        used: Used amount
+        total: Total amount
+
+    Returns:
+        Percentage string such as '42.5%'
+    """
+    if not total > 0:
+        return "0.0%"
+    if (isinstance(used, int) and not isinstance(used, bool)
+            and isinstance(total, int) and not isinstance(total, bool) and used >= 0):
+        tenths, rem = divmod(used * 1000, total)
+        if rem * 2 > total or (rem * 2 == total and tenths & 1):
+            tenths += 1
+        return f"{tenths // 10}.{tenths % 10}%"
+    return f"{used / total * 100:.1f}%"
+
+def _format_mem_line(data: Dict[str, Any]) -> str:
+    """Format the memory usage line for a resource.
+
+    Args:
+        data: Resource data dictionary with an optional 'memory' sub-dict
+
+    Returns:
+        Formatted memory usage line
+    """
+    memory = data.get("memory") or _EMPTY
+    used = memory.get("used", 0)
+    total = memory.get("total", 0)
+    fb = ProxmoxFormatters.format_bytes
+    return f"  • Memory: {fb(used)} / {fb(total)} ({_pct(used, total)})"
+
+def _format_disk_line(disk: Dict[str, Any]) -> str:
+    """Format the disk usage line for a node.
+
+    Args:
+        disk: Disk usage dictionary with 'used' and 'total' keys
+
+    Returns:
+        Formatted disk usage line
+    """
+    used = disk.get("used", 0)
+    total = disk.get("total", 0)
+    fb = ProxmoxFormatters.format_bytes
+    return f"  • Disk: {fb(used)} / {fb(total)} ({_pct(used, total)})"
+
+def _op_result(data: Dict[str, Any], ok_msg: str, err_msg: str,
+               always_detail: bool = True) -> str:
+    """Format the result of a task-starting operation.
+
+    Args:
+        data: Operation result data with 'success', 'message' and either
+            'task_id' or 'error'
+        ok_msg: Default message when the operation succeeded
+        err_msg: Default message when the operation failed
+        always_detail: Whether to emit the Task ID / Error line even when
+            the key is missing from the result
+
+    Returns:
+        Formatted operation result string
+    """
+    if data.get('success', False):
+        if always_detail or 'task_id' in data:
+            return f"{_SECTION_SUCCESS} {data.get('message', ok_msg)}\n\nTask ID: {data.get('task_id', 'N/A')}"
+        return f"{_SECTION_SUCCESS} {data.get('message', ok_msg)}"
+    if always_detail or 'error' in data:
+        return f"{_SECTION_ERROR} {data.get('message', err_msg)}\n\nError: {data.get('error', 'Unknown error')}"
+    return f"{_SECTION_ERROR} {data.get('message', err_msg)}"
+
+# Operation kind -> (default success message, default failure message,
+# whether the Task ID / Error line is emitted even when the key is missing)
+_OP_TEMPLATES = {
+    'template_op': ('Operation completed successfully', 'Operation failed', False),
+    'template_clone': ('Template cloned successfully', 'Template clone failed', False),
+    'container_op': ('Operation completed successfully', 'Operation failed', True),
+    'container_clone': ('Container cloned successfully', 'Container clone failed', True),
+}
+
+def format_operation(kind: str, data: Dict[str, Any]) -> str:
+    """Template for any registered operation result.
+
+    Args:
+        kind: Operation kind, one of the keys of _OP_TEMPLATES
+        data: Operation result data
+
+    Returns:
+        Formatted operation result string
+    """
+    ok_msg, err_msg, always_detail = _OP_TEMPLATES[kind]
+    return _op_result(data, ok_msg, err_msg, always_detail)
+
+def _make_guest_list(header: str, icon: str) -> Callable[[List[Dict[str, Any]]], str]:
+    """Build a list renderer specialized for one guest type.
+
+    VMs and containers share the same per-item layout and differ only in
+    their header and icon, which are bound into the returned closure.
+
+    Args:
+        header: Precomputed list header line
+        icon: Icon prefixed to each guest's title line
+
+    Returns:
+        Function rendering a list of guest data dictionaries
+    """
+    def render(guests: List[Dict[str, Any]]) -> str:
+        if not guests:
+            return header
+
+        # One preformatted block per guest, led by the blank separator line
+        result: List[str] = [header]
+        mem_line = _format_mem_line
+        status_up = _STATUS_UP.get
+
+        for guest in guests:
+            status = guest['status']
             result.append(
-                f"  • Disk: {ProxmoxFormatters.format_bytes(disk_used)} / "
-                f"{ProxmoxFormatters.format_bytes(disk_total)} ({disk_percent:.1f}%)"
+                f"\n{icon} {guest['name']} (ID: {guest['vmid']})"
+                f"\n  • Status: {status_up(status) or status.upper()}"
+                f"\n  • Node: {guest['node']}"
+                f"\n  • CPU Cores: {guest.get('cpus', 'N/A')}"
+                f"\n{mem_line(guest)}"
             )
 
         return "\n".join(result)
 
-    @staticmethod
-    def vm_list(vms: List[Dict[str, Any]]) -> str:
-        """Template for VM list output.
-
-        Args:
-            vms: List of VM data dictionaries
-
-        Returns:
-            Formatted VM list string
-        """
-        result = [f"{ProxmoxTheme.RESOURCES['vm']} Virtual Machines"]
-
-        for vm in vms:
-            memory = vm.get("memory", {})
-            memory_used = memory.get("used", 0)
-            memory_total = memory.get("total", 0)
-            memory_percent = (memory_used / memory_total * 100) if memory_total > 0 else 0
-
-            result.extend([
-                "",  # Empty line between VMs
-                f"{ProxmoxTheme.RESOURCES['vm']} {vm['name']} (ID: {vm['vmid']})",
-                f"  • Status: {vm['status'].upper()}",
-                f"  • Node: {vm['node']}",
-                f"  • CPU Cores: {vm.get('cpus', 'N/A')}",
-                f"  • Memory: {ProxmoxFormatters.format_bytes(memory_used)} / "
-                f"{ProxmoxFormatters.format_bytes(memory_total)} ({memory_percent:.1f}%)"
-            ])
+    return render
 
-        return "\n".join(result)
+_render_vm_list = _make_guest_list(_HEADER_VMS, _VM_ICON)
+_render_container_list = _make_guest_list(_HEADER_CONTAINERS, _CT_ICON)
 
-    @staticmethod
-    def storage_list(storage: List[Dict[str, Any]]) -> str:
-        """Template for storage list output.
+def node_list(nodes: List[Dict[str, Any]]) -> str:
+    """Template for node list output.
 
-        Args:
-            storage: List of storage data dictionaries
+    Args:
+        nodes: List of node data dictionaries
 
-        Returns:
-            Formatted storage list string
-        """
-        result = [f"{ProxmoxTheme.RESOURCES['storage']} Storage Pools"]
+    Returns:
+        Formatted node list string
+    """
+    if not nodes:
+        return _HEADER_NODES
 
-        for store in storage:
-            used = store.get("used", 0)
-            total = store.get("total", 0)
-            percent = (used / total * 100) if total > 0 else 0
+    # One preformatted block per node, led by the blank separator line
+    result: List[str] = [_HEADER_NODES]
+    fu = ProxmoxFormatters.format_uptime
+    mem_line = _format_mem_line
+    disk_line = _format_disk_line
+    status_up = _STATUS_UP.get
 
-            result.extend([
-                "",  # Empty line between storage pools
-                f"{ProxmoxTheme.RESOURCES['storage']} {store['storage']}",
-                f"  • Status: {store.get('status', 'unknown').upper()}",
-                f"  • Type: {store['type']}",
-                f"  • Usage: {ProxmoxFormatters.format_bytes(used)} / "
-                f"{ProxmoxFormatters.format_bytes(total)} ({percent:.1f}%)"
-            ])
+    for node in nodes:
+        # Get node status
+        status = node.get("status", "unknown")
 
-        return "\n".join(result)
-
-    @staticmethod
-    def container_list(containers: List[Dict[str, Any]]) -> str:
-        """Template for container list output.
-
-        Args:
-            containers: List of container data dictionaries
-
-        Returns:
-            Formatted container list string
-        """
-        if not containers:
-            return f"{ProxmoxTheme.RESOURCES['container']} No containers found"
-
-        result = [f"{ProxmoxTheme.RESOURCES['container']} Containers"]
-
-        for container in containers:
-            memory = container.get("memory", {})
-            memory_used = memory.get("used", 0)
-            memory_total = memory.get("total", 0)
-            memory_percent = (memory_used / memory_total * 100) if memory_total > 0 else 0
-
-            result.extend([
-                "",  # Empty line between containers
-                f"{ProxmoxTheme.RESOURCES['container']} {container['name']} (ID: {container['vmid']})",
-                f"  • Status: {container['status'].upper()}",
-                f"  • Node: {container['node']}",
-                f"  • CPU Cores: {container.get('cpus', 'N/A')}",
-                f"  • Memory: {ProxmoxFormatters.format_bytes(memory_used)} / "
-                f"{ProxmoxFormatters.format_bytes(memory_total)} ({memory_percent:.1f}%)"
-            ])
-
-        return "\n".join(result)
-
-    @staticmethod
-    def container_status(container: Dict[str, Any]) -> str:
-        """Template for container status output.
-
-        Args:
-            container: Container status data
-
-        Returns:
-            Formatted container status string
-        """
-        result = [f"{ProxmoxTheme.RESOURCES['container']} Container: {container.get('name', container.get('vmid', 'Unknown'))} (ID: {container['vmid']})"]
-
-        # Basic container info
-        result.extend([
-            f"  • Status: {container.get('status', 'unknown').upper()}",
-            f"  • Node: {container.get('node', 'N/A')}",
-        ])
+        # Format node info
+        block = (
+            f"\n{_NODE_ICON} {node['node']}"
+            f"\n  • Status: {status_up(status) or status.upper()}"
+            f"\n  • Uptime: {fu(node.get('uptime', 0))}"
+            f"\n  • CPU Cores: {node.get('maxcpu', 'N/A')}"
+            f"\n{mem_line(node)}"
+        )
 
-        # CPU info
-        cpu = container.get('cpu', {})
-        if isinstance(cpu, dict):
-            result.append(f"  • CPU: {cpu.get('cores', 'N/A')} cores, {cpu.get('usage', 0) * 100:.1f}% usage")
-        else:
-            result.append(f"  • CPU: {container.get('cpus', 'N/A')} cores")
-
-        # Memory info
-        memory = container.get('memory', {})
-        memory_used = memory.get('used', 0)
-        memory_total = memory.get('total', 0)
-        memory_percent = (memory_used / memory_total * 100) if memory_total > 0 else 0
-        result.append(f"  • Memory: {ProxmoxFormatters.format_bytes(memory_used)} / "
-                     f"{ProxmoxFormatters.format_bytes(memory_total)} ({memory_percent:.1f}%)")
-
-        # Uptime
-        uptime = container.get('uptime', 0)
-        if uptime > 0:
-            result.append(f"  • Uptime: {ProxmoxFormatters.format_uptime(uptime)}")
-
-        # Network info
-        network = container.get('network', {})
-        if network:
-            result.append(f"  • Network: {ProxmoxFormatters.format_bytes(network.get('in_bytes', 0))} in, "
-                         f"{ProxmoxFormatters.format_bytes(network.get('out_bytes', 0))} out")
-
-        # Disk info
-        disk = container.get('disk', {})
+        # Add disk usage if available
+        disk = node.get("disk", _EMPTY)
         if disk:
-            result.append(f"  • Disk: {ProxmoxFormatters.format_bytes(disk.get('read_bytes', 0))} read, "
-                         f"{ProxmoxFormatters.format_bytes(disk.get('write_bytes', 0))} write")
-
-        return "\n".join(result)
-
-    @staticmethod
-    def container_config(config: Dict[str, Any]) -> str:
-        """Template for container configuration output.
-
-        Args:
-            config: Container configuration data
+            block = f"{block}\n{disk_line(disk)}"
+        result.append(block)
+
+    return "\n".join(result)
+
+def node_status(node: str, status: Dict[str, Any]) -> str:
+    """Template for detailed node status output.
+
+    Args:
+        node: Node name
+        status: Node status data
+
+    Returns:
+        Formatted node status string
+    """
+    state = status.get('status', 'unknown')
+    result = [
+        f"{_NODE_ICON} Node: {node}",
+        f"  • Status: {_STATUS_UP.get(state) or state.upper()}",
+        f"  • Uptime: {ProxmoxFormatters.format_uptime(status.get('uptime', 0))}",
+        f"  • CPU Cores: {status.get('maxcpu', 'N/A')}",
+        _format_mem_line(status)
+    ]
+
+    # Add disk usage if available
+    disk = status.get("disk", _EMPTY)
+    if disk:
+        result.append(_format_disk_line(disk))
+
+    return "\n".join(result)
+
+def vm_list(vms: List[Dict[str, Any]]) -> str:
+    """Template for VM list output.
+
+    Args:
+        vms: List of VM data dictionaries
+
+    Returns:
+        Formatted VM list string
+    """
+    return _render_vm_list(vms)
+
+def storage_list(storage: List[Dict[str, Any]]) -> str:
+    """Template for storage list output.
+
+    Args:
+        storage: List of storage data dictionaries
+
+    Returns:
+        Formatted storage list string
+    """
+    if not storage:
+        return _HEADER_STORAGE
+
+    # One preformatted block per pool, led by the blank separator line
+    result: List[str] = [_HEADER_STORAGE]
+    fb = ProxmoxFormatters.format_bytes
+    status_up = _STATUS_UP.get
+
+    for store in storage:
+        used = store.get("used", 0)
+        total = store.get("total", 0)
+        status = store.get('status', 'unknown')
+
+        result.append(
+            f"\n{_STORAGE_ICON} {store['storage']}"
+            f"\n  • Status: {status_up(status) or status.upper()}"
+            f"\n  • Type: {store['type']}"
+            f"\n  • Usage: {fb(used)} / {fb(total)} ({_pct(used, total)})"
+        )
+
+    return "\n".join(result)
+
+def container_list(containers: List[Dict[str, Any]]) -> str:
+    """Template for container list output.
+
+    Args:
+        containers: List of container data dictionaries
+
+    Returns:
+        Formatted container list string
+    """
+    if not containers:
+        return f"{_CT_ICON} No containers found"
+
+    return _render_container_list(containers)
+
+def container_status(container: Dict[str, Any]) -> str:
+    """Template for container status output.
+
+    Args:
+        container: Container status data
+
+    Returns:
+        Formatted container status string
+    """
+    result = [f"{_CT_ICON} Container: {container.get('name', container.get('vmid', 'Unknown'))} (ID: {container['vmid']})"]
+
+    # Basic container info
+    status = container.get('status', 'unknown')
+    result.extend([
+        f"  • Status: {_STATUS_UP.get(status) or status.upper()}",
+        f"  • Node: {container.get('node', 'N/A')}",
+    ])
+
+    # CPU info
+    cpu = container.get('cpu', _EMPTY)
+    if isinstance(cpu, dict):
+        result.append(f"  • CPU: {cpu.get('cores', 'N/A')} cores, {cpu.get('usage', 0) * 100:.1f}% usage")
+    else:
+        result.append(f"  • CPU: {container.get('cpus', 'N/A')} cores")
+
+    # Memory info
+    result.append(_format_mem_line(container))
+
+    # Uptime
+    uptime = container.get('uptime', 0)
+    if uptime > 0:
+        result.append(f"  • Uptime: {ProxmoxFormatters.format_uptime(uptime)}")
+
+    # Network and disk counters, when reported
+    fb = ProxmoxFormatters.format_bytes
+    for key, label, a, a_word, b, b_word in _CT_STATUS_IO:
+        counters = container.get(key)
+        if counters:
+            result.append(f"{label}: {fb(counters.get(a, 0))} {a_word}, {fb(counters.get(b, 0))} {b_word}")
+
+    return "\n".join(result)
+
+def container_config(config: Dict[str, Any]) -> str:
+    """Template for container configuration output.
+
+    Args:
+        config: Container configuration data
+
+    Returns:
+        Formatted container configuration string
+    """
+    buf = io.StringIO()
+    write = buf.write
+
+    # Basic configuration
+    write(f"{_SECTION_CONFIG} Container Configuration")
+    write(f"\n\n  • Hostname: {config.get('hostname', 'N/A')}")
+    write(f"\n  • CPU: {config.get('cores', 'N/A')} cores")
+    write(f"\n  • Memory: {config.get('memory', 'N/A')} MB")
+    write(f"\n  • Swap: {config.get('swap', 'N/A')} MB")
+    write(f"\n  • Start on boot: {'Yes' if config.get('onboot', 0) == 1 else 'No'}")
+
+    # Partition network interfaces and storage/mount points in one pass
+    net_interfaces = []
+    mount_points = []
+    for key, value in config.items():
+        if key[:2] == 'mp' or key == 'rootfs':
+            mount_points.append(f"\n  • {key}: {value}")
+        elif key[:3] == 'net' and key != 'netif':
+            net_interfaces.append(f"\n  • {key}: {value}")
+
+    if net_interfaces:
+        write(f"\n\n{_SECTION_NET} Network Interfaces")
+        for line in net_interfaces:
+            write(line)
+
+    if mount_points:
+        write(f"\n\n{_SECTION_STORAGE} Storage")
+        for line in mount_points:
+            write(line)
+
+    return buf.getvalue()
+
+def container_performance(performance: Dict[str, Any]) -> str:
+    """Template for container performance output.
+
+    Args:
+        performance: Container performance data
+
+    Returns:
+        Formatted container performance string
+    """
+    result = [f"{_SECTION_PERF} Container Performance"]
+
+    # CPU usage
+    result.append(f"  • CPU Usage: {performance.get('cpu_usage', 0) * 100:.1f}%")
+
+    # Memory usage
+    result.append(_format_mem_line(performance))
+
+    # Disk and network I/O
+    fb = ProxmoxFormatters.format_bytes
+    for key, label, a, a_word, b, b_word in _CT_PERF_IO:
+        counters = performance.get(key, _EMPTY)
+        result.append(f"{label}: {fb(counters.get(a, 0))} {a_word}, {fb(counters.get(b, 0))} {b_word}")
+
+    return "\n".join(result)
+
+def container_templates(templates: List[Dict[str, Any]]) -> str:
+    """Template for container templates output.
+
+    Args:
+        templates: List of container template data
+
+    Returns:
+        Formatted container templates string
+    """
+    if not templates:
+        return f"{_TEMPLATE_ICON} No container templates found"
+
+    result = [_HEADER_CONTAINER_TEMPLATES]
+    fb = ProxmoxFormatters.format_bytes
+
+    for template in templates:
+        volid = template.get('volid', 'Unknown')
+        # Extract template name from volid (e.g., local:vztmpl/ubuntu-20.04-standard_20.04-1_amd64.tar.gz)
+        template_name = volid.split('/')[-1] if '/' in volid else volid
 
-        Returns:
-            Formatted container configuration string
-        """
-        result = [f"{ProxmoxTheme.SECTIONS['configuration']} Container Configuration"]
-
-        # Basic configuration
         result.extend([
-            "",
-            f"  • Hostname: {config.get('hostname', 'N/A')}",
-            f"  • CPU: {config.get('cores', 'N/A')} cores",
-            f"  • Memory: {config.get('memory', 'N/A')} MB",
-            f"  • Swap: {config.get('swap', 'N/A')} MB",
-            f"  • Start on boot: {'Yes' if config.get('onboot', 0) == 1 else 'No'}"
+            "",  # Empty line between templates
+            f"{_TEMPLATE_ICON} {template_name}",
+            f"  • Volume ID: {volid}",
+            f"  • Size: {fb(template.get('size', 0))}",
+            f"  • Format: {template.get('format', 'N/A')}"
         ])
 
-        # Network interfaces
-        net_interfaces = []
-        for key, value in config.items():
-            if key.startswith('net') and key != 'netif':
-                net_interfaces.append(f"  • {key}: {value}")
-
-        if net_interfaces:
-            result.append("")
-            result.append(f"{ProxmoxTheme.SECTIONS['network']} Network Interfaces")
-            result.extend(net_interfaces)
-
-        # Storage/mount points
-        mount_points = []
-        for key, value in config.items():
-            if key.startswith('mp') or key == 'rootfs':
-                mount_points.append(f"  • {key}: {value}")
+    return "\n".join(result)
 
-        if mount_points:
-            result.append("")
-            result.append(f"{ProxmoxTheme.SECTIONS['storage']} Storage")
-            result.extend(mount_points)
+def vm_templates(templates: List[Dict[str, Any]]) -> str:
+    """Template for VM templates output.
 
-        return "\n".join(result)
-
-    @staticmethod
-    def container_performance(performance: Dict[str, Any]) -> str:
-        """Template for container performance output.
-
-        Args:
-            performance: Container performance data
-
-        Returns:
-            Formatted container performance string
-        """
-        result = [f"{ProxmoxTheme.SECTIONS['performance']} Container Performance"]
-
-        # CPU usage
-        result.append(f"  • CPU Usage: {performance.get('cpu_usage', 0) * 100:.1f}%")
+    Args:
+        templates: List of VM template data
 
-        # Memory usage
-        memory = performance.get('memory', {})
-        memory_used = memory.get('used', 0)
-        memory_total = memory.get('total', 0)
-        memory_percent = (memory_used / memory_total * 100) if memory_total > 0 else 0
-        result.append(f"  • Memory: {ProxmoxFormatters.format_bytes(memory_used)} / "
-                     f"{ProxmoxFormatters.format_bytes(memory_total)} ({memory_percent:.1f}%)")
-
-        # Disk I/O
-        disk_io = performance.get('disk_io', {})
-        result.append(f"  • Disk I/O: {ProxmoxFormatters.format_bytes(disk_io.get('read_bytes', 0))} read, "
-                     f"{ProxmoxFormatters.format_bytes(disk_io.get('write_bytes', 0))} write")
-
-        # Network I/O
-        network = performance.get('network', {})
-        result.append(f"  • Network I/O: {ProxmoxFormatters.format_bytes(network.get('in_bytes', 0))} in, "
-                     f"{ProxmoxFormatters.format_bytes(network.get('out_bytes', 0))} out")
-
-        return "\n".join(result)
+    Returns:
+        Formatted VM templates string
+    """
+    if not templates:
+        return f"{_TEMPLATE_ICON} No VM templates found"
 
-    @staticmethod
-    def container_templates(templates: List[Dict[str, Any]]) -> str:
-        """Template for container templates output.
-
-        Args:
-            templates: List of container template data
-
-        Returns:
-            Formatted container templates string
-        """
-        if not templates:
-            return f"{ProxmoxTheme.RESOURCES['template']} No container templates found"
-
-        result = [f"{ProxmoxTheme.RESOURCES['template']} Container Templates"]
-
-        for template in templates:
-            volid = template.get('volid', 'Unknown')
-            # Extract template name from volid (e.g., local:vztmpl/ubuntu-20.04-standard_20.04-1_amd64.tar.gz)
-            template_name = volid.split('/')[-1] if '/' in volid else volid
-
-            result.extend([
-                "",  # Empty line between templates
-                f"{ProxmoxTheme.RESOURCES['template']} {template_name}",
-                f"  • Volume ID: {volid}",
-                f"  • Size: {ProxmoxFormatters.format_bytes(template.get('size', 0))}",
-                f"  • Format: {template.get('format', 'N/A')}"
-            ])
-
-        return "\n".join(result)
-
-    @staticmethod
-    def vm_templates(templates: List[Dict[str, Any]]) -> str:
-        """Template for VM templates output.
-
-        Args:
-            templates: List of VM template data
-
-        Returns:
-            Formatted VM templates string
-        """
-        if not templates:
-            return f"{ProxmoxTheme.RESOURCES['template']} No VM templates found"
-
-        result = [f"{ProxmoxTheme.RESOURCES['template']} VM Templates"]
-
-        for template in templates:
-            template_name = template.get('name', f"vm-{template.get('vmid', 'Unknown')}")
-
-            result.extend([
-                "",  # Empty line between templates
-                f"{ProxmoxTheme.RESOURCES['template']} {template_name} (ID: {template.get('vmid', 'Unknown')})",
-                f"  • Node: {template.get('node', 'N/A')}",
-                f"  • Description: {template.get('description', 'No description')}",
-                f"  • CPU Cores: {template.get('cores', 'N/A')}",
-                f"  • Memory: {template.get('memory', 'N/A')} MB",
-                f"  • OS Type: {template.get('os_type', 'N/A')}"
-            ])
-
-            # Add disk information if available
-            disks = template.get('disks', {})
-            if disks:
-                disk_info = []
-                for disk_id, disk_value in disks.items():
-                    disk_info.append(f"    - {disk_id}: {disk_value}")
-
-                if disk_info:
-                    result.append(f"  • Disks:")
-                    result.extend(disk_info)
-
-        return "\n".join(result)
-
-    @staticmethod
-    def template_details(template: Dict[str, Any]) -> str:
-        """Template for detailed VM template information.
-
-        Args:
-            template: Template data dictionary
-
-        Returns:
-            Formatted template details string
-        """
-        if not template:
-            return f"{ProxmoxTheme.RESOURCES['template']} Template details not found"
+    result = [_HEADER_VM_TEMPLATES]
 
+    for template in templates:
         template_name = template.get('name', f"vm-{template.get('vmid', 'Unknown')}")
 
-        result = [
-            f"{ProxmoxTheme.RESOURCES['template']} Template: {template_name} (ID: {template.get('vmid', 'Unknown')})",
+        result.extend([
+            "",  # Empty line between templates
+            f"{_TEMPLATE_ICON} {template_name} (ID: {template.get('vmid', 'Unknown')})",
             f"  • Node: {template.get('node', 'N/A')}",
             f"  • Description: {template.get('description', 'No description')}",
             f"  • CPU Cores: {template.get('cores', 'N/A')}",
             f"  • Memory: {template.get('memory', 'N/A')} MB",
             f"  • OS Type: {template.get('os_type', 'N/A')}"
-        ]
+        ])
 
-        # Add disk information
-        disks = template.get('disks', {})
+        # Add disk information if available
+        disks = template.get('disks', _EMPTY)
         if disks:
-            result.append("")
-            result.append(f"{ProxmoxTheme.SECTIONS['storage']} Disks")
+            disk_info = []
             for disk_id, disk_value in disks.items():
-                result.append(f"  • {disk_id}: {disk_value}")
-
-        # Add network information
-        networks = template.get('networks', {})
-        if networks:
-            result.append("")
-            result.append(f"{ProxmoxTheme.SECTIONS['network']} Network Interfaces")
-            for net_id, net_value in networks.items():
-                result.append(f"  • {net_id}: {net_value}")
-
-        return "\n".join(result)
-
-    @staticmethod
-    def template_operation(operation: Dict[str, Any]) -> str:
-        """Template for template operation output.
-
-        Args:
-            operation: Template operation result data
-
-        Returns:
-            Formatted template operation string
-        """
-        if operation.get('success', False):
-            result = [
-                f"{ProxmoxTheme.SECTIONS['success']} {operation.get('message', 'Operation completed successfully')}"
-            ]
-
-            # Add task ID if available
-            if 'task_id' in operation:
-                result.append("")
-                result.append(f"Task ID: {operation.get('task_id', 'N/A')}")
-        else:
-            result = [
-                f"{ProxmoxTheme.SECTIONS['error']} {operation.get('message', 'Operation failed')}"
-            ]
-
-            # Add error details if available
-            if 'error' in operation:
-                result.append("")
-                result.append(f"Error: {operation.get('error', 'Unknown error')}")
-
-        return "\n".join(result)
-
-    @staticmethod
-    def template_clone(clone_result: Dict[str, Any]) -> str:
-        """Template for template clone operation output.
-
-        Args:
-            clone_result: Template clone operation result data
-
-        Returns:
-            Formatted template clone operation string
-        """
-        if clone_result.get('success', False):
-            result = [
-                f"{ProxmoxTheme.SECTIONS['success']} {clone_result.get('message', 'Template cloned successfully')}"
-            ]
-
-            # Add task ID if available
-            if 'task_id' in clone_result:
-                result.append("")
-                result.append(f"Task ID: {clone_result.get('task_id', 'N/A')}")
-        else:
-            result = [
-                f"{ProxmoxTheme.SECTIONS['error']} {clone_result.get('message', 'Template clone failed')}"
-            ]
-
-            # Add error details if available
-            if 'error' in clone_result:
-                result.append("")
-                result.append(f"Error: {clone_result.get('error', 'Unknown error')}")
-
-        return "\n".join(result)
-
-    @staticmethod
-    def container_operation(operation: Dict[str, Any]) -> str:
-        """Template for container operation output.
-
-        Args:
-            operation: Container operation result data
-
-        Returns:
-            Formatted container operation string
-        """
-        if operation.get('success', False):
-            result = [
-                f"{ProxmoxTheme.SECTIONS['success']} {operation.get('message', 'Operation completed successfully')}",
-                "",
-                f"Task ID: {operation.get('task_id', 'N/A')}"
-            ]
-        else:
-            result = [
-                f"{ProxmoxTheme.SECTIONS['error']} {operation.get('message', 'Operation failed')}",
-                "",
-                f"Error: {operation.get('error', 'Unknown error')}"
-            ]
-
-        return "\n".join(result)
+                disk_info.append(f"    - {disk_id}: {disk_value}")
+
+            if disk_info:
+                result.append("  • Disks:")
+                result.extend(disk_info)
+
+    return "\n".join(result)
+
+def template_details(template: Dict[str, Any]) -> str:
+    """Template for detailed VM template information.
+
+    Args:
+        template: Template data dictionary
+
+    Returns:
+        Formatted template details string
+    """
+    if not template:
+        return f"{_TEMPLATE_ICON} Template details not found"
+
+    template_name = template.get('name', f"vm-{template.get('vmid', 'Unknown')}")
+
+    buf = io.StringIO()
+    write = buf.write
+    write(f"{_TEMPLATE_ICON} Template: {template_name} (ID: {template.get('vmid', 'Unknown')})")
+    write(f"\n  • Node: {template.get('node', 'N/A')}")
+    write(f"\n  • Description: {template.get('description', 'No description')}")
+    write(f"\n  • CPU Cores: {template.get('cores', 'N/A')}")
+    write(f"\n  • Memory: {template.get('memory', 'N/A')} MB")
+    write(f"\n  • OS Type: {template.get('os_type', 'N/A')}")
+
+    # Add disk information
+    disks = template.get('disks', _EMPTY)
+    if disks:
+        write(f"\n\n{_SECTION_STORAGE} Disks")
+        for disk_id, disk_value in disks.items():
+            write(f"\n  • {disk_id}: {disk_value}")
+
+    # Add network information
+    networks = template.get('networks', _EMPTY)
+    if networks:
+        write(f"\n\n{_SECTION_NET} Network Interfaces")
+        for net_id, net_value in networks.items():
+            write(f"\n  • {net_id}: {net_value}")
+
+    return buf.getvalue()
+
+def template_operation(operation: Dict[str, Any]) -> str:
+    """Template for template operation output.
+
+    Args:
+        operation: Template operation result data
+
+    Returns:
+        Formatted template operation string
+    """
+    return format_operation('template_op', operation)
+
+def template_clone(clone_result: Dict[str, Any]) -> str:
+    """Template for template clone operation output.
+
+    Args:
+        clone_result: Template clone operation result data
+
+    Returns:
+        Formatted template clone operation string
+    """
+    return format_operation('template_clone', clone_result)
+
+def container_operation(operation: Dict[str, Any]) -> str:
+    """Template for container operation output.
+
+    Args:
+        operation: Container operation result data
+
+    Returns:
+        Formatted container operation string
+    """
+    return format_operation('container_op', operation)
+
+def container_command(command_result: Dict[str, Any]) -> str:
+    """Template for container command execution output.
+
+    Args:
+        command_result: Command execution result data
+
+    Returns:
+        Formatted command execution string
+    """
+    success = command_result.get('success', False)
+    exit_code = command_result.get('exit_code', 1)
+    output = command_result.get('output', '')
+
+    if success:
+        return "\n".join((
+            f"{_SECTION_SUCCESS} Command executed successfully (exit code: {exit_code})",
+            "",
+            "Output:",
+            f"{output}"
+        ))
+    else:
+        return "\n".join((
+            f"{_SECTION_ERROR} Command execution failed (exit code: {exit_code})",
+            "",
+            "Output:",
+            f"{output}"
+        ))
 
-    @staticmethod
-    def container_command(command_result: Dict[str, Any]) -> str:
-        """Template for container command execution output.
-
-        Args:
-            command_result: Command execution result data
-
-        Returns:
-            Formatted command execution string
-        """
-        success = command_result.get('success', False)
-        exit_code = command_result.get('exit_code', 1)
-        output = command_result.get('output', '')
-
-        if success:
-            result = [
-                f"{ProxmoxTheme.SECTIONS['success']} Command executed successfully (exit code: {exit_code})",
-                "",
-                "Output:",
-                f"{output}"
-            ]
-        else:
-            result = [
-                f"{ProxmoxTheme.SECTIONS['error']} Command execution failed (exit code: {exit_code})",
-                "",
-                "Output:",
-                f"{output}"
-            ]
+def container_clone(clone_result: Dict[str, Any]) -> str:
+    """Template for container clone operation output.
 
-        return "\n".join(result)
+    Args:
+        clone_result: Container clone operation result data
 
-    @staticmethod
-    def container_clone(clone_result: Dict[str, Any]) -> str:
-        """Template for container clone operation output.
-
-        Args:
-            clone_result: Container clone operation result data
-
-        Returns:
-            Formatted container clone operation string
-        """
-        if clone_result.get('success', False):
-            result = [
-                f"{ProxmoxTheme.SECTIONS['success']} {clone_result.get('message', 'Container cloned successfully')}",
-                "",
-                f"Task ID: {clone_result.get('task_id', 'N/A')}"
-            ]
-        else:
-            result = [
-                f"{ProxmoxTheme.SECTIONS['error']} {clone_result.get('message', 'Container clone failed')}",
-                "",
-                f"Error: {clone_result.get('error', 'Unknown error')}"
-            ]
+    Returns:
+        Formatted container clone operation string
+    """
+    return format_operation('container_clone', clone_result)
 
-        return "\n".join(result)
+def cluster_status(status: Dict[str, Any]) -> str:
+    """Template for cluster status output.
 
-    @staticmethod
-    def cluster_status(status: Dict[str, Any]) -> str:
-        """Template for cluster status output.
+    Args:
+        status: Cluster status data
 
-        Args:
-            status: Cluster status data
+    Returns:
+        Formatted cluster status string
+    """
+    result = "\n".join((
+        _HEADER_CLUSTER,
+        "",
+        f"  • Name: {status.get('name', 'N/A')}",
+        f"  • Quorum: {'OK' if status.get('quorum') else 'NOT OK'}",
+        f"  • Nodes: {status.get('nodes', 0)}",
+    ))
 
-        Returns:
-            Formatted cluster status string
-        """
-        result = [f"{ProxmoxTheme.SECTIONS['configuration']} Proxmox Cluster"]
+    # Add resource count if available
+    resources = status.get('resources', [])
+    if resources:
+        result += f"\n  • Resources: {len(resources)}"
 
-        # Basic cluster info
-        result.extend([
-            "",
-            f"  • Name: {status.get('name', 'N/A')}",
-            f"  • Quorum: {'OK' if status.get('quorum') else 'NOT OK'}",
-            f"  • Nodes: {status.get('nodes', 0)}",
-        ])
+    return result
 
-        # Add resource count if available
-        resources = status.get('resources', [])
-        if resources:
-            result.append(f"  • Resources: {len(resources)}")
 
-        return "\n".join(result)
+class ProxmoxTemplates:
+    """Output templates for different Proxmox resource types.
+
+    Namespace kept for backward compatibility; each attribute is the
+    module-level template function of the same name.
+    """
+
+    __slots__ = ()
+
+    node_list = staticmethod(node_list)
+    node_status = staticmethod(node_status)
+    vm_list = staticmethod(vm_list)
+    storage_list = staticmethod(storage_list)
+    container_list = staticmethod(container_list)
+    container_status = staticmethod(container_status)
+    container_config = staticmethod(container_config)
+    container_performance = staticmethod(container_performance)
+    container_templates = staticmethod(container_templates)
+    vm_templates = staticmethod(vm_templates)
+    template_details = staticmethod(template_details)
+    format_operation = staticmethod(format_operation)
+    template_operation = staticmethod(template_operation)
+    template_clone = staticmethod(template_clone)
+    container_operation = staticmethod(container_operation)
+    container_command = staticmethod(container_command)
+    container_clone = staticmethod(container_clone)
+    cluster_status = staticmethod(cluster_status)
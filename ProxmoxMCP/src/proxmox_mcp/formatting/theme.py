@@ -66,6 +66,11 @@ class ProxmoxTheme:
         'tasks': '📋',
         'users': '👥',
         'permissions': '🔑',
+        'network': '🌐',
+        'storage': '💾',
+        'performance': '📊',
+        'success': '✅',
+        'error': '❌',
     }
     
     # Measurement and metric indicators
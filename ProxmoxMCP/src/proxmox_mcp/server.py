@@ -14,101 +14,431 @@ The server exposes a set of tools for managing Proxmox resources including:
 - Storage management
 - Cluster status monitoring
 """
+import asyncio
+import importlib
+import inspect
+import json
 import logging
 import os
 import sys
 import signal
-from typing import Optional, List, Annotated, Dict, Any
-
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from functools import partial
+from typing import Optional, List, Annotated, Dict, Any, Callable, Set, Tuple
+
+import anyio
+import anyio.to_thread
 from mcp.server.fastmcp import FastMCP
 from mcp.server.fastmcp.tools import Tool
 from mcp.types import TextContent as Content
 from pydantic import Field
 
-from .config.loader import load_config
+from .config.loader import load_config_cached
+from .config.models import Config
 from .core.logging import setup_logging
-from .core.proxmox import ProxmoxManager
-from .tools.node import NodeTools
-from .tools.vm import VMTools
-from .tools.vm_lifecycle import VMLifecycleTools
-from .tools.storage import StorageTools
-from .tools.cluster import ClusterTools
-from .tools.task import TaskTools
-from .tools.backup import BackupTools
-from .tools.container import ContainerTools
-from .tools.template import TemplateTools
-from .tools.definitions import (
-    GET_NODES_DESC,
-    GET_NODE_STATUS_DESC,
-    GET_VMS_DESC,
-    EXECUTE_VM_COMMAND_DESC,
-    GET_CONTAINERS_DESC,
-    GET_CONTAINER_STATUS_DESC,
-    CREATE_CONTAINER_DESC,
-    START_CONTAINER_DESC,
-    STOP_CONTAINER_DESC,
-    RESTART_CONTAINER_DESC,
-    DELETE_CONTAINER_DESC,
-    CLONE_CONTAINER_DESC,
-    GET_CONTAINER_CONFIG_DESC,
-    UPDATE_CONTAINER_CONFIG_DESC,
-    EXECUTE_CONTAINER_COMMAND_DESC,
-    GET_CONTAINER_PERFORMANCE_DESC,
-    GET_CONTAINER_TEMPLATES_DESC,
-    GET_STORAGE_DESC,
-    GET_CLUSTER_STATUS_DESC,
-    START_VM_DESC,
-    STOP_VM_DESC,
-    REBOOT_VM_DESC,
-    CREATE_VM_SNAPSHOT_DESC,
-    LIST_VM_SNAPSHOTS_DESC,
-    RESTORE_VM_SNAPSHOT_DESC,
-    CLONE_VM_DESC,
-    GET_VM_PERFORMANCE_DESC,
-    GET_TASKS_DESC,
-    GET_TASK_STATUS_DESC,
-    CANCEL_TASK_DESC,
-    CREATE_BACKUP_DESC,
-    LIST_BACKUPS_DESC,
-    RESTORE_BACKUP_DESC,
-    GET_BACKUP_CONFIG_DESC,
-    UPDATE_BACKUP_SCHEDULE_DESC,
-    # Template tool descriptions
-    GET_TEMPLATES_DESC,
-    CREATE_TEMPLATE_DESC,
-    CLONE_TEMPLATE_DESC,
-    UPDATE_TEMPLATE_DESC,
-    DELETE_TEMPLATE_DESC,
-    IMPORT_TEMPLATE_DESC,
-    GET_TEMPLATE_DETAILS_DESC
+from .core.proxmox import ProxmoxManager, MAX_INFLIGHT
+from .core.cache import TTLCache
+from .tools.definitions import DESCRIPTIONS as D
+
+# Connected API managers shared across server instances in this process,
+# keyed by every setting that affects the connection, so re-creating a
+# server against the same host skips the connect/auth round trip
+_MANAGER_CACHE: Dict[Tuple[Any, ...], ProxmoxManager] = {}
+_MANAGER_LOCK = threading.Lock()
+
+# Shutdown request flag set by the fallback signal handler
+_SHUTDOWN = threading.Event()
+
+# Seconds the server gets to unwind after a shutdown signal. mcp reads
+# stdin in a worker thread that cancellation cannot interrupt, so while
+# the client keeps stdin open the process is ended after this grace period
+SHUTDOWN_GRACE = 5.0
+
+def _exit_after_grace(logger: logging.Logger) -> None:
+    """End the process if it is still running SHUTDOWN_GRACE seconds from now.
+
+    Args:
+        logger: Logger for the forced-exit message
+    """
+    def force_exit() -> None:
+        logger.warning(f"Server did not stop within {SHUTDOWN_GRACE}s; exiting")
+        logging.shutdown()
+        os._exit(0)
+
+    timer = threading.Timer(SHUTDOWN_GRACE, force_exit)
+    timer.daemon = True
+    timer.start()
+
+def _get_proxmox_manager(config: Config) -> ProxmoxManager:
+    """Get a connected ProxmoxManager for the given configuration.
+
+    Args:
+        config: Validated server configuration
+
+    Returns:
+        Cached or newly connected ProxmoxManager
+    """
+    proxmox, auth = config.proxmox, config.auth
+    key = (
+        proxmox.host, proxmox.port, proxmox.verify_ssl, proxmox.service,
+        auth.user, auth.token_name, auth.token_value,
+    )
+    with _MANAGER_LOCK:
+        manager = _MANAGER_CACHE.get(key)
+        if manager is None:
+            manager = _MANAGER_CACHE[key] = ProxmoxManager(proxmox, auth)
+    return manager
+
+# Low-churn inventory tools whose results are reused for a short time.
+# Any tool that is not a get_*/list_* read clears the cache once it runs.
+_CACHED_TOOLS = frozenset({
+    "get_nodes", "get_storage", "get_cluster_status",
+    "get_container_templates", "get_templates",
+})
+TOOL_CACHE_TTL = 15.0
+
+# Blocking Proxmox calls that may run at once; matches the HTTP pool size so
+# every worker thread can hold a pooled connection
+WORKER_THREADS = MAX_INFLIGHT
+
+def _param(name: str, annotation: Any, default: Any = inspect.Parameter.empty) -> inspect.Parameter:
+    """Describe one tool parameter for the tool table.
+
+    Args:
+        name: Parameter name exposed to MCP clients
+        annotation: Type, usually Annotated with a pydantic Field description
+        default: Default value; omit for required parameters
+
+    Returns:
+        Keyword-capable inspect.Parameter
+    """
+    return inspect.Parameter(name, inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                             annotation=annotation, default=default)
+
+# Parameter annotations shared by many tools, built once
+_NODE_ARG = Annotated[str, Field(description="Host node name (e.g. 'pve1', 'proxmox-node2')")]
+_SOURCE_NODE_ARG = Annotated[str, Field(description="Source host node name (e.g. 'pve1', 'proxmox-node2')")]
+_TARGET_NODE_ARG = Annotated[Optional[str], Field(description="Optional target node (defaults to source node)")]
+_VMID_ARG = Annotated[str, Field(description="VM ID number (e.g. '100', '101')")]
+_CTID_ARG = Annotated[str, Field(description="Container ID number (e.g. '200', '201')")]
+_TEMPLATE_VMID_ARG = Annotated[str, Field(description="Template VM ID number (e.g. '100')")]
+_TEMPLATE_NAME_ARG = Annotated[Optional[str], Field(description="Optional new name for the template")]
+
+# Declarative tool table:
+# (tool name, description, tool group attribute, group method name, parameters)
+_TOOLS = (
+    # Node tools
+    ("get_nodes", D["GET_NODES"], "node_tools", "get_nodes", ()),
+    ("get_node_status", D["GET_NODE_STATUS"], "node_tools", "get_node_status", (
+        _param("node", Annotated[str, Field(description="Name/ID of node to query (e.g. 'pve1', 'proxmox-node2')")]),
+    )),
+
+    # VM tools
+    ("get_vms", D["GET_VMS"], "vm_tools", "get_vms", ()),
+    ("execute_vm_command", D["EXECUTE_VM_COMMAND"], "vm_tools", "execute_command", (
+        _param("node", _NODE_ARG),
+        _param("vmid", _VMID_ARG),
+        _param("command", Annotated[str, Field(description="Shell command to run (e.g. 'uname -a', 'systemctl status nginx')")]),
+    )),
+
+    # Storage tools
+    ("get_storage", D["GET_STORAGE"], "storage_tools", "get_storage", ()),
+
+    # VM lifecycle tools
+    ("start_vm", D["START_VM"], "vm_lifecycle_tools", "start_vm", (
+        _param("node", _NODE_ARG),
+        _param("vmid", _VMID_ARG),
+    )),
+    ("stop_vm", D["STOP_VM"], "vm_lifecycle_tools", "stop_vm", (
+        _param("node", _NODE_ARG),
+        _param("vmid", _VMID_ARG),
+    )),
+    ("reboot_vm", D["REBOOT_VM"], "vm_lifecycle_tools", "reboot_vm", (
+        _param("node", _NODE_ARG),
+        _param("vmid", _VMID_ARG),
+    )),
+    ("create_vm_snapshot", D["CREATE_VM_SNAPSHOT"], "vm_lifecycle_tools", "create_vm_snapshot", (
+        _param("node", _NODE_ARG),
+        _param("vmid", _VMID_ARG),
+        _param("name", Annotated[str, Field(description="Snapshot name (e.g. 'pre-update')")]),
+        _param("description", Annotated[Optional[str], Field(description="Optional snapshot description")], None),
+    )),
+    ("list_vm_snapshots", D["LIST_VM_SNAPSHOTS"], "vm_lifecycle_tools", "list_vm_snapshots", (
+        _param("node", _NODE_ARG),
+        _param("vmid", _VMID_ARG),
+    )),
+    ("restore_vm_snapshot", D["RESTORE_VM_SNAPSHOT"], "vm_lifecycle_tools", "restore_vm_snapshot", (
+        _param("node", _NODE_ARG),
+        _param("vmid", _VMID_ARG),
+        _param("snapshot_name", Annotated[str, Field(description="Name of the snapshot to restore")]),
+    )),
+    ("clone_vm", D["CLONE_VM"], "vm_lifecycle_tools", "clone_vm", (
+        _param("node", _SOURCE_NODE_ARG),
+        _param("vmid", Annotated[str, Field(description="Source VM ID number (e.g. '100', '101')")]),
+        _param("target_vmid", Annotated[str, Field(description="Target VM ID number for the clone")]),
+        _param("target_node", _TARGET_NODE_ARG, None),
+        _param("name", Annotated[Optional[str], Field(description="Optional name for the cloned VM")], None),
+    )),
+    ("get_vm_performance", D["GET_VM_PERFORMANCE"], "vm_lifecycle_tools", "get_vm_performance", (
+        _param("node", _NODE_ARG),
+        _param("vmid", _VMID_ARG),
+        _param("include_history", Annotated[bool, Field(description="Whether to include the last hour of historical metrics")], False),
+    )),
+
+    # Task management tools
+    ("get_tasks", D["GET_TASKS"], "task_tools", "get_tasks", (
+        _param("limit", Annotated[int, Field(description="Maximum number of tasks to return")], 50),
+        _param("vmid", Annotated[Optional[str], Field(description="Optional VM ID to filter tasks")], None),
+        _param("node", Annotated[Optional[str], Field(description="Optional node name to filter tasks")], None),
+    )),
+    ("get_task_status", D["GET_TASK_STATUS"], "task_tools", "get_task_status", (
+        _param("upid", Annotated[str, Field(description="Task UPID (Unique Process ID) to query")]),
+    )),
+    ("cancel_task", D["CANCEL_TASK"], "task_tools", "cancel_task", (
+        _param("upid", Annotated[str, Field(description="Task UPID (Unique Process ID) to cancel")]),
+    )),
+    ("await_task", D["AWAIT_TASK"], "task_tools", "await_task", (
+        _param("upid", Annotated[str, Field(description="Task UPID (Unique Process ID) to wait for")]),
+        _param("timeout", Annotated[int, Field(description="Maximum seconds to wait")], 300),
+    )),
+
+    # Backup management tools
+    ("create_backup", D["CREATE_BACKUP"], "backup_tools", "create_backup", (
+        _param("node", _NODE_ARG),
+        _param("vmid", _VMID_ARG),
+        _param("storage", Annotated[Optional[str], Field(description="Optional storage ID where to store the backup")], None),
+        _param("compress", Annotated[Optional[str], Field(description="Optional compression algorithm (zstd, lzo, gzip)")], None),
+        _param("mode", Annotated[str, Field(description="Backup mode (snapshot, suspend, stop)")], 'snapshot'),
+    )),
+    ("list_backups", D["LIST_BACKUPS"], "backup_tools", "list_backups", (
+        _param("storage", Annotated[Optional[str], Field(description="Optional storage ID to filter backups")], None),
+        _param("vmid", Annotated[Optional[str], Field(description="Optional VM ID to filter backups")], None),
+        _param("limit", Annotated[Optional[int], Field(description="Optional maximum number of backups to return (max 1000)")], None),
+    )),
+    ("restore_backup", D["RESTORE_BACKUP"], "backup_tools", "restore_backup", (
+        _param("node", _NODE_ARG),
+        _param("vmid", Annotated[str, Field(description="Original VM ID number")]),
+        _param("backup_id", Annotated[str, Field(description="Backup volume ID to restore from")]),
+        _param("target_storage", Annotated[Optional[str], Field(description="Optional storage ID for restored VM")], None),
+        _param("target_vmid", Annotated[Optional[str], Field(description="Optional new VM ID for the restored VM")], None),
+    )),
+    ("get_backup_config", D["GET_BACKUP_CONFIG"], "backup_tools", "get_backup_config", (
+        _param("node", _NODE_ARG),
+    )),
+    ("update_backup_schedule", D["UPDATE_BACKUP_SCHEDULE"], "backup_tools", "update_backup_schedule", (
+        _param("node", _NODE_ARG),
+        _param("schedule", Annotated[Dict[str, Any], Field(description="Dictionary containing schedule configuration")]),
+    )),
+
+    # Container tools
+    ("get_containers", D["GET_CONTAINERS"], "container_tools", "get_containers", ()),
+    ("get_container_status", D["GET_CONTAINER_STATUS"], "container_tools", "get_container_status", (
+        _param("node", _NODE_ARG),
+        _param("vmid", _CTID_ARG),
+    )),
+    ("create_container", D["CREATE_CONTAINER"], "container_tools", "create_container", (
+        _param("node", _NODE_ARG),
+        _param("vmid", _CTID_ARG),
+        _param("template", Annotated[str, Field(description="Template to use (e.g. 'local:vztmpl/ubuntu-20.04-standard_20.04-1_amd64.tar.gz')")]),
+        _param("storage", Annotated[str, Field(description="Storage to use for container")]),
+        _param("hostname", Annotated[Optional[str], Field(description="Optional hostname for the container")], None),
+        _param("memory", Annotated[int, Field(description="Memory in MB")], 512),
+        _param("cores", Annotated[int, Field(description="Number of CPU cores")], 1),
+        _param("password", Annotated[Optional[str], Field(description="Optional root password")], None),
+        _param("net0", Annotated[Optional[str], Field(description="Optional network configuration")], None),
+    )),
+    ("start_container", D["START_CONTAINER"], "container_tools", "start_container", (
+        _param("node", _NODE_ARG),
+        _param("vmid", _CTID_ARG),
+    )),
+    ("stop_container", D["STOP_CONTAINER"], "container_tools", "stop_container", (
+        _param("node", _NODE_ARG),
+        _param("vmid", _CTID_ARG),
+    )),
+    ("restart_container", D["RESTART_CONTAINER"], "container_tools", "restart_container", (
+        _param("node", _NODE_ARG),
+        _param("vmid", _CTID_ARG),
+    )),
+    ("delete_container", D["DELETE_CONTAINER"], "container_tools", "delete_container", (
+        _param("node", _NODE_ARG),
+        _param("vmid", _CTID_ARG),
+    )),
+    ("clone_container", D["CLONE_CONTAINER"], "container_tools", "clone_container", (
+        _param("node", _SOURCE_NODE_ARG),
+        _param("vmid", Annotated[str, Field(description="Source container ID number (e.g. '200', '201')")]),
+        _param("target_vmid", Annotated[str, Field(description="Target container ID number for the clone")]),
+        _param("target_node", _TARGET_NODE_ARG, None),
+        _param("name", Annotated[Optional[str], Field(description="Optional name for the cloned container")], None),
+    )),
+    ("get_container_config", D["GET_CONTAINER_CONFIG"], "container_tools", "get_container_config", (
+        _param("node", _NODE_ARG),
+        _param("vmid", _CTID_ARG),
+    )),
+    ("update_container_config", D["UPDATE_CONTAINER_CONFIG"], "container_tools", "update_container_config", (
+        _param("node", _NODE_ARG),
+        _param("vmid", _CTID_ARG),
+        inspect.Parameter("kwargs", inspect.Parameter.VAR_KEYWORD),
+    )),
+    ("execute_container_command", D["EXECUTE_CONTAINER_COMMAND"], "container_tools", "execute_command", (
+        _param("node", _NODE_ARG),
+        _param("vmid", _CTID_ARG),
+        _param("command", Annotated[str, Field(description="Shell command to run (e.g. 'uname -a')")]),
+    )),
+    ("execute_container_commands", D["EXECUTE_CONTAINER_COMMANDS"], "container_tools", "execute_commands", (
+        _param("node", _NODE_ARG),
+        _param("vmid", _CTID_ARG),
+        _param("commands", Annotated[List[str], Field(description="Shell commands to run (e.g. ['uname -a', 'uptime'])")]),
+        _param("concurrency", Annotated[int, Field(description="Maximum number of commands running at once (default: 5)")], 5),
+    )),
+    ("get_container_performance", D["GET_CONTAINER_PERFORMANCE"], "container_tools", "get_container_performance", (
+        _param("node", _NODE_ARG),
+        _param("vmid", _CTID_ARG),
+    )),
+    ("get_container_templates", D["GET_CONTAINER_TEMPLATES"], "container_tools", "get_container_templates", (
+        _param("node", _NODE_ARG),
+        _param("storage", Annotated[Optional[str], Field(description="Optional storage ID to filter templates")], None),
+    )),
+
+    # Template tools
+    ("get_templates", D["GET_TEMPLATES"], "template_tools", "get_templates", ()),
+    ("create_template", D["CREATE_TEMPLATE"], "template_tools", "create_template", (
+        _param("node", _NODE_ARG),
+        _param("vmid", Annotated[str, Field(description="VM ID number to convert to template (e.g. '100')")]),
+        _param("name", _TEMPLATE_NAME_ARG, None),
+        _param("description", Annotated[Optional[str], Field(description="Optional description for the template")], None),
+    )),
+    ("clone_template", D["CLONE_TEMPLATE"], "template_tools", "clone_template", (
+        _param("node", _SOURCE_NODE_ARG),
+        _param("template_vmid", _TEMPLATE_VMID_ARG),
+        _param("name", Annotated[str, Field(description="Name for the new VM")]),
+        _param("target_node", _TARGET_NODE_ARG, None),
+        _param("target_vmid", Annotated[Optional[str], Field(description="Optional specific VM ID for the clone")], None),
+        _param("target_storage", Annotated[Optional[str], Field(description="Optional target storage for the clone")], None),
+        _param("full_clone", Annotated[bool, Field(description="Whether to create a full clone (true) or linked clone (false)")], True),
+        _param("description", Annotated[Optional[str], Field(description="Optional description for the new VM")], None),
+    )),
+    ("update_template", D["UPDATE_TEMPLATE"], "template_tools", "update_template", (
+        _param("node", _NODE_ARG),
+        _param("vmid", _TEMPLATE_VMID_ARG),
+        _param("name", _TEMPLATE_NAME_ARG, None),
+        _param("description", Annotated[Optional[str], Field(description="Optional new description for the template")], None),
+        _param("cores", Annotated[Optional[int], Field(description="Optional number of CPU cores")], None),
+        _param("memory", Annotated[Optional[int], Field(description="Optional memory in MB")], None),
+    )),
+    ("delete_template", D["DELETE_TEMPLATE"], "template_tools", "delete_template", (
+        _param("node", _NODE_ARG),
+        _param("vmid", _TEMPLATE_VMID_ARG),
+    )),
+    ("import_template", D["IMPORT_TEMPLATE"], "template_tools", "import_template", (
+        _param("node", _NODE_ARG),
+        _param("storage", Annotated[str, Field(description="Storage to use for the template")]),
+        _param("url", Annotated[str, Field(description="URL to download the template from")]),
+        _param("format", Annotated[Optional[str], Field(description="Optional format (e.g. 'qcow2', 'vmdk', 'raw')")], None),
+    )),
+    ("get_template_details", D["GET_TEMPLATE_DETAILS"], "template_tools", "get_template_details", (
+        _param("node", _NODE_ARG),
+        _param("vmid", _TEMPLATE_VMID_ARG),
+    )),
+
+    # Cluster tools
+    ("get_cluster_status", D["GET_CLUSTER_STATUS"], "cluster_tools", "get_cluster_status", ()),
 )
 
+def _tool_specs(table: Tuple[tuple, ...]) -> Dict[str, tuple]:
+    """Index the tool table by tool name, validating it.
+
+    Args:
+        table: Tool table rows (name, description, group, method name, params)
+
+    Returns:
+        Dictionary mapping tool name to (description, group, method name, params)
+
+    Raises:
+        ValueError: If a tool name is duplicated or a row has no description
+    """
+    specs: Dict[str, tuple] = {}
+    for name, description, group, method_name, params in table:
+        if name in specs:
+            raise ValueError(f"Duplicate tool name in tool table: {name}")
+        if not description:
+            raise ValueError(f"Missing description for tool: {name}")
+        specs[name] = (description, group, method_name, params)
+    return specs
+
+class _ToolGroup:
+    """Descriptor that creates a tool group on first access.
+
+    A short-lived process usually calls only one or two tools, so each
+    group's module is imported and the group constructed when first used,
+    then kept in the server's _tool_groups dict. Unlike cached_property
+    this works with __slots__.
+    """
+
+    def __init__(self, module: str, class_name: str):
+        """Initialize the descriptor.
+
+        Args:
+            module: Module defining the group, relative to this package
+            class_name: Tool group class name
+        """
+        self.module = module
+        self.class_name = class_name
+        self.name = class_name
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: Optional["ProxmoxMCPServer"], owner: Optional[type] = None) -> Any:
+        if instance is None:
+            return self
+        groups = instance._tool_groups
+        tools = groups.get(self.name)
+        if tools is None:
+            cls = getattr(importlib.import_module(self.module, __package__), self.class_name)
+            tools = groups[self.name] = cls(instance.proxmox)
+        return tools
+
 class ProxmoxMCPServer:
     """Main server class for Proxmox MCP."""
 
+    __slots__ = (
+        "config", "logger", "proxmox_manager", "proxmox", "mcp",
+        "_tool_cache", "_tool_groups",
+    )
+
+    # Read-only snapshot of the tool table keyed by tool name:
+    # name -> (description, tool group attribute, group method name, parameters)
+    TOOL_SPECS = MappingProxyType(_tool_specs(_TOOLS))
+
+    # Tool groups, created lazily on first use
+    node_tools = _ToolGroup(".tools.node", "NodeTools")
+    vm_tools = _ToolGroup(".tools.vm", "VMTools")
+    vm_lifecycle_tools = _ToolGroup(".tools.vm_lifecycle", "VMLifecycleTools")
+    storage_tools = _ToolGroup(".tools.storage", "StorageTools")
+    cluster_tools = _ToolGroup(".tools.cluster", "ClusterTools")
+    task_tools = _ToolGroup(".tools.task", "TaskTools")
+    backup_tools = _ToolGroup(".tools.backup", "BackupTools")
+    container_tools = _ToolGroup(".tools.container", "ContainerTools")
+    template_tools = _ToolGroup(".tools.template", "TemplateTools")
+
     def __init__(self, config_path: Optional[str] = None):
         """Initialize the server.
 
         Args:
             config_path: Path to configuration file
         """
-        self.config = load_config(config_path)
+        self.config = load_config_cached(config_path)
         self.logger = setup_logging(self.config.logging)
 
         # Initialize core components
-        self.proxmox_manager = ProxmoxManager(self.config.proxmox, self.config.auth)
+        self.proxmox_manager = _get_proxmox_manager(self.config)
         self.proxmox = self.proxmox_manager.get_api()
 
-        # Initialize tools
-        self.node_tools = NodeTools(self.proxmox)
-        self.vm_tools = VMTools(self.proxmox)
-        self.vm_lifecycle_tools = VMLifecycleTools(self.proxmox)
-        self.storage_tools = StorageTools(self.proxmox)
-        self.cluster_tools = ClusterTools(self.proxmox)
-        self.task_tools = TaskTools(self.proxmox)
-        self.backup_tools = BackupTools(self.proxmox)
-        self.container_tools = ContainerTools(self.proxmox)
-        self.template_tools = TemplateTools(self.proxmox)
+        # Tool groups are created lazily on first use (see _ToolGroup)
+        self._tool_groups: Dict[str, Any] = {}
+        self._tool_cache = TTLCache(TOOL_CACHE_TTL)
 
         # Initialize MCP server
         self.mcp = FastMCP("ProxmoxMCP")
@@ -117,336 +447,85 @@ class ProxmoxMCPServer:
     def _setup_tools(self) -> None:
         """Register MCP tools with the server.
 
-        Initializes and registers all available tools with the MCP server:
-        - Node management tools (list nodes, get status)
-        - VM operation tools (list VMs, execute commands)
-        - Storage management tools (list storage)
-        - Cluster tools (get cluster status)
+        Registers every entry of TOOL_SPECS with the MCP server:
+        - Node, VM, VM lifecycle and storage tools
+        - Container and template tools
+        - Task, backup and cluster tools
+        - get_cache_stats for the inventory result cache
 
-        Each tool is registered with appropriate descriptions and parameter
-        validation using Pydantic models.
+        Each tool is registered with its description and parameter
+        validation using Pydantic models. FastMCP builds each argument model
+        and its JSON schema during registration, so that cost is paid once
+        here rather than on the first call or tools listing.
         """
+        for name, (description, group, method_name, params) in self.TOOL_SPECS.items():
+            self.mcp.add_tool(
+                self._bind_tool(name, group, method_name, params),
+                name=name,
+                description=description,
+            )
+
+        @self.mcp.tool(description=D["GET_CACHE_STATS"])
+        def get_cache_stats():
+            stats = self._tool_cache.stats()
+            stats["cached_tools"] = sorted(_CACHED_TOOLS)
+            return [Content(type="text", text=json.dumps(stats, indent=2))]
+
+    def _bind_tool(self, name: str, group: str, method_name: str,
+                   params: Tuple[inspect.Parameter, ...]) -> Callable[..., Any]:
+        """Create the MCP-facing callable for one tool table entry.
+
+        The callable carries the entry's parameters as its signature, so
+        FastMCP derives the same argument schema it would from a hand-written
+        function, and forwards the arguments positionally to the group method.
+        The method is looked up at call time, so the group's module is only
+        imported once one of its tools is used. Coroutine methods are
+        awaited; blocking methods run in a worker thread so the stdio event
+        loop keeps serving other requests during the Proxmox round trip.
+        Results of _CACHED_TOOLS are reused for TOOL_CACHE_TTL seconds, and
+        state-changing tools clear that cache.
+
+        Args:
+            name: Tool name
+            group: Attribute name of the tool group instance on the server
+            method_name: Name of the tool group method to call
+            params: Tool parameters in call order
 
-        # Node tools
-        @self.mcp.tool(description=GET_NODES_DESC)
-        def get_nodes():
-            return self.node_tools.get_nodes()
-
-        @self.mcp.tool(description=GET_NODE_STATUS_DESC)
-        def get_node_status(
-            node: Annotated[str, Field(description="Name/ID of node to query (e.g. 'pve1', 'proxmox-node2')")]
-        ):
-            return self.node_tools.get_node_status(node)
-
-        # VM tools
-        @self.mcp.tool(description=GET_VMS_DESC)
-        def get_vms():
-            return self.vm_tools.get_vms()
-
-        @self.mcp.tool(description=EXECUTE_VM_COMMAND_DESC)
-        async def execute_vm_command(
-            node: Annotated[str, Field(description="Host node name (e.g. 'pve1', 'proxmox-node2')")],
-            vmid: Annotated[str, Field(description="VM ID number (e.g. '100', '101')")],
-            command: Annotated[str, Field(description="Shell command to run (e.g. 'uname -a', 'systemctl status nginx')")]
-        ):
-            return await self.vm_tools.execute_command(node, vmid, command)
-
-        # Storage tools
-        @self.mcp.tool(description=GET_STORAGE_DESC)
-        def get_storage():
-            return self.storage_tools.get_storage()
-
-        # VM lifecycle tools
-        @self.mcp.tool(description=START_VM_DESC)
-        def start_vm(
-            node: Annotated[str, Field(description="Host node name (e.g. 'pve1', 'proxmox-node2')")],
-            vmid: Annotated[str, Field(description="VM ID number (e.g. '100', '101')")]
-        ):
-            return self.vm_lifecycle_tools.start_vm(node, vmid)
-
-        @self.mcp.tool(description=STOP_VM_DESC)
-        def stop_vm(
-            node: Annotated[str, Field(description="Host node name (e.g. 'pve1', 'proxmox-node2')")],
-            vmid: Annotated[str, Field(description="VM ID number (e.g. '100', '101')")]
-        ):
-            return self.vm_lifecycle_tools.stop_vm(node, vmid)
-
-        @self.mcp.tool(description=REBOOT_VM_DESC)
-        def reboot_vm(
-            node: Annotated[str, Field(description="Host node name (e.g. 'pve1', 'proxmox-node2')")],
-            vmid: Annotated[str, Field(description="VM ID number (e.g. '100', '101')")]
-        ):
-            return self.vm_lifecycle_tools.reboot_vm(node, vmid)
-
-        @self.mcp.tool(description=CREATE_VM_SNAPSHOT_DESC)
-        def create_vm_snapshot(
-            node: Annotated[str, Field(description="Host node name (e.g. 'pve1', 'proxmox-node2')")],
-            vmid: Annotated[str, Field(description="VM ID number (e.g. '100', '101')")],
-            name: Annotated[str, Field(description="Snapshot name (e.g. 'pre-update')")],
-            description: Annotated[Optional[str], Field(description="Optional snapshot description")] = None
-        ):
-            return self.vm_lifecycle_tools.create_vm_snapshot(node, vmid, name, description)
-
-        @self.mcp.tool(description=LIST_VM_SNAPSHOTS_DESC)
-        def list_vm_snapshots(
-            node: Annotated[str, Field(description="Host node name (e.g. 'pve1', 'proxmox-node2')")],
-            vmid: Annotated[str, Field(description="VM ID number (e.g. '100', '101')")]
-        ):
-            return self.vm_lifecycle_tools.list_vm_snapshots(node, vmid)
-
-        @self.mcp.tool(description=RESTORE_VM_SNAPSHOT_DESC)
-        def restore_vm_snapshot(
-            node: Annotated[str, Field(description="Host node name (e.g. 'pve1', 'proxmox-node2')")],
-            vmid: Annotated[str, Field(description="VM ID number (e.g. '100', '101')")],
-            snapshot_name: Annotated[str, Field(description="Name of the snapshot to restore")]
-        ):
-            return self.vm_lifecycle_tools.restore_vm_snapshot(node, vmid, snapshot_name)
-
-        @self.mcp.tool(description=CLONE_VM_DESC)
-        def clone_vm(
-            node: Annotated[str, Field(description="Source host node name (e.g. 'pve1', 'proxmox-node2')")],
-            vmid: Annotated[str, Field(description="Source VM ID number (e.g. '100', '101')")],
-            target_vmid: Annotated[str, Field(description="Target VM ID number for the clone")],
-            target_node: Annotated[Optional[str], Field(description="Optional target node (defaults to source node)")] = None,
-            name: Annotated[Optional[str], Field(description="Optional name for the cloned VM")] = None
-        ):
-            return self.vm_lifecycle_tools.clone_vm(node, vmid, target_vmid, target_node, name)
-
-        @self.mcp.tool(description=GET_VM_PERFORMANCE_DESC)
-        def get_vm_performance(
-            node: Annotated[str, Field(description="Host node name (e.g. 'pve1', 'proxmox-node2')")],
-            vmid: Annotated[str, Field(description="VM ID number (e.g. '100', '101')")]
-        ):
-            return self.vm_lifecycle_tools.get_vm_performance(node, vmid)
-
-        # Task management tools
-        @self.mcp.tool(description=GET_TASKS_DESC)
-        def get_tasks(
-            limit: Annotated[int, Field(description="Maximum number of tasks to return")] = 50,
-            vmid: Annotated[Optional[str], Field(description="Optional VM ID to filter tasks")] = None,
-            node: Annotated[Optional[str], Field(description="Optional node name to filter tasks")] = None
-        ):
-            return self.task_tools.get_tasks(limit, vmid, node)
-
-        @self.mcp.tool(description=GET_TASK_STATUS_DESC)
-        def get_task_status(
-            upid: Annotated[str, Field(description="Task UPID (Unique Process ID) to query")]
-        ):
-            return self.task_tools.get_task_status(upid)
-
-        @self.mcp.tool(description=CANCEL_TASK_DESC)
-        def cancel_task(
-            upid: Annotated[str, Field(description="Task UPID (Unique Process ID) to cancel")]
-        ):
-            return self.task_tools.cancel_task(upid)
-
-        # Backup management tools
-        @self.mcp.tool(description=CREATE_BACKUP_DESC)
-        def create_backup(
-            node: Annotated[str, Field(description="Host node name (e.g. 'pve1', 'proxmox-node2')")],
-            vmid: Annotated[str, Field(description="VM ID number (e.g. '100', '101')")],
-            storage: Annotated[Optional[str], Field(description="Optional storage ID where to store the backup")] = None,
-            compress: Annotated[Optional[str], Field(description="Optional compression algorithm (zstd, lzo, gzip)")] = None,
-            mode: Annotated[str, Field(description="Backup mode (snapshot, suspend, stop)")] = "snapshot"
-        ):
-            return self.backup_tools.create_backup(node, vmid, storage, compress, mode)
-
-        @self.mcp.tool(description=LIST_BACKUPS_DESC)
-        def list_backups(
-            storage: Annotated[Optional[str], Field(description="Optional storage ID to filter backups")] = None,
-            vmid: Annotated[Optional[str], Field(description="Optional VM ID to filter backups")] = None
-        ):
-            return self.backup_tools.list_backups(storage, vmid)
-
-        @self.mcp.tool(description=RESTORE_BACKUP_DESC)
-        def restore_backup(
-            node: Annotated[str, Field(description="Host node name (e.g. 'pve1', 'proxmox-node2')")],
-            vmid: Annotated[str, Field(description="Original VM ID number")],
-            backup_id: Annotated[str, Field(description="Backup volume ID to restore from")],
-            target_storage: Annotated[Optional[str], Field(description="Optional storage ID for restored VM")] = None,
-            target_vmid: Annotated[Optional[str], Field(description="Optional new VM ID for the restored VM")] = None
-        ):
-            return self.backup_tools.restore_backup(node, vmid, backup_id, target_storage, target_vmid)
-
-        @self.mcp.tool(description=GET_BACKUP_CONFIG_DESC)
-        def get_backup_config(
-            node: Annotated[str, Field(description="Host node name (e.g. 'pve1', 'proxmox-node2')")]
-        ):
-            return self.backup_tools.get_backup_config(node)
-
-        @self.mcp.tool(description=UPDATE_BACKUP_SCHEDULE_DESC)
-        def update_backup_schedule(
-            node: Annotated[str, Field(description="Host node name (e.g. 'pve1', 'proxmox-node2')")],
-            schedule: Annotated[Dict[str, Any], Field(description="Dictionary containing schedule configuration")]
-        ):
-            return self.backup_tools.update_backup_schedule(node, schedule)
-
-        # Container tools
-        @self.mcp.tool(description=GET_CONTAINERS_DESC)
-        def get_containers():
-            return self.container_tools.get_containers()
-
-        @self.mcp.tool(description=GET_CONTAINER_STATUS_DESC)
-        def get_container_status(
-            node: Annotated[str, Field(description="Host node name (e.g. 'pve1', 'proxmox-node2')")],
-            vmid: Annotated[str, Field(description="Container ID number (e.g. '200', '201')")]
-        ):
-            return self.container_tools.get_container_status(node, vmid)
-
-        @self.mcp.tool(description=CREATE_CONTAINER_DESC)
-        def create_container(
-            node: Annotated[str, Field(description="Host node name (e.g. 'pve1', 'proxmox-node2')")],
-            vmid: Annotated[str, Field(description="Container ID number (e.g. '200', '201')")],
-            template: Annotated[str, Field(description="Template to use (e.g. 'local:vztmpl/ubuntu-20.04-standard_20.04-1_amd64.tar.gz')")],
-            storage: Annotated[str, Field(description="Storage to use for container")],
-            hostname: Annotated[Optional[str], Field(description="Optional hostname for the container")] = None,
-            memory: Annotated[int, Field(description="Memory in MB")] = 512,
-            cores: Annotated[int, Field(description="Number of CPU cores")] = 1,
-            password: Annotated[Optional[str], Field(description="Optional root password")] = None,
-            net0: Annotated[Optional[str], Field(description="Optional network configuration")] = None
-        ):
-            return self.container_tools.create_container(node, vmid, template, storage, hostname, memory, cores, password, net0)
-
-        @self.mcp.tool(description=START_CONTAINER_DESC)
-        def start_container(
-            node: Annotated[str, Field(description="Host node name (e.g. 'pve1', 'proxmox-node2')")],
-            vmid: Annotated[str, Field(description="Container ID number (e.g. '200', '201')")]
-        ):
-            return self.container_tools.start_container(node, vmid)
-
-        @self.mcp.tool(description=STOP_CONTAINER_DESC)
-        def stop_container(
-            node: Annotated[str, Field(description="Host node name (e.g. 'pve1', 'proxmox-node2')")],
-            vmid: Annotated[str, Field(description="Container ID number (e.g. '200', '201')")]
-        ):
-            return self.container_tools.stop_container(node, vmid)
-
-        @self.mcp.tool(description=RESTART_CONTAINER_DESC)
-        def restart_container(
-            node: Annotated[str, Field(description="Host node name (e.g. 'pve1', 'proxmox-node2')")],
-            vmid: Annotated[str, Field(description="Container ID number (e.g. '200', '201')")]
-        ):
-            return self.container_tools.restart_container(node, vmid)
-
-        @self.mcp.tool(description=DELETE_CONTAINER_DESC)
-        def delete_container(
-            node: Annotated[str, Field(description="Host node name (e.g. 'pve1', 'proxmox-node2')")],
-            vmid: Annotated[str, Field(description="Container ID number (e.g. '200', '201')")]
-        ):
-            return self.container_tools.delete_container(node, vmid)
-
-        @self.mcp.tool(description=CLONE_CONTAINER_DESC)
-        def clone_container(
-            node: Annotated[str, Field(description="Source host node name (e.g. 'pve1', 'proxmox-node2')")],
-            vmid: Annotated[str, Field(description="Source container ID number (e.g. '200', '201')")],
-            target_vmid: Annotated[str, Field(description="Target container ID number for the clone")],
-            target_node: Annotated[Optional[str], Field(description="Optional target node (defaults to source node)")] = None,
-            name: Annotated[Optional[str], Field(description="Optional name for the cloned container")] = None
-        ):
-            return self.container_tools.clone_container(node, vmid, target_vmid, target_node, name)
-
-        @self.mcp.tool(description=GET_CONTAINER_CONFIG_DESC)
-        def get_container_config(
-            node: Annotated[str, Field(description="Host node name (e.g. 'pve1', 'proxmox-node2')")],
-            vmid: Annotated[str, Field(description="Container ID number (e.g. '200', '201')")]
-        ):
-            return self.container_tools.get_container_config(node, vmid)
-
-        @self.mcp.tool(description=UPDATE_CONTAINER_CONFIG_DESC)
-        def update_container_config(
-            node: Annotated[str, Field(description="Host node name (e.g. 'pve1', 'proxmox-node2')")],
-            vmid: Annotated[str, Field(description="Container ID number (e.g. '200', '201')")],
-            **kwargs
-        ):
-            return self.container_tools.update_container_config(node, vmid, **kwargs)
-
-        @self.mcp.tool(description=EXECUTE_CONTAINER_COMMAND_DESC)
-        async def execute_container_command(
-            node: Annotated[str, Field(description="Host node name (e.g. 'pve1', 'proxmox-node2')")],
-            vmid: Annotated[str, Field(description="Container ID number (e.g. '200', '201')")],
-            command: Annotated[str, Field(description="Shell command to run (e.g. 'uname -a')")]
-        ):
-            return await self.container_tools.execute_command(node, vmid, command)
-
-        @self.mcp.tool(description=GET_CONTAINER_PERFORMANCE_DESC)
-        def get_container_performance(
-            node: Annotated[str, Field(description="Host node name (e.g. 'pve1', 'proxmox-node2')")],
-            vmid: Annotated[str, Field(description="Container ID number (e.g. '200', '201')")]
-        ):
-            return self.container_tools.get_container_performance(node, vmid)
-
-        @self.mcp.tool(description=GET_CONTAINER_TEMPLATES_DESC)
-        def get_container_templates(
-            node: Annotated[str, Field(description="Host node name (e.g. 'pve1', 'proxmox-node2')")],
-            storage: Annotated[Optional[str], Field(description="Optional storage ID to filter templates")] = None
-        ):
-            return self.container_tools.get_container_templates(node, storage)
-
-        # Template tools
-        @self.mcp.tool(description=GET_TEMPLATES_DESC)
-        def get_templates():
-            return self.template_tools.get_templates()
-
-        @self.mcp.tool(description=CREATE_TEMPLATE_DESC)
-        def create_template(
-            node: Annotated[str, Field(description="Host node name (e.g. 'pve1', 'proxmox-node2')")],
-            vmid: Annotated[str, Field(description="VM ID number to convert to template (e.g. '100')")],
-            name: Annotated[Optional[str], Field(description="Optional new name for the template")] = None,
-            description: Annotated[Optional[str], Field(description="Optional description for the template")] = None
-        ):
-            return self.template_tools.create_template(node, vmid, name, description)
-
-        @self.mcp.tool(description=CLONE_TEMPLATE_DESC)
-        def clone_template(
-            node: Annotated[str, Field(description="Source host node name (e.g. 'pve1', 'proxmox-node2')")],
-            template_vmid: Annotated[str, Field(description="Template VM ID number (e.g. '100')")],
-            name: Annotated[str, Field(description="Name for the new VM")],
-            target_node: Annotated[Optional[str], Field(description="Optional target node (defaults to source node)")] = None,
-            target_vmid: Annotated[Optional[str], Field(description="Optional specific VM ID for the clone")] = None,
-            target_storage: Annotated[Optional[str], Field(description="Optional target storage for the clone")] = None,
-            full_clone: Annotated[bool, Field(description="Whether to create a full clone (true) or linked clone (false)")] = True,
-            description: Annotated[Optional[str], Field(description="Optional description for the new VM")] = None
-        ):
-            return self.template_tools.clone_template(node, template_vmid, name, target_node, target_vmid, target_storage, full_clone, description)
-
-        @self.mcp.tool(description=UPDATE_TEMPLATE_DESC)
-        def update_template(
-            node: Annotated[str, Field(description="Host node name (e.g. 'pve1', 'proxmox-node2')")],
-            vmid: Annotated[str, Field(description="Template VM ID number (e.g. '100')")],
-            name: Annotated[Optional[str], Field(description="Optional new name for the template")] = None,
-            description: Annotated[Optional[str], Field(description="Optional new description for the template")] = None,
-            cores: Annotated[Optional[int], Field(description="Optional number of CPU cores")] = None,
-            memory: Annotated[Optional[int], Field(description="Optional memory in MB")] = None
-        ):
-            return self.template_tools.update_template(node, vmid, name, description, cores, memory)
-
-        @self.mcp.tool(description=DELETE_TEMPLATE_DESC)
-        def delete_template(
-            node: Annotated[str, Field(description="Host node name (e.g. 'pve1', 'proxmox-node2')")],
-            vmid: Annotated[str, Field(description="Template VM ID number (e.g. '100')")]
-        ):
-            return self.template_tools.delete_template(node, vmid)
-
-        @self.mcp.tool(description=IMPORT_TEMPLATE_DESC)
-        def import_template(
-            node: Annotated[str, Field(description="Host node name (e.g. 'pve1', 'proxmox-node2')")],
-            storage: Annotated[str, Field(description="Storage to use for the template")],
-            url: Annotated[str, Field(description="URL to download the template from")],
-            format: Annotated[Optional[str], Field(description="Optional format (e.g. 'qcow2', 'vmdk', 'raw')")] = None
-        ):
-            return self.template_tools.import_template(node, storage, url, format)
-
-        @self.mcp.tool(description=GET_TEMPLATE_DETAILS_DESC)
-        def get_template_details(
-            node: Annotated[str, Field(description="Host node name (e.g. 'pve1', 'proxmox-node2')")],
-            vmid: Annotated[str, Field(description="Template VM ID number (e.g. '100')")]
-        ):
-            return self.template_tools.get_template_details(node, vmid)
-
-        # Cluster tools
-        @self.mcp.tool(description=GET_CLUSTER_STATUS_DESC)
-        def get_cluster_status():
-            return self.cluster_tools.get_cluster_status()
+        Returns:
+            Async function suitable for FastMCP.add_tool
+        """
+        arg_names = tuple(p.name for p in params if p.kind is not inspect.Parameter.VAR_KEYWORD)
+
+        cached = name in _CACHED_TOOLS
+        invalidates = not name.startswith(("get_", "list_"))
+        cache = self._tool_cache
+
+        async def call(kwargs):
+            args = [kwargs.pop(arg) for arg in arg_names]
+            method = getattr(getattr(self, group), method_name)
+            if inspect.iscoroutinefunction(method):
+                return await method(*args, **kwargs)
+            # Only the API call is offloaded; the group was resolved above
+            return await anyio.to_thread.run_sync(partial(method, *args, **kwargs))
+
+        async def tool(**kwargs):
+            if cached:
+                key = (name, tuple(kwargs.items()))
+                result = cache.get(key)
+                if result is None:
+                    result = await call(kwargs)
+                    cache.set(key, result)
+                return result
+            if invalidates:
+                try:
+                    return await call(kwargs)
+                finally:
+                    cache.clear()
+            return await call(kwargs)
+
+        tool.__name__ = tool.__qualname__ = name
+        tool.__signature__ = inspect.Signature(params)
+        return tool
 
     def start(self) -> None:
         """Start the MCP server.
@@ -458,23 +537,91 @@ class ProxmoxMCPServer:
 
         The server runs until terminated by a signal or fatal error.
         """
-        import anyio
-
-        def signal_handler(signum, frame):
-            self.logger.info("Received signal to shutdown...")
-            sys.exit(0)
-
-        # Set up signal handlers
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
+        signals = {signal.SIGINT, signal.SIGTERM}
 
         try:
             self.logger.info("Starting MCP server...")
-            anyio.run(self.mcp.run_stdio_async)
+            if hasattr(signal, "pthread_sigmask"):
+                # Block the signals before any thread exists so every thread
+                # inherits the mask and only the sigwait thread receives them
+                signal.pthread_sigmask(signal.SIG_BLOCK, signals)
+                anyio.run(self._serve_until_signal, signals)
+            else:
+                def signal_handler(signum, frame):
+                    # Only flip the flag; the serving loop does the shutdown
+                    _SHUTDOWN.set()
+
+                # Set up signal handlers
+                signal.signal(signal.SIGINT, signal_handler)
+                signal.signal(signal.SIGTERM, signal_handler)
+                anyio.run(self._serve_until_shutdown)
         except Exception as e:
             self.logger.error(f"Server error: {e}")
             sys.exit(1)
 
+    def _configure_worker_threads(self) -> None:
+        """Size the thread pools that run blocking Proxmox calls.
+
+        Tool calls are offloaded with anyio (whose default limiter allows
+        40 threads) and asyncio.to_thread (the loop's default executor,
+        min(32, cpus + 4) threads). Both are set to WORKER_THREADS so the
+        concurrency matches the HTTP connection pool. Must be called from
+        within the running event loop.
+        """
+        anyio.to_thread.current_default_thread_limiter().total_tokens = WORKER_THREADS
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(max_workers=WORKER_THREADS, thread_name_prefix="pve-io")
+        )
+
+    async def _serve_until_signal(self, signals: Set[int]) -> None:
+        """Serve MCP over stdio until one of the given signals arrives.
+
+        The signals are received synchronously by a dedicated thread with
+        signal.sigwait, so no code runs in signal-handler context. On receipt
+        the thread cancels the serving scope on the event loop. The stdin
+        reader cannot be cancelled, so the process is ended after
+        SHUTDOWN_GRACE seconds if it has not exited by then.
+
+        Args:
+            signals: Signals that request shutdown (already blocked)
+        """
+        loop = asyncio.get_running_loop()
+        self._configure_worker_threads()
+
+        with anyio.CancelScope() as scope:
+            def wait_for_signal() -> None:
+                signal.sigwait(signals)
+                self.logger.info("Received signal to shutdown...")
+                _exit_after_grace(self.logger)
+                try:
+                    loop.call_soon_threadsafe(scope.cancel)
+                except RuntimeError:
+                    pass  # Event loop already closed
+
+            threading.Thread(target=wait_for_signal, name="signal-waiter", daemon=True).start()
+            await self.mcp.run_stdio_async()
+
+    async def _serve_until_shutdown(self) -> None:
+        """Serve MCP over stdio until the shutdown flag is set.
+
+        Used where signals cannot be received with sigwait. The signal
+        handler only sets _SHUTDOWN; a supervising task notices it and
+        cancels the server, instead of exiting from inside the handler,
+        and ends the process after SHUTDOWN_GRACE seconds as a fallback.
+        """
+        self._configure_worker_threads()
+        async with anyio.create_task_group() as tg:
+            async def supervise() -> None:
+                while not _SHUTDOWN.is_set():
+                    await anyio.sleep(0.1)
+                self.logger.info("Received signal to shutdown...")
+                _exit_after_grace(self.logger)
+                tg.cancel_scope.cancel()
+
+            tg.start_soon(supervise)
+            await self.mcp.run_stdio_async()
+            tg.cancel_scope.cancel()
+
 if __name__ == "__main__":
     config_path = os.getenv("PROXMOX_MCP_CONFIG")
     if not config_path:
@@ -11,10 +11,35 @@ This module provides tools for managing Proxmox backups:
 These tools enable comprehensive backup management through the MCP interface,
 providing essential functionality for systems administrators.
 """
-from typing import Dict, List, Optional, Any
+import heapq
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
 from mcp.types import TextContent as Content
+
 from .base import ProxmoxTool
 
+# Upper bound on the number of backups list_backups returns
+MAX_BACKUPS = 1000
+
+def _backup_entry(backup: Dict[str, Any], node_name: str) -> Dict[str, Any]:
+    """Build the backup listing entry for a storage content item.
+
+    Args:
+        backup: Storage content item from the Proxmox API
+        node_name: Node the item was listed from
+
+    Returns:
+        Backup dictionary as returned by list_backups
+    """
+    return {
+        "filename": backup.get("volid", ""),
+        "node": node_name,
+        "vmid": backup.get("vmid", ""),
+        "size": backup.get("size", 0),
+        "timestamp": backup.get("ctime", 0),
+        "format": backup.get("format", "")
+    }
+
 class BackupTools(ProxmoxTool):
     """Tools for managing Proxmox backups.
     
@@ -50,61 +75,156 @@ class BackupTools(ProxmoxTool):
                 params["compress"] = compress
                 
             result = self.proxmox.nodes(node).vzdump.post(**params)
-            return self._format_response({
-                "success": True,
-                "task_id": result,
-                "message": f"Backup of VM {vmid} initiated"
-            }, "backup_create")
+            return self._task_response("backup_create", f"Backup of VM {vmid} initiated", result)
         except Exception as e:
             self._handle_error(f"create backup for VM {vmid}", e)
 
-    def list_backups(self, storage: Optional[str] = None, vmid: Optional[str] = None) -> List[Content]:
-        """List available backups.
+    def _backup_storages(self, storage: Optional[str] = None) -> List[Tuple[str, str, bool]]:
+        """Find the storages holding backups, via one cluster-wide query.
+
+        Shared storages (NFS, PBS, ...) show up once per node in
+        cluster/resources but hold the same backups; only the first node
+        reporting each one is kept.
+
+        Args:
+            storage: Optional storage ID to restrict the search to
+
+        Returns:
+            List of (node, storage, shared) tuples to list backups from
+        """
+        targets = []
+        seen_shared = set()
+        for resource in self.proxmox.cluster.resources.get(type="storage"):
+            name = resource.get("storage")
+            if storage and name != storage:
+                continue
+            if "backup" not in resource.get("content", "").split(","):
+                continue
+            if resource.get("status", "available") != "available":
+                continue
+            shared = bool(resource.get("shared"))
+            if shared:
+                if name in seen_shared:
+                    continue
+                seen_shared.add(name)
+            targets.append((resource["node"], name, shared))
+        return targets
+
+    def _iter_backups(self, storage: Optional[str] = None,
+                      vmid: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Yield backups as each storage (or node) listing arrives.
+
+        Storages are located with a single cluster/resources query so that
+        shared backup storages are listed once rather than from every node.
+        Falls back to querying each node when that endpoint is not
+        permitted for the API token. Listings are fetched concurrently and
+        consumed in completion order; backups on a shared storage seen
+        through more than one node are yielded once, while same-named
+        backups on different nodes' local storages are all kept.
 
         Args:
             storage: Optional storage ID to filter backups
             vmid: Optional VM ID to filter backups
 
-        Returns:
-            List of Content objects containing backup information
+        Yields:
+            Backup dictionaries
         """
         try:
-            backups = []
-            
-            # Get all nodes
-            nodes = self.proxmox.nodes.get()
-            
-            # Collect backups from each node
-            for node_info in nodes:
+            targets = self._backup_storages(storage)
+        except Exception as e:
+            self.logger.debug(f"cluster/resources unavailable, querying nodes: {e}")
+            targets = None
+
+        params = {"content": "backup"}
+        if vmid:
+            params["vmid"] = vmid
+
+        def storage_backups(target):
+            # Returns (de-duplication key, backup) pairs; a volid only
+            # names the same file cluster-wide on a shared storage
+            node_name, storage_name, shared = target
+            try:
+                content = self.proxmox.nodes(node_name).storage(storage_name).content.get(**params)
+            except Exception:
+                # Skip storages that are offline or unreadable
+                return []
+            entries = (_backup_entry(backup, node_name) for backup in content)
+            return [
+                (entry["filename"] if shared else (node_name, entry["filename"]), entry)
+                for entry in entries
+            ]
+
+        if targets is not None:
+            results = self._iter_concurrent(storage_backups, targets)
+        else:
+            def node_backups(node_info):
                 node_name = node_info["node"]
-                
-                # Build filter parameters
-                params = {}
-                if storage:
-                    params["storage"] = storage
-                if vmid:
-                    params["vmid"] = vmid
-                    
                 try:
-                    # Get backups for this node
-                    node_backups = self.proxmox.nodes(node_name).storage.get(**params)
-                    
-                    # Add each backup to our results
-                    for backup in node_backups:
-                        if backup.get("content") == "backup":
-                            backups.append({
-                                "filename": backup.get("volid", ""),
-                                "node": node_name,
-                                "vmid": backup.get("vmid", ""),
-                                "size": backup.get("size", 0),
-                                "timestamp": backup.get("ctime", 0),
-                                "format": backup.get("format", "")
-                            })
+                    # Get this node's backup-capable storages, filtered server-side
+                    storages = self.proxmox.nodes(node_name).storage.get(content="backup")
                 except Exception:
                     # Skip if this node doesn't have backups
-                    pass
-                    
-            return self._format_response(backups, "backups")
+                    return []
+                return [
+                    backup
+                    for entry in storages
+                    if not storage or entry.get("storage") == storage
+                    for backup in storage_backups(
+                        (node_name, entry["storage"], bool(entry.get("shared")))
+                    )
+                ]
+
+            results = self._iter_concurrent(node_backups, self._get_nodes_cached())
+
+        seen = set()
+        for node_result in results:
+            for key, backup in node_result:
+                if backup["filename"]:
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                yield backup
+
+    def list_backups(self, storage: Optional[str] = None, vmid: Optional[str] = None,
+                     limit: Optional[int] = None) -> List[Content]:
+        """List available backups, newest first.
+
+        The backups are always returned as one JSON array. When more match
+        than the limit allows, only the newest are returned and a second
+        content item states how many matched in total.
+
+        Args:
+            storage: Optional storage ID to filter backups
+            vmid: Optional VM ID to filter backups
+            limit: Optional maximum number of backups to return
+                   (capped at MAX_BACKUPS)
+
+        Returns:
+            List of Content objects containing backup information
+        """
+        try:
+            limit = MAX_BACKUPS if limit is None else max(0, min(limit, MAX_BACKUPS))
+            total = 0
+
+            def counted() -> Iterator[Dict[str, Any]]:
+                nonlocal total
+                for backup in self._iter_backups(storage, vmid):
+                    total += 1
+                    yield backup
+
+            # Only the newest `limit` backups are held while the listings stream in
+            backups = counted()
+            newest = heapq.nlargest(limit, backups, key=lambda backup: backup["timestamp"])
+            # nlargest stops early for a limit of 0; count whatever it left
+            total += sum(1 for _ in backups)
+
+            result = self._format_response(newest, "backups")
+            if total > len(newest):
+                result.append(Content(
+                    type="text",
+                    text=f"Showing the newest {len(newest)} of {total} backups (limit {limit})"
+                ))
+            return result
         except Exception as e:
             self._handle_error("list backups", e)
 
@@ -130,11 +250,7 @@ class BackupTools(ProxmoxTool):
                 params["target_vmid"] = target_vmid
                 
             result = self.proxmox.nodes(node).vzdump.extractconfig.post(**params)
-            return self._format_response({
-                "success": True,
-                "task_id": result,
-                "message": f"Restore of VM {vmid} from backup {backup_id} initiated"
-            }, "backup_restore")
+            return self._task_response("backup_restore", f"Restore of VM {vmid} from backup {backup_id} initiated", result)
         except Exception as e:
             self._handle_error(f"restore VM {vmid} from backup", e)
 
@@ -148,7 +264,10 @@ class BackupTools(ProxmoxTool):
             List of Content objects containing backup configuration
         """
         try:
-            config = self.proxmox.nodes(node).vzdump.extractconfig.get()
+            config = self._cached(
+                ("backup_config", node),
+                self.proxmox.nodes(node).vzdump.extractconfig.get,
+            )
             return self._format_response(config, "backup_config")
         except Exception as e:
             self._handle_error(f"get backup configuration for node {node}", e)
@@ -165,9 +284,7 @@ class BackupTools(ProxmoxTool):
         """
         try:
             result = self.proxmox.nodes(node).vzdump.extractconfig.put(**schedule)
-            return self._format_response({
-                "success": True,
-                "message": f"Backup schedule updated for node {node}"
-            }, "backup_schedule_update")
+            self.invalidate("backup_config", node)
+            return self._task_response("backup_schedule_update", f"Backup schedule updated for node {node}")
         except Exception as e:
             self._handle_error(f"update backup schedule for node {node}", e)
@@ -6,16 +6,122 @@ This module provides the foundation for all Proxmox MCP tools, including:
 - Response formatting utilities
 - Error handling mechanisms
 - Logging setup
+- Concurrent fan-out of independent per-node API calls
+- Non-blocking waits for Proxmox tasks
+- Short-lived caching of read-mostly metadata, including a cluster node
+  list and VM configurations shared by all tools
 
 All tool implementations inherit from the ProxmoxTool base class to ensure
 consistent behavior and error handling across the MCP server.
 """
+import asyncio
+import functools
+import inspect
+import json
 import logging
-from typing import Any, Dict, List, Optional, Union
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, TypeVar
 from mcp.types import TextContent as Content
 from proxmoxer import ProxmoxAPI
+from ..core.cache import TTLCache
+from ..core.proxmox import FANOUT_WORKERS
 from ..formatting import ProxmoxTemplates
 
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Shared pool for per-node/per-guest API calls; threads are started on demand
+_FANOUT_POOL = ThreadPoolExecutor(max_workers=FANOUT_WORKERS, thread_name_prefix="pve-fanout")
+
+# Lifetimes (seconds) for cached metadata: node lists and templates change
+# rarely, guest configs are edited more often and expire sooner
+META_CACHE_TTL = 30.0
+CONFIG_CACHE_TTL = 10.0
+
+_MISSING = object()
+
+# Cluster node list shared by every tool on the same API connection, so
+# multi-node tool calls list the nodes once a minute. Tools drop it with
+# invalidate_nodes() when a per-node request fails, so a removed node is
+# not queried again. Entries are keyed by (api, version); invalidate_nodes()
+# bumps the version so a fetch racing with the invalidation cannot
+# repopulate the new key with stale data.
+NODE_LIST_TTL = 60.0
+_NODE_LIST_CACHE = TTLCache(NODE_LIST_TTL, maxsize=16)
+_NODE_LIST_LOCK = threading.Lock()
+_node_list_version = 0
+
+# VM configs shared by every tool group, so an invalidation after a write
+# in one group is seen by all of them. Keys are (api, node, vmid)
+_VM_CONFIG_CACHE = TTLCache(CONFIG_CACHE_TTL, maxsize=1024)
+
+def _node_status_template(data: Any) -> str:
+    # For node_status, data should be a tuple of (node_name, status_dict)
+    if isinstance(data, tuple) and len(data) == 2:
+        return ProxmoxTemplates.node_status(data[0], data[1])
+    return ProxmoxTemplates.node_status("unknown", data)
+
+# Encoder for the JSON fallback; json.dumps(indent=2) would build a new
+# JSONEncoder on every call. The stdlib encoder is used deliberately so the
+# exact response text does not depend on which optional packages are
+# installed
+_JSON_ENCODER = json.JSONEncoder(indent=2)
+
+# Template used by _format_response for each resource type; any other
+# type is rendered as JSON
+_RESPONSE_TEMPLATES: Dict[str, Callable[[Any], str]] = {
+    "nodes": ProxmoxTemplates.node_list,
+    "node_status": _node_status_template,
+    "vms": ProxmoxTemplates.vm_list,
+    "storage": ProxmoxTemplates.storage_list,
+    "containers": ProxmoxTemplates.container_list,
+    "cluster": ProxmoxTemplates.cluster_status,
+    # Template-related formatting
+    "vm_templates": ProxmoxTemplates.vm_templates,
+    "template_details": ProxmoxTemplates.template_details,
+    "template_operation": ProxmoxTemplates.template_operation,
+    "template_clone": ProxmoxTemplates.template_clone,
+    "container_templates": ProxmoxTemplates.container_templates,
+}
+
+def proxmox_op(operation: str) -> Callable[[Callable[..., R]], Callable[..., R]]:
+    """Decorate a tool method with standard error handling and timing.
+
+    Exceptions are passed to ProxmoxTool._handle_error() and the call's
+    duration is logged at debug level, so every API operation can be
+    profiled from the logs without touching the method.
+
+    Args:
+        operation: Description of the operation for error messages; it is
+                   formatted with the method's arguments by name only when
+                   the call fails, e.g. "start VM {vmid}"
+
+    Returns:
+        Decorator for ProxmoxTool methods
+    """
+    def decorator(func: Callable[..., R]) -> Callable[..., R]:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(self, *args, **kwargs)
+            except Exception as e:
+                try:
+                    description = operation.format(**signature.bind(self, *args, **kwargs).arguments)
+                except (KeyError, TypeError):
+                    description = operation
+                self._handle_error(description, e)
+            finally:
+                self.logger.debug("%s took %.1f ms", func.__name__,
+                                  (time.perf_counter() - start) * 1000)
+
+        return wrapper
+    return decorator
+
 class ProxmoxTool:
     """Base class for Proxmox MCP tools.
 
@@ -32,11 +138,197 @@ class ProxmoxTool:
     def __init__(self, proxmox_api: ProxmoxAPI):
         """Initialize the tool.
 
+        All tool groups receive the same ProxmoxAPI instance and so share
+        its single pooled, keep-alive HTTP session (configured by
+        ProxmoxManager._configure_session); tools must not create their
+        own sessions.
+
         Args:
             proxmox_api: Initialized ProxmoxAPI instance
         """
         self.proxmox = proxmox_api
         self.logger = logging.getLogger(f"proxmox-mcp.{self.__class__.__name__.lower()}")
+        self._meta_cache = TTLCache(META_CACHE_TTL, maxsize=512)
+
+    def _cached(self, key: tuple, fetch: Callable[[], R], ttl: Optional[float] = None) -> R:
+        """Return a cached API result, fetching and storing it on a miss.
+
+        Only for read-mostly metadata; mutating methods must call
+        invalidate() for the keys they affect.
+
+        Args:
+            key: Cache key, a tuple starting with the resource kind
+            fetch: No-argument function making the API call
+            ttl: Optional lifetime overriding META_CACHE_TTL
+
+        Returns:
+            Cached or freshly fetched result
+        """
+        value = self._meta_cache.get(key, _MISSING)
+        if value is _MISSING:
+            value = fetch()
+            self._meta_cache.set(key, value, ttl)
+        return value
+
+    def _get_nodes_cached(self) -> List[Dict[str, Any]]:
+        """Get the cluster node list through the shared short-lived cache.
+
+        Concurrent misses are serialized so only one caller hits the API.
+
+        Returns:
+            Node list as returned by GET /nodes
+        """
+        key = (self.proxmox, _node_list_version)
+        nodes = _NODE_LIST_CACHE.get(key, _MISSING)
+        if nodes is _MISSING:
+            with _NODE_LIST_LOCK:
+                key = (self.proxmox, _node_list_version)
+                nodes = _NODE_LIST_CACHE.get(key, _MISSING)
+                if nodes is _MISSING:
+                    nodes = self.proxmox.nodes.get()
+                    _NODE_LIST_CACHE.set(key, nodes)
+        return nodes
+
+    @staticmethod
+    def invalidate_nodes() -> None:
+        """Force the next _get_nodes_cached() call to refetch the node list."""
+        global _node_list_version
+        with _NODE_LIST_LOCK:
+            _node_list_version += 1
+            _NODE_LIST_CACHE.clear()
+
+    def invalidate(self, *prefix: Any) -> None:
+        """Drop cached metadata whose key starts with the given elements.
+
+        Args:
+            *prefix: Leading key elements, e.g. ("container_config", node, vmid)
+        """
+        self._meta_cache.invalidate(prefix)
+
+    def _vm_config(self, node: str, vmid: Any) -> Dict[str, Any]:
+        """Get a VM's configuration through the shared short-lived cache.
+
+        The returned dictionary is shared with other callers and must not
+        be modified.
+
+        Args:
+            node: Host node name
+            vmid: VM ID number
+
+        Returns:
+            Configuration as returned by GET nodes/{node}/qemu/{vmid}/config
+        """
+        key = (self.proxmox, node, str(vmid))
+        config = _VM_CONFIG_CACHE.get(key, _MISSING)
+        if config is _MISSING:
+            config = self.proxmox.nodes(node).qemu(vmid).config.get()
+            _VM_CONFIG_CACHE.set(key, config)
+        return config
+
+    def _invalidate_vm(self, node: str, vmid: Any) -> None:
+        """Drop a VM's cached configuration after changing it.
+
+        Args:
+            node: Host node name
+            vmid: VM ID number
+        """
+        _VM_CONFIG_CACHE.invalidate((self.proxmox, node, str(vmid)))
+
+    def _map_concurrent(self, func: Callable[[T], R], items: Iterable[T]) -> List[R]:
+        """Apply a function to each item concurrently, preserving order.
+
+        Used to overlap independent API round trips (one per node or guest)
+        that would otherwise run back to back. Behaves like a serial loop:
+        results keep the input order and the first failing item's exception
+        is raised.
+
+        Args:
+            func: Function making the API call(s) for one item
+            items: Items to process
+
+        Returns:
+            List of results in input order
+        """
+        items = list(items)
+        if len(items) <= 1:
+            return [func(item) for item in items]
+        return list(_FANOUT_POOL.map(func, items))
+
+    def _iter_concurrent(self, func: Callable[[T], R], items: Iterable[T]) -> Iterator[R]:
+        """Apply a function to each item concurrently, yielding results as they finish.
+
+        Unlike _map_concurrent, callers can start consuming results before
+        the slowest item has responded. Calls still pending when the
+        iterator is abandoned run to completion in the background.
+
+        Args:
+            func: Function making the API call(s) for one item
+            items: Items to process
+
+        Yields:
+            Results in completion order
+        """
+        futures = [_FANOUT_POOL.submit(func, item) for item in items]
+        for future in as_completed(futures):
+            yield future.result()
+
+    def _parallel(self, *calls: Callable[[], Any]) -> List[Any]:
+        """Run independent no-argument API calls concurrently.
+
+        Args:
+            *calls: Functions each making one API call
+
+        Returns:
+            List of results in argument order; the first failing call's
+            exception is raised
+        """
+        futures = [_FANOUT_POOL.submit(call) for call in calls]
+        return [future.result() for future in futures]
+
+    async def _await_task(self, task: Any, timeout: float,
+                          delay: float = 1.0, max_delay: float = 10.0) -> Dict[str, Any]:
+        """Poll a task until it stops or the timeout expires.
+
+        The first status check is immediate; after that the interval
+        doubles from delay up to max_delay. Each API call runs in a worker
+        thread so the event loop keeps serving other requests.
+
+        Args:
+            task: API resource for the task, i.e. proxmox.nodes(node).tasks(upid)
+            timeout: Maximum number of seconds to wait
+            delay: Initial polling interval in seconds
+            max_delay: Upper bound for the polling interval in seconds
+
+        Returns:
+            Last task status seen; its "status" is "stopped" unless the
+            timeout expired first
+        """
+        status_endpoint = task.status
+        deadline = time.monotonic() + timeout
+        while True:
+            status = await asyncio.to_thread(status_endpoint.get)
+            remaining = deadline - time.monotonic()
+            if status.get("status") == "stopped" or remaining <= 0:
+                return status
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * 2, max_delay)
+
+    def _task_response(self, resource_type: str, message: str, task_id: Any = _MISSING) -> List[Content]:
+        """Format the result of a successfully submitted operation.
+
+        Args:
+            resource_type: Type of resource for template selection
+            message: Human-readable description of the operation
+            task_id: Optional task ID (UPID) returned by Proxmox
+
+        Returns:
+            List of Content objects containing the operation result
+        """
+        payload = {"success": True}
+        if task_id is not _MISSING:
+            payload["task_id"] = task_id
+        payload["message"] = message
+        return self._format_response(payload, resource_type)
 
     def _format_response(self, data: Any, resource_type: Optional[str] = None) -> List[Content]:
         """Format response data into MCP content using templates.
@@ -55,37 +347,12 @@ class ProxmoxTool:
         Returns:
             List of Content objects formatted according to resource type
         """
-        if resource_type == "nodes":
-            formatted = ProxmoxTemplates.node_list(data)
-        elif resource_type == "node_status":
-            # For node_status, data should be a tuple of (node_name, status_dict)
-            if isinstance(data, tuple) and len(data) == 2:
-                formatted = ProxmoxTemplates.node_status(data[0], data[1])
-            else:
-                formatted = ProxmoxTemplates.node_status("unknown", data)
-        elif resource_type == "vms":
-            formatted = ProxmoxTemplates.vm_list(data)
-        elif resource_type == "storage":
-            formatted = ProxmoxTemplates.storage_list(data)
-        elif resource_type == "containers":
-            formatted = ProxmoxTemplates.container_list(data)
-        elif resource_type == "cluster":
-            formatted = ProxmoxTemplates.cluster_status(data)
-        # Template-related formatting
-        elif resource_type == "vm_templates":
-            formatted = ProxmoxTemplates.vm_templates(data)
-        elif resource_type == "template_details":
-            formatted = ProxmoxTemplates.template_details(data)
-        elif resource_type == "template_operation":
-            formatted = ProxmoxTemplates.template_operation(data)
-        elif resource_type == "template_clone":
-            formatted = ProxmoxTemplates.template_clone(data)
-        elif resource_type == "container_templates":
-            formatted = ProxmoxTemplates.container_templates(data)
+        template = _RESPONSE_TEMPLATES.get(resource_type)
+        if template is not None:
+            formatted = template(data)
         else:
             # Fallback to JSON formatting for unknown types
-            import json
-            formatted = json.dumps(data, indent=2)
+            formatted = _JSON_ENCODER.encode(data)
 
         return [Content(type="text", text=formatted)]
 
@@ -86,8 +86,10 @@ class VMConsoleManager:
                        - API communication errors occur
         """
         try:
+            vm = self.proxmox.nodes(node).qemu(vmid)
+
             # Verify VM exists and is running
-            vm_status = self.proxmox.nodes(node).qemu(vmid).status.current.get()
+            vm_status = vm.status.current.get()
             if vm_status["status"] != "running":
                 self.logger.error(f"Failed to execute command on VM {vmid}: VM is not running")
                 raise ValueError(f"VM {vmid} on node {node} is not running")
@@ -97,7 +99,7 @@ class VMConsoleManager:
             
             # Get the API endpoint
             # Use the guest agent exec endpoint
-            endpoint = self.proxmox.nodes(node).qemu(vmid).agent
+            endpoint = vm.agent
             self.logger.debug(f"Using API endpoint: {endpoint}")
             
             # Execute the command using two-step process
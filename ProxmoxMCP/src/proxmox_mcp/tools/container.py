@@ -14,24 +14,16 @@ This module provides tools for managing and interacting with Proxmox LXC contain
 The tools implement fallback mechanisms for scenarios where
 detailed container information might be temporarily unavailable.
 """
+import asyncio
 from typing import List, Dict, Any, Optional
 from mcp.types import TextContent as Content
-from .base import ProxmoxTool
-from .definitions import (
-    GET_CONTAINERS_DESC, 
-    GET_CONTAINER_STATUS_DESC,
-    CREATE_CONTAINER_DESC,
-    START_CONTAINER_DESC,
-    STOP_CONTAINER_DESC,
-    RESTART_CONTAINER_DESC,
-    DELETE_CONTAINER_DESC,
-    CLONE_CONTAINER_DESC,
-    GET_CONTAINER_CONFIG_DESC,
-    UPDATE_CONTAINER_CONFIG_DESC,
-    EXECUTE_CONTAINER_COMMAND_DESC,
-    GET_CONTAINER_PERFORMANCE_DESC,
-    GET_CONTAINER_TEMPLATES_DESC
-)
+from .base import CONFIG_CACHE_TTL, ProxmoxTool
+
+# Longest time execute_command waits for the exec task to finish (seconds)
+COMMAND_TIMEOUT = 60
+
+# Container config reports memory in MiB; status figures are in bytes
+_MB = 1024 * 1024
 
 class ContainerTools(ProxmoxTool):
     """Tools for managing Proxmox LXC containers.
@@ -59,30 +51,63 @@ class ContainerTools(ProxmoxTool):
     def get_containers(self) -> List[Content]:
         """List all LXC containers across the cluster with their status and configuration.
 
+        Uses a single cluster/resources query, which already carries each
+        container's node and usage figures. Falls back to listing every
+        node's containers when that endpoint is not permitted for the API
+        token.
+
         Returns:
             List of Content objects containing container information
         """
         try:
-            # Get all nodes in the cluster
-            nodes = self.proxmox.nodes.get()
-            
-            # Collect containers from all nodes
-            containers = []
-            for node in nodes:
-                node_name = node['node']
-                try:
-                    node_containers = self.proxmox.nodes(node_name).lxc.get()
-                    for container in node_containers:
-                        container['node'] = node_name
-                        containers.append(container)
-                except Exception as e:
-                    self.logger.warning(f"Failed to get containers for node {node_name}: {str(e)}")
+            try:
+                containers = [
+                    resource
+                    for resource in self.proxmox.cluster.resources.get(type="vm")
+                    if resource.get("type") == "lxc"
+                ]
+            except Exception as e:
+                self.logger.debug(f"cluster/resources unavailable, querying nodes: {e}")
+                containers = self._get_containers_per_node()
+            else:
+                for container in containers:
+                    # Match the field name used by nodes/{node}/lxc
+                    if "cpus" not in container and "maxcpu" in container:
+                        container["cpus"] = container["maxcpu"]
             
             # Format and return the container list
             return self._format_response(containers, "container_list")
         except Exception as e:
             self._handle_error("get containers", e)
 
+    def _get_containers_per_node(self) -> List[Dict[str, Any]]:
+        """List containers by querying every node concurrently.
+
+        Returns:
+            List of container dictionaries annotated with their node
+        """
+        # Get all nodes in the cluster
+        nodes = self._get_nodes_cached()
+        
+        def node_containers(node):
+            node_name = node['node']
+            try:
+                node_containers = self.proxmox.nodes(node_name).lxc.get()
+                for container in node_containers:
+                    container['node'] = node_name
+                return node_containers
+            except Exception as e:
+                self.logger.warning(f"Failed to get containers for node {node_name}: {str(e)}")
+                self.invalidate_nodes()
+                return []
+
+        # Collect containers from all nodes concurrently
+        return [
+            container
+            for node_result in self._map_concurrent(node_containers, nodes)
+            for container in node_result
+        ]
+
     def get_container_status(self, node: str, vmid: str) -> List[Content]:
         """Get detailed status information for a specific container.
 
@@ -94,11 +119,10 @@ class ContainerTools(ProxmoxTool):
             List of Content objects containing container status
         """
         try:
-            # Get container status
-            status = self.proxmox.nodes(node).lxc(vmid).status.current.get()
-            
-            # Get container config for additional information
-            config = self.proxmox.nodes(node).lxc(vmid).config.get()
+            # Get container status, and its config for additional
+            # information, in parallel
+            lxc = self.proxmox.nodes(node).lxc(vmid)
+            status, config = self._parallel(lxc.status.current.get, lxc.config.get)
             
             # Combine status and config information
             result = {
@@ -112,7 +136,7 @@ class ContainerTools(ProxmoxTool):
                 },
                 "memory": {
                     "used": status.get("mem", 0),
-                    "total": config.get("memory", 512) * 1024 * 1024
+                    "total": config.get("memory", 512) * _MB
                 },
                 "uptime": status.get("uptime", 0),
                 "disk": status.get("disk", {}),
@@ -163,15 +187,29 @@ class ContainerTools(ProxmoxTool):
             
             # Create the container
             result = self.proxmox.nodes(node).lxc.post(**params)
+            self.invalidate("container_config", node, vmid)
             
-            return self._format_response({
-                "success": True,
-                "task_id": result,
-                "message": f"Container {vmid} creation initiated"
-            }, "container_operation")
+            return self._task_response("container_operation", f"Container {vmid} creation initiated", result)
         except Exception as e:
             self._handle_error(f"create container {vmid}", e)
 
+    def _status_action(self, node: str, vmid: str, action: str) -> List[Content]:
+        """Submit a power action through the container's status endpoint.
+
+        Args:
+            node: Host node name
+            vmid: Container ID number
+            action: Action name under status/ (start, stop, restart)
+
+        Returns:
+            List of Content objects containing operation result
+        """
+        try:
+            result = getattr(self.proxmox.nodes(node).lxc(vmid).status, action).post()
+            return self._task_response("container_operation", f"Container {vmid} {action} initiated", result)
+        except Exception as e:
+            self._handle_error(f"{action} container {vmid}", e)
+
     def start_container(self, node: str, vmid: str) -> List[Content]:
         """Start a container.
 
@@ -182,15 +220,7 @@ class ContainerTools(ProxmoxTool):
         Returns:
             List of Content objects containing operation result
         """
-        try:
-            result = self.proxmox.nodes(node).lxc(vmid).status.start.post()
-            return self._format_response({
-                "success": True,
-                "task_id": result,
-                "message": f"Container {vmid} start initiated"
-            }, "container_operation")
-        except Exception as e:
-            self._handle_error(f"start container {vmid}", e)
+        return self._status_action(node, vmid, "start")
 
     def stop_container(self, node: str, vmid: str) -> List[Content]:
         """Stop a container.
@@ -202,15 +232,7 @@ class ContainerTools(ProxmoxTool):
         Returns:
             List of Content objects containing operation result
         """
-        try:
-            result = self.proxmox.nodes(node).lxc(vmid).status.stop.post()
-            return self._format_response({
-                "success": True,
-                "task_id": result,
-                "message": f"Container {vmid} stop initiated"
-            }, "container_operation")
-        except Exception as e:
-            self._handle_error(f"stop container {vmid}", e)
+        return self._status_action(node, vmid, "stop")
 
     def restart_container(self, node: str, vmid: str) -> List[Content]:
         """Restart a container.
@@ -222,15 +244,7 @@ class ContainerTools(ProxmoxTool):
         Returns:
             List of Content objects containing operation result
         """
-        try:
-            result = self.proxmox.nodes(node).lxc(vmid).status.restart.post()
-            return self._format_response({
-                "success": True,
-                "task_id": result,
-                "message": f"Container {vmid} restart initiated"
-            }, "container_operation")
-        except Exception as e:
-            self._handle_error(f"restart container {vmid}", e)
+        return self._status_action(node, vmid, "restart")
 
     def delete_container(self, node: str, vmid: str) -> List[Content]:
         """Delete a container.
@@ -244,11 +258,8 @@ class ContainerTools(ProxmoxTool):
         """
         try:
             result = self.proxmox.nodes(node).lxc(vmid).delete.post()
-            return self._format_response({
-                "success": True,
-                "task_id": result,
-                "message": f"Container {vmid} deletion initiated"
-            }, "container_operation")
+            self.invalidate("container_config", node, vmid)
+            return self._task_response("container_operation", f"Container {vmid} deletion initiated", result)
         except Exception as e:
             self._handle_error(f"delete container {vmid}", e)
 
@@ -275,11 +286,8 @@ class ContainerTools(ProxmoxTool):
                 params["hostname"] = name
                 
             result = self.proxmox.nodes(node).lxc(vmid).clone.post(**params)
-            return self._format_response({
-                "success": True,
-                "task_id": result,
-                "message": f"Container {vmid} clone to {target_vmid} initiated"
-            }, "container_clone")
+            self.invalidate("container_config", target_node or node, target_vmid)
+            return self._task_response("container_clone", f"Container {vmid} clone to {target_vmid} initiated", result)
         except Exception as e:
             self._handle_error(f"clone container {vmid} to {target_vmid}", e)
 
@@ -294,7 +302,11 @@ class ContainerTools(ProxmoxTool):
             List of Content objects containing container configuration
         """
         try:
-            config = self.proxmox.nodes(node).lxc(vmid).config.get()
+            config = self._cached(
+                ("container_config", node, vmid),
+                self.proxmox.nodes(node).lxc(vmid).config.get,
+                CONFIG_CACHE_TTL,
+            )
             return self._format_response(config, "container_config")
         except Exception as e:
             self._handle_error(f"get container {vmid} config", e)
@@ -312,13 +324,56 @@ class ContainerTools(ProxmoxTool):
         """
         try:
             result = self.proxmox.nodes(node).lxc(vmid).config.put(**kwargs)
-            return self._format_response({
-                "success": True,
-                "message": f"Container {vmid} configuration updated"
-            }, "container_config_update")
+            self.invalidate("container_config", node, vmid)
+            return self._task_response("container_config_update", f"Container {vmid} configuration updated")
         except Exception as e:
             self._handle_error(f"update container {vmid} config", e)
 
+    async def _run_command(self, node: str, vmid: str, command: str) -> Dict[str, Any]:
+        """Run one command in a container and wait for its output.
+
+        Args:
+            node: Host node name
+            vmid: Container ID number
+            command: Shell command to run
+
+        Returns:
+            Dictionary with success flag, output and exit code
+        """
+        # For LXC containers, we need to use the exec endpoint
+        node_api = self.proxmox.nodes(node)
+        result = await asyncio.to_thread(
+            node_api.lxc(vmid).exec.post, command=command
+        )
+        
+        # Wait for the command to complete and get the output
+        task_id = result
+        task = node_api.tasks(task_id)
+        task_status = await self._await_task(
+            task, COMMAND_TIMEOUT, delay=0.05, max_delay=2.0
+        )
+        
+        # Process the command output
+        output = ""
+        exit_code = 0
+        
+        if task_status.get("status") != "stopped":
+            exit_code = 1
+            output = f"Command still running after {COMMAND_TIMEOUT}s (task {task_id})"
+        elif task_status.get("exitstatus") == "OK":
+            # Get the command output from the task log
+            task_log = await asyncio.to_thread(task.log.get)
+            output = "\n".join(entry.get("t", "") for entry in task_log)
+        else:
+            exit_code = 1
+            output = f"Command execution failed: {task_status.get('exitstatus', 'Unknown error')}"
+        
+        return {
+            "success": exit_code == 0,
+            "output": output,
+            "exit_code": exit_code
+        }
+
     async def execute_command(self, node: str, vmid: str, command: str) -> List[Content]:
         """Execute a command in a container.
 
@@ -331,35 +386,44 @@ class ContainerTools(ProxmoxTool):
             List of Content objects containing command execution result
         """
         try:
-            # For LXC containers, we need to use the exec endpoint
-            result = self.proxmox.nodes(node).lxc(vmid).exec.post(
-                command=command
-            )
-            
-            # Wait for the command to complete and get the output
-            task_id = result
-            task_status = self.proxmox.nodes(node).tasks(task_id).status.get()
-            
-            # Process the command output
-            output = ""
-            exit_code = 0
-            
-            if task_status.get("exitstatus") == "OK":
-                # Get the command output from the task log
-                task_log = self.proxmox.nodes(node).tasks(task_id).log.get()
-                output = "\n".join([entry.get("t", "") for entry in task_log])
-            else:
-                exit_code = 1
-                output = f"Command execution failed: {task_status.get('exitstatus', 'Unknown error')}"
-            
-            return self._format_response({
-                "success": exit_code == 0,
-                "output": output,
-                "exit_code": exit_code
-            }, "container_command")
+            result = await self._run_command(node, vmid, command)
+            return self._format_response(result, "container_command")
         except Exception as e:
             self._handle_error(f"execute command in container {vmid}", e)
 
+    async def execute_commands(self, node: str, vmid: str, commands: List[str],
+                               concurrency: int = 5) -> List[Content]:
+        """Execute several commands in a container concurrently.
+
+        At most `concurrency` commands run at once. A failing command is
+        reported in its own result and does not stop the others.
+
+        Args:
+            node: Host node name (e.g., 'pve1', 'proxmox-node2')
+            vmid: Container ID number (e.g., '100', '101')
+            commands: Shell commands to run (e.g., ['uname -a', 'uptime'])
+            concurrency: Maximum number of commands running at once (default: 5)
+
+        Returns:
+            List of Content objects containing one result per command, in order
+        """
+        try:
+            semaphore = asyncio.Semaphore(max(1, concurrency))
+
+            async def run(command):
+                async with semaphore:
+                    try:
+                        result = await self._run_command(node, vmid, command)
+                    except Exception as e:
+                        self.logger.warning(f"Command {command!r} failed in container {vmid}: {e}")
+                        result = {"success": False, "output": str(e), "exit_code": 1}
+                return {"command": command, **result}
+
+            results = await asyncio.gather(*(run(command) for command in commands))
+            return self._format_response(results, "container_commands")
+        except Exception as e:
+            self._handle_error(f"execute commands in container {vmid}", e)
+
     def get_container_performance(self, node: str, vmid: str) -> List[Content]:
         """Get performance metrics for a container.
 
@@ -371,14 +435,17 @@ class ContainerTools(ProxmoxTool):
             List of Content objects containing performance metrics
         """
         try:
-            # Get current status for real-time metrics
-            status = self.proxmox.nodes(node).lxc(vmid).status.current.get()
+            lxc = self.proxmox.nodes(node).lxc(vmid)
+
+            def get_rrd_data():
+                # Get RRD data for historical metrics if available
+                try:
+                    return lxc.rrddata.get()
+                except:
+                    return []
             
-            # Get RRD data for historical metrics if available
-            try:
-                rrd_data = self.proxmox.nodes(node).lxc(vmid).rrddata.get()
-            except:
-                rrd_data = []
+            # Get current status for real-time metrics alongside the RRD data
+            status, rrd_data = self._parallel(lxc.status.current.get, get_rrd_data)
             
             # Format the performance data
             performance = {
@@ -413,17 +480,29 @@ class ContainerTools(ProxmoxTool):
             List of Content objects containing template information
         """
         try:
-            params = {}
-            if storage:
-                params["storage"] = storage
-                
-            templates = self.proxmox.nodes(node).storage.get(**params)
-            
-            # Filter for container templates
-            container_templates = []
-            for template in templates:
-                if template.get("content", "").startswith("vztmpl"):
-                    container_templates.append(template)
+            node_api = self.proxmox.nodes(node)
+
+            def fetch_templates():
+                # Template-capable storages on the node, unless one was given
+                if storage:
+                    storages = [storage]
+                else:
+                    storages = [
+                        entry["storage"]
+                        for entry in node_api.storage.get(content="vztmpl")
+                    ]
+                # List only template volumes, filtered server-side
+                return [
+                    volume
+                    for volumes in self._map_concurrent(
+                        lambda name: node_api.storage(name).content.get(content="vztmpl"),
+                        storages,
+                    )
+                    for volume in volumes
+                ]
+
+            templates = self._cached(("container_templates", node, storage), fetch_templates)
+            container_templates = [t for t in templates if t.get("content") == "vztmpl"]
             
             return self._format_response(container_templates, "container_templates")
         except Exception as e:
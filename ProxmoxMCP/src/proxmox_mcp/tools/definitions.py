@@ -1,6 +1,13 @@
 """
 Tool descriptions for Proxmox MCP tools.
+
+The server registers every tool at startup and reads each description
+then, so they are kept as plain module constants rather than loaded on
+demand. This module is imported only by the server; tool modules do not
+depend on it.
 """
+from types import MappingProxyType
+from typing import Final, Mapping
 
 # Template tool descriptions
 GET_TEMPLATES_DESC = """Get all VM templates across the cluster with detailed information.
@@ -181,9 +188,10 @@ GET_VM_PERFORMANCE_DESC = """Get performance metrics for a virtual machine.
 Parameters:
 node* - Host node name (e.g. 'pve1')
 vmid* - VM ID number (e.g. '100')
+include_history - Include the last hour of historical metrics (default: false)
 
 Example:
-{"cpu_usage": 0.15, "memory": {"used": "2GB", "total": "4GB"}, "disk_io": {"read_bytes": 1024, "write_bytes": 2048}, "network": {"in_bytes": 1024, "out_bytes": 2048}}"""
+{"cpu_usage": 0.15, "memory": {"used": "2GB", "total": "4GB"}, "disk_io": {"read_bytes": 1024, "write_bytes": 2048}, "network": {"in_bytes": 1024, "out_bytes": 2048}, "historical": null}"""
 
 # Container tool descriptions
 GET_CONTAINERS_DESC = """List all LXC containers across the cluster with their status and configuration.
@@ -298,6 +306,17 @@ command* - Shell command to run (e.g. 'uname -a')
 Example:
 {"success": true, "output": "Linux container1 5.4.0", "exit_code": 0}"""
 
+EXECUTE_CONTAINER_COMMANDS_DESC = """Execute several commands in a container concurrently.
+
+Parameters:
+node* - Host node name (e.g. 'pve1')
+vmid* - Container ID number (e.g. '200')
+commands* - List of shell commands to run (e.g. ['uname -a', 'uptime'])
+concurrency - Maximum number of commands running at once (default: 5)
+
+Example:
+[{"command": "uname -a", "success": true, "output": "Linux container1 5.4.0", "exit_code": 0}]"""
+
 GET_CONTAINER_PERFORMANCE_DESC = """Get performance metrics for a container.
 
 Parameters:
@@ -349,6 +368,19 @@ upid* - Task UPID (Unique Process ID) to cancel
 Example:
 {"success": true, "upid": "UPID:pve1:00051234:1234ABC:61A1B2C3:qmstart:100:root@pam:", "message": "Task UPID:pve1:00051234:1234ABC:61A1B2C3:qmstart:100:root@pam: cancellation initiated"}"""
 
+AWAIT_TASK_DESC = """Wait for a task (e.g. a clone, backup or restore started by another tool) to finish.
+
+Long-running operations return a task UPID immediately; use this to block until
+the task has stopped or the timeout expires. Status is polled with a growing
+interval, without holding up other requests.
+
+Parameters:
+upid* - Task UPID (Unique Process ID) to wait for
+timeout - Maximum seconds to wait (default: 300)
+
+Example:
+{"upid": "UPID:pve1:00051234:1234ABC:61A1B2C3:qmclone:100:root@pam:", "node": "pve1", "finished": true, "success": true, "status": "stopped", "exitstatus": "OK", "log": ["create full clone of drive scsi0", "TASK OK"]}"""
+
 # Backup tool descriptions
 CREATE_BACKUP_DESC = """Create a backup of a VM or container.
 
@@ -362,11 +394,16 @@ mode - Backup mode (snapshot, suspend, stop) (default: snapshot)
 Example:
 {"success": true, "task_id": "UPID:pve1:00051234:1234ABC:61A1B2C3:vzdump:100:root@pam:", "message": "Backup of VM 100 initiated"}"""
 
-LIST_BACKUPS_DESC = """List available backups.
+LIST_BACKUPS_DESC = """List available backups, newest first.
 
 Parameters:
 storage - Optional storage ID to filter backups
 vmid - Optional VM ID to filter backups
+limit - Optional maximum number of backups to return (max 1000)
+
+When more backups match than the limit, the newest are returned and a
+second text item reports the total, e.g. "Showing the newest 50 of 120
+backups (limit 50)".
 
 Example:
 [{"filename": "vzdump-qemu-100-2023_06_01-12_00_00.vma.zst", "node": "pve1", "vmid": "100", "size": 10737418240, "timestamp": 1623456789, "format": "vma.zst"}]"""
@@ -405,3 +442,20 @@ GET_CLUSTER_STATUS_DESC = """Get overall Proxmox cluster health and configuratio
 
 Example:
 {"name": "proxmox", "quorum": "ok", "nodes": 3, "ha_status": "active"}"""
+
+# Server tool descriptions
+GET_CACHE_STATS_DESC = """Get statistics for the server's short-lived cache of inventory results.
+
+Node, storage, cluster and template listings are reused for a few seconds
+and dropped whenever a state-changing tool runs.
+
+Example:
+{"size": 3, "maxsize": 128, "ttl": 15.0, "hits": 12, "misses": 3, "cached_tools": ["get_nodes", "get_storage"]}"""
+
+# All descriptions keyed by tool constant name without the _DESC suffix
+# (e.g. DESCRIPTIONS["GET_NODES"]), for callers that register tools in bulk
+DESCRIPTIONS: Final[Mapping[str, str]] = MappingProxyType({
+    name[:-len("_DESC")]: value
+    for name, value in list(globals().items())
+    if name.endswith("_DESC")
+})
@@ -15,7 +15,6 @@ with fallback mechanisms for partial data availability.
 from typing import List
 from mcp.types import TextContent as Content
 from .base import ProxmoxTool
-from .definitions import GET_NODES_DESC, GET_NODE_STATUS_DESC
 
 class NodeTools(ProxmoxTool):
     """Tools for managing Proxmox nodes.
@@ -60,15 +59,13 @@ class NodeTools(ProxmoxTool):
         """
         try:
             result = self.proxmox.nodes.get()
-            nodes = []
-            
-            # Get detailed info for each node
-            for node in result:
+
+            def node_info(node):
                 node_name = node["node"]
                 try:
                     # Get detailed status for each node
                     status = self.proxmox.nodes(node_name).status.get()
-                    nodes.append({
+                    return {
                         "node": node_name,
                         "status": node["status"],
                         "uptime": status.get("uptime", 0),
@@ -77,10 +74,10 @@ class NodeTools(ProxmoxTool):
                             "used": status.get("memory", {}).get("used", 0),
                             "total": status.get("memory", {}).get("total", 0)
                         }
-                    })
+                    }
                 except Exception:
                     # Fallback to basic info if detailed status fails
-                    nodes.append({
+                    return {
                         "node": node_name,
                         "status": node["status"],
                         "uptime": 0,
@@ -89,7 +86,10 @@ class NodeTools(ProxmoxTool):
                             "used": node.get("maxmem", 0) - node.get("mem", 0),
                             "total": node.get("maxmem", 0)
                         }
-                    })
+                    }
+
+            # Get detailed info for all nodes concurrently
+            nodes = self._map_concurrent(node_info, result)
             return self._format_response(nodes, "nodes")
         except Exception as e:
             self._handle_error("get nodes", e)
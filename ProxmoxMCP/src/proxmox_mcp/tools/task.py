@@ -6,14 +6,84 @@ This module provides tools for managing and monitoring Proxmox tasks:
 - Getting detailed task information and status
 - Monitoring task progress
 - Cancelling running tasks
+- Waiting for long-running tasks to finish
 
 These tools enable comprehensive task management through the MCP interface,
 providing essential functionality for systems administrators.
 """
-from typing import Dict, List, Optional, Any
+import asyncio
+import heapq
+import re
+from functools import lru_cache
+from itertools import islice, repeat
+from typing import Dict, List, Optional, Any, Tuple
 from mcp.types import TextContent as Content
+from ..core.cache import TTLCache
 from .base import ProxmoxTool
 
+# get_task_status results are reused for this long (seconds) while a task
+# runs; once stopped a task's status and log never change again, so they
+# are kept until evicted
+RUNNING_STATUS_TTL = 0.5
+STOPPED_STATUS_TTL = float("inf")
+
+# Task logs are fetched incrementally: lines already seen are kept for
+# LOG_CACHE_TTL seconds and only newer ones are requested, LOG_PAGE_SIZE
+# lines per request
+LOG_CACHE_TTL = 600.0
+LOG_PAGE_SIZE = 500
+
+# Text of the single entry Proxmox returns for a log with no lines (yet)
+_NO_LOG_CONTENT = "no content"
+
+# Task UPID: UPID:node:pid:pstart:starttime:type:id:user: (numbers in hex)
+_UPID_RE = re.compile(
+    r"UPID:(?P<node>[^:]+):(?P<pid>[0-9A-Fa-f]+):(?P<pstart>[0-9A-Fa-f]+):"
+    r"(?P<starttime>[0-9A-Fa-f]+):(?P<type>[^:]+):(?P<id>[^:]*):(?P<user>[^:]+):"
+)
+
+@lru_cache(maxsize=1024)
+def _node_from_upid(upid: str) -> str:
+    """Validate a task UPID and extract its node name.
+
+    Status polling passes the same UPID repeatedly, hence the cache.
+
+    Args:
+        upid: Task UPID
+
+    Returns:
+        Node name the task runs on
+
+    Raises:
+        ValueError: If upid is not a well-formed UPID
+    """
+    match = _UPID_RE.match(upid)
+    if match is None:
+        raise ValueError(f"Invalid UPID: {upid}")
+    return match["node"]
+
+def _task_row(node_name: str, task: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the get_tasks entry for a task from a node's task list.
+
+    Args:
+        node_name: Node the task was listed from
+        task: Task entry from the Proxmox API
+
+    Returns:
+        Task dictionary annotated with its node
+    """
+    return {
+        "upid": task.get("upid", ""),
+        "type": task.get("type", ""),
+        "status": task.get("status", ""),
+        "node": node_name,
+        "starttime": task.get("starttime", 0),
+        "endtime": task.get("endtime", 0),
+        "id": task.get("id", ""),
+        "user": task.get("user", ""),
+        "vmid": task.get("vmid", "")
+    }
+
 class TaskTools(ProxmoxTool):
     """Tools for managing Proxmox tasks.
     
@@ -26,65 +96,133 @@ class TaskTools(ProxmoxTool):
     Essential for tracking operations and troubleshooting issues.
     """
 
+    def __init__(self, proxmox_api):
+        """Initialize task tools.
+
+        Args:
+            proxmox_api: Initialized ProxmoxAPI instance
+        """
+        super().__init__(proxmox_api)
+        self._status_cache = TTLCache(RUNNING_STATUS_TTL, maxsize=256)
+        self._log_cache = TTLCache(LOG_CACHE_TTL, maxsize=64)
+        # proxmoxer resources for each node's task list, built on first use
+        self._node_tasks: Dict[str, Any] = {}
+
     def get_tasks(self, limit: int = 50, vmid: Optional[str] = None, node: Optional[str] = None) -> List[Content]:
-        """List recent tasks across the cluster with their status.
+        """List recent tasks across the cluster with their status, newest first.
 
         Args:
             limit: Maximum number of tasks to return (default: 50)
-            vmid: Optional VM ID to filter tasks for a specific VM
+            vmid: Optional VM ID to filter tasks for a specific VM; without
+                  a node, only the node currently hosting it is queried
             node: Optional node name to filter tasks for a specific node
 
         Returns:
             List of Content objects containing formatted task information
         """
         try:
-            tasks = []
-            
+            # A guest's tasks run on the node hosting it, so for a vmid
+            # query only that node unless the caller chose one
+            if vmid and not node:
+                node = self._guest_node(vmid)
+
             # If node is specified, get tasks for that node only
             if node:
                 nodes = [{"node": node}]
             else:
-                # Otherwise get all nodes
-                nodes = self.proxmox.nodes.get()
-                
-            # Collect tasks from each node
-            for node_info in nodes:
-                node_name = node_info["node"]
+                # Otherwise get all nodes, reusing the node list shared by
+                # all tools for up to NODE_LIST_TTL seconds
+                nodes = self._get_nodes_cached()
                 
-                # Build filter parameters
-                params = {"limit": limit}
+            # Ask each node for an even share of the limit, rather than the
+            # whole limit, so large clusters don't transfer tasks that are
+            # dropped anyway. Proxmox applies the limit before serializing,
+            # so a node's response never carries more tasks than requested
+            node_names = [node_info["node"] for node_info in nodes]
+            per_node = limit if len(node_names) <= 1 else max(5, -(-limit // len(node_names)))
+
+            def fetch(names, node_limit):
+                params = {"limit": node_limit}
                 if vmid:
                     params["vmid"] = vmid
+                return dict(zip(names, self._map_concurrent(
+                    lambda name: self._tasks_resource(name).get(**params), names
+                )))
+
+            def newest(shards):
+                # Proxmox lists each node's tasks newest first, so merging
+                # the shards yields the cluster-wide newest without a full
+                # sort. Items are (node, raw task) pairs; rows are only built
+                # for those kept
+                return list(islice(heapq.merge(
+                    *(zip(repeat(name), shard) for name, shard in shards.items()),
+                    key=lambda item: item[1].get("starttime", 0), reverse=True
+                ), limit))
+
+            # Get tasks from all nodes concurrently, newest first
+            shards = fetch(node_names, per_node)
+            tasks = newest(shards)
+
+            # A node that filled its share may hold further tasks newer than
+            # the oldest one kept; query those nodes again for the full limit
+            if per_node < limit:
+                cutoff = tasks[-1][1].get("starttime", 0) if len(tasks) >= limit else None
+                short = [
+                    name for name, shard in shards.items()
+                    if len(shard) >= per_node
+                    and (cutoff is None or shard[-1].get("starttime", 0) >= cutoff)
+                ]
+                if short:
+                    shards.update(fetch(short, limit))
+                    tasks = newest(shards)
                     
-                # Get tasks for this node
-                node_tasks = self.proxmox.nodes(node_name).tasks.get(**params)
-                
-                # Add each task to our results
-                for task in node_tasks:
-                    tasks.append({
-                        "upid": task.get("upid", ""),
-                        "type": task.get("type", ""),
-                        "status": task.get("status", ""),
-                        "node": node_name,
-                        "starttime": task.get("starttime", 0),
-                        "endtime": task.get("endtime", 0),
-                        "id": task.get("id", ""),
-                        "user": task.get("user", ""),
-                        "vmid": task.get("vmid", "")
-                    })
-                    
-                    # If we've reached the limit, stop collecting tasks
-                    if len(tasks) >= limit:
-                        break
-                        
-                # If we've reached the limit, stop collecting tasks
-                if len(tasks) >= limit:
-                    break
-                    
-            return self._format_response(tasks, "tasks")
+            return self._format_response([_task_row(name, task) for name, task in tasks], "tasks")
         except Exception as e:
+            # The node list may be stale; refetch it on the next call
+            self.invalidate_nodes()
             self._handle_error("get tasks", e)
 
+    def _guest_node(self, vmid: str) -> Optional[str]:
+        """Find the node currently hosting a VM or container.
+
+        Uses a cached vmid -> node map built from a single cluster/resources
+        query.
+
+        Args:
+            vmid: VM or container ID
+
+        Returns:
+            Node name, or None when unknown or cluster/resources is not
+            permitted for the API token
+        """
+        try:
+            guest_nodes = self._cached(("guest_nodes",), lambda: {
+                str(resource["vmid"]): resource["node"]
+                for resource in self.proxmox.cluster.resources.get(type="vm")
+                if "vmid" in resource
+            })
+        except Exception as e:
+            self.logger.debug(f"cluster/resources unavailable, querying all nodes: {e}")
+            return None
+        return guest_nodes.get(str(vmid))
+
+    def _tasks_resource(self, node_name: str) -> Any:
+        """Get the proxmoxer resource for a node's task list.
+
+        Resources only hold the request path, so one per node is built and
+        reused instead of rebuilding the nodes(name).tasks chain per call.
+
+        Args:
+            node_name: Node name
+
+        Returns:
+            Resource for GET nodes/{node_name}/tasks
+        """
+        resource = self._node_tasks.get(node_name)
+        if resource is None:
+            resource = self._node_tasks.setdefault(node_name, self.proxmox.nodes(node_name).tasks)
+        return resource
+
     def get_task_status(self, upid: str) -> List[Content]:
         """Get detailed status for a specific task.
 
@@ -95,12 +233,18 @@ class TaskTools(ProxmoxTool):
             List of Content objects containing detailed task status
         """
         try:
+            result = self._status_cache.get((upid,))
+            if result is not None:
+                return self._format_response(result, "task_status")
+
             # Parse node from UPID
-            node = upid.split(':')[1]
+            node = _node_from_upid(upid)
             
             # Get task status
             status = self.proxmox.nodes(node).tasks(upid).status.get()
             
+            log = self._get_task_log(node, upid)
+
             # Format the response
             result = {
                 "upid": upid,
@@ -112,28 +256,97 @@ class TaskTools(ProxmoxTool):
                 "starttime": status.get("starttime", 0),
                 "pid": status.get("pid", 0),
                 "progress": status.get("progress", 0),
-                "log": self._get_task_log(node, upid)
+                "log": () if log is None else log
             }
+            # Without its log the entry is incomplete, so only keep it when
+            # the log was fetched
+            if log is not None:
+                self._status_cache.set(
+                    (upid,), result,
+                    STOPPED_STATUS_TTL if result["status"] == "stopped" else None
+                )
                 
             return self._format_response(result, "task_status")
         except Exception as e:
             self._handle_error(f"get task status for {upid}", e)
 
-    def _get_task_log(self, node: str, upid: str) -> List[str]:
+    async def await_task(self, upid: str, timeout: int = 300) -> List[Content]:
+        """Wait for a task to stop, polling its status without blocking.
+
+        Operations such as clones, backups and restores return their UPID as
+        soon as Proxmox accepts them. This polls the task with an interval
+        that doubles from 1s up to 10s, running each API call in a worker
+        thread so the server keeps handling other requests meanwhile.
+
+        Args:
+            upid: Task UPID (Unique Process ID) to wait for
+            timeout: Maximum number of seconds to wait (default: 300)
+
+        Returns:
+            List of Content objects containing the final (or last seen) task status
+        """
+        try:
+            # Parse node from UPID
+            node = _node_from_upid(upid)
+            status = await self._await_task(self.proxmox.nodes(node).tasks(upid), timeout)
+
+            finished = status.get("status") == "stopped"
+            log = await asyncio.to_thread(self._get_task_log, node, upid)
+            result = {
+                "upid": upid,
+                "node": node,
+                "finished": finished,
+                "success": finished and status.get("exitstatus") == "OK",
+                "status": status.get("status", ""),
+                "exitstatus": status.get("exitstatus", ""),
+                "log": () if log is None else log
+            }
+
+            return self._format_response(result, "task_status")
+        except Exception as e:
+            self._handle_error(f"wait for task {upid}", e)
+
+    def _get_task_log(self, node: str, upid: str) -> Optional[Tuple[str, ...]]:
         """Get log entries for a task.
 
+        Only lines not seen by an earlier call are downloaded, using the
+        log endpoint's start offset, so polling a long-running task does
+        not fetch its whole log every time. The offset continues from the
+        line number (n) of the last entry received; the "no content"
+        placeholder Proxmox returns for an empty log is passed through but
+        never cached.
+
         Args:
             node: Node name where the task is running
             upid: Task UPID
 
         Returns:
-            List of log entries
+            Tuple of log entries, shared with the cache so never mutated,
+            or None if the log could not be fetched
         """
         try:
-            log_result = self.proxmox.nodes(node).tasks(upid).log.get()
-            return [entry.get("t", "") for entry in log_result]
-        except Exception:
-            return []
+            start, lines = self._log_cache.get((upid,), (0, ()))
+            log_endpoint = self.proxmox.nodes(node).tasks(upid).log
+            new_lines: List[str] = []
+            while True:
+                entries = log_endpoint.get(start=start, limit=LOG_PAGE_SIZE)
+                if len(entries) == 1 and entries[0].get("t") == _NO_LOG_CONTENT:
+                    # Nothing (new) to read yet
+                    if not lines and not new_lines:
+                        return (_NO_LOG_CONTENT,)
+                    break
+                if entries:
+                    start = entries[-1].get("n", start + len(entries))
+                new_lines.extend(entry.get("t", "") for entry in entries)
+                if len(entries) < LOG_PAGE_SIZE:
+                    break
+            if new_lines:
+                lines += tuple(new_lines)
+            self._log_cache.set((upid,), (start, lines))
+            return lines
+        except Exception as e:
+            self.logger.debug(f"Failed to fetch log for task {upid}: {e}")
+            return None
 
     def cancel_task(self, upid: str) -> List[Content]:
         """Cancel a running task.
@@ -146,10 +359,11 @@ class TaskTools(ProxmoxTool):
         """
         try:
             # Parse node from UPID
-            node = upid.split(':')[1]
+            node = _node_from_upid(upid)
             
             # Cancel the task
             result = self.proxmox.nodes(node).tasks(upid).delete()
+            self._status_cache.invalidate((upid,))
             
             return self._format_response({
                 "success": True,
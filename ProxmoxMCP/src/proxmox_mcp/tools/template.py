@@ -13,9 +13,58 @@ This module provides enhanced tools for managing VM templates:
 These tools enable comprehensive template management through the MCP interface,
 providing essential functionality for systems administrators.
 """
-from typing import Dict, List, Optional, Any
+import re
+from typing import Dict, List, Optional, Any, Tuple
 from mcp.types import TextContent as Content
-from .base import ProxmoxTool
+from .base import ProxmoxTool, proxmox_op
+
+# Guest list fields kept for each template; the rest of each row (usage
+# counters, uptime, tags, ...) is dropped before enrichment
+_TEMPLATE_FIELDS = ("vmid", "name", "node", "status", "maxmem", "maxdisk")
+
+# Config keys of disk and network devices; requiring the index keeps
+# options such as scsihw out of the device lists
+_DISK_KEY_RE = re.compile(r"(?:scsi|ide|sata|virtio)\d+")
+_NET_KEY_RE = re.compile(r"net\d+")
+
+def _config_devices(config: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Split a VM config's disk and network device entries in one pass.
+
+    Args:
+        config: VM configuration dictionary
+
+    Returns:
+        Tuple of (disks, networks) dictionaries keyed by config key
+    """
+    disks, networks = {}, {}
+    for key, value in config.items():
+        if _DISK_KEY_RE.fullmatch(key):
+            disks[key] = value
+        elif _NET_KEY_RE.fullmatch(key):
+            networks[key] = value
+    return disks, networks
+
+def _config_changes(config: Dict[str, Any], params: Dict[str, Any]) -> Dict[str, Any]:
+    """Get the parameters whose values differ from a VM config.
+
+    Values are compared as strings, since the API returns some numeric
+    options (e.g. memory) as strings.
+
+    Args:
+        config: Current VM configuration
+        params: Requested configuration values
+
+    Returns:
+        Dictionary with the requested values that would change the config
+    """
+    return {
+        key: value for key, value in params.items()
+        if key not in config or str(config[key]) != str(value)
+    }
+
+def _template_entry(vm: Dict[str, Any]) -> Dict[str, Any]:
+    """Project a guest list row onto the fields used for templates."""
+    return {key: vm[key] for key in _TEMPLATE_FIELDS if key in vm}
 
 class TemplateTools(ProxmoxTool):
     """Tools for managing Proxmox VM templates.
@@ -41,59 +90,106 @@ class TemplateTools(ProxmoxTool):
         """
         super().__init__(proxmox_api)
 
+    @proxmox_op("get templates")
     def get_templates(self) -> List[Content]:
         """Get all VM templates across the cluster with detailed information.
 
+        Uses a single cluster/resources query, which already carries each
+        guest's node and template flag. Falls back to listing every node's
+        VMs when that endpoint is not permitted for the API token.
+
         Returns:
             List of Content objects containing template information
         """
         try:
-            # Get all nodes in the cluster
-            nodes = self.proxmox.nodes.get()
-            templates = []
-
-            # Iterate through each node to find templates
-            for node in nodes:
-                node_name = node['node']
-                try:
-                    # Get all VMs on the node
-                    node_vms = self.proxmox.nodes(node_name).qemu.get()
-                    
-                    # Filter for templates (template=1)
-                    node_templates = [vm for vm in node_vms if vm.get('template') == 1]
-                    
-                    # Add node information to each template
-                    for template in node_templates:
-                        template['node'] = node_name
-                        
-                        # Get additional template details
-                        try:
-                            vmid = template.get('vmid')
-                            if vmid:
-                                # Get config for additional details
-                                config = self.proxmox.nodes(node_name).qemu(vmid).config.get()
-                                template['description'] = config.get('description', 'No description')
-                                template['cores'] = config.get('cores', 'N/A')
-                                template['memory'] = config.get('memory', 'N/A')
-                                template['os_type'] = config.get('ostype', 'N/A')
-                                
-                                # Get disk information
-                                disks = {}
-                                for key, value in config.items():
-                                    if key.startswith('scsi') or key.startswith('ide') or key.startswith('sata'):
-                                        disks[key] = value
-                                template['disks'] = disks
-                        except Exception as e:
-                            self.logger.warning(f"Could not get detailed info for template {vmid}: {e}")
-                    
-                    templates.extend(node_templates)
-                except Exception as e:
-                    self.logger.warning(f"Could not get templates for node {node_name}: {e}")
+            templates = [
+                _template_entry(resource)
+                for resource in self.proxmox.cluster.resources.get(type="vm")
+                if resource.get("template") == 1 and resource.get("type") == "qemu"
+            ]
+        except Exception as e:
+            self.logger.debug(f"cluster/resources unavailable, querying nodes: {e}")
+            templates = self._get_templates_per_node()
+
+        # Get additional details for all templates concurrently
+        self._map_concurrent(self._enrich_template, templates)
+        
+        return self._format_response(templates, "vm_templates")
+
+    def _get_templates_per_node(self) -> List[Dict[str, Any]]:
+        """List templates by querying every node concurrently.
+
+        Returns:
+            List of template dictionaries annotated with their node
+        """
+        # Get all nodes in the cluster
+        nodes = self._get_nodes_cached()
+
+        def node_templates(node):
+            node_name = node['node']
+            try:
+                # Get all VMs on the node
+                node_vms = self.proxmox.nodes(node_name).qemu.get()
+            except Exception as e:
+                self.logger.warning(f"Could not get templates for node {node_name}: {e}")
+                self.invalidate_nodes()
+                return []
             
-            return self._format_response(templates, "vm_templates")
+            # Filter for templates (template=1), adding node information
+            node_templates = [_template_entry(vm) for vm in node_vms if vm.get('template') == 1]
+            for template in node_templates:
+                template['node'] = node_name
+            return node_templates
+
+        # Find templates on all nodes concurrently
+        return [
+            template
+            for node_result in self._map_concurrent(node_templates, nodes)
+            for template in node_result
+        ]
+
+    def _enrich_template(self, template: Dict[str, Any]) -> None:
+        """Add configuration details to a template entry in place.
+
+        Failures are logged and leave the entry without details.
+
+        Args:
+            template: Template entry from a node's VM list, with its node
+        """
+        vmid = template.get('vmid')
+        try:
+            if vmid:
+                # Get config for additional details
+                config = self._vm_config(template['node'], vmid)
+                template['description'] = config.get('description', 'No description')
+                template['cores'] = config.get('cores', 'N/A')
+                template['memory'] = config.get('memory', 'N/A')
+                template['os_type'] = config.get('ostype', 'N/A')
+                
+                # Get disk information
+                template['disks'] = _config_devices(config)[0]
         except Exception as e:
-            self._handle_error("get templates", e)
+            self.logger.warning(f"Could not get detailed info for template {vmid}: {e}")
+
+    def _not_template(self, vmid: str) -> List[Content]:
+        """Format the refusal for an operation on a VM that is not a template.
+
+        The template check reads the config through _vm_config(), so it is
+        free after get_templates() or get_template_details() has seen the
+        VM.
 
+        Args:
+            vmid: VM ID number
+
+        Returns:
+            List of Content objects containing the failed operation result
+        """
+        return self._format_response({
+            "success": False,
+            "message": f"VM {vmid} is not a template"
+        }, "template_operation")
+
+    @proxmox_op("create template from VM {vmid}")
     def create_template(self, node: str, vmid: str, name: Optional[str] = None, 
                        description: Optional[str] = None) -> List[Content]:
         """Convert an existing VM into a template.
@@ -107,40 +203,29 @@ class TemplateTools(ProxmoxTool):
         Returns:
             List of Content objects containing operation result
         """
-        try:
-            # First, ensure the VM is stopped
-            vm_status = self.proxmox.nodes(node).qemu(vmid).status.current.get()
-            if vm_status.get('status') != 'stopped':
-                return self._format_response({
-                    "success": False,
-                    "message": f"VM {vmid} must be stopped before converting to template. Current status: {vm_status.get('status')}"
-                }, "template_operation")
-            
-            # Update config to convert to template
-            params = {"template": 1}
-            
-            # Add optional parameters if provided
-            if name or description:
-                # Get additional parameters in a separate request
-                update_params = {}
-                if name:
-                    update_params["name"] = name
-                if description:
-                    update_params["description"] = description
-                
-                # Update VM config with name/description first
-                self.proxmox.nodes(node).qemu(vmid).config.put(**update_params)
-            
-            # Convert to template
-            self.proxmox.nodes(node).qemu(vmid).config.put(**params)
-            
+        vm = self.proxmox.nodes(node).qemu(vmid)
+
+        # First, ensure the VM is stopped
+        vm_status = vm.status.current.get()
+        if vm_status.get('status') != 'stopped':
             return self._format_response({
-                "success": True,
-                "message": f"VM {vmid} successfully converted to template"
+                "success": False,
+                "message": f"VM {vmid} must be stopped before converting to template. Current status: {vm_status.get('status')}"
             }, "template_operation")
-        except Exception as e:
-            self._handle_error(f"create template from VM {vmid}", e)
+        
+        # Convert to template, setting the optional name and description
+        # in the same request
+        params = {"template": 1}
+        if name:
+            params["name"] = name
+        if description:
+            params["description"] = description
+        vm.config.put(**params)
+        self._invalidate_vm(node, vmid)
+        
+        return self._task_response("template_operation", f"VM {vmid} successfully converted to template")
 
+    @proxmox_op("clone template {template_vmid}")
     def clone_template(self, node: str, template_vmid: str, name: str, 
                       target_node: Optional[str] = None, 
                       target_vmid: Optional[str] = None,
@@ -162,43 +247,30 @@ class TemplateTools(ProxmoxTool):
         Returns:
             List of Content objects containing operation result
         """
-        try:
-            # Prepare clone parameters
-            params = {
-                "name": name,
-                "full": 1 if full_clone else 0
-            }
-            
-            # Add optional parameters if provided
-            if target_node:
-                params["target"] = target_node
-            if target_vmid:
-                params["newid"] = target_vmid
-            if target_storage:
-                params["storage"] = target_storage
-            
-            # Clone the template
-            result = self.proxmox.nodes(node).qemu(template_vmid).clone.post(**params)
-            
-            # Get the new VM ID from the result
-            task_id = result
-            
-            # If description is provided, update it after cloning
-            if description and target_vmid:
-                try:
-                    target_node_name = target_node if target_node else node
-                    self.proxmox.nodes(target_node_name).qemu(target_vmid).config.put(description=description)
-                except Exception as e:
-                    self.logger.warning(f"Could not update description for cloned VM: {e}")
-            
-            return self._format_response({
-                "success": True,
-                "task_id": task_id,
-                "message": f"Template {template_vmid} clone initiated with name '{name}'"
-            }, "template_clone")
-        except Exception as e:
-            self._handle_error(f"clone template {template_vmid}", e)
+        # Prepare clone parameters
+        params = {
+            "name": name,
+            "full": 1 if full_clone else 0
+        }
+        
+        # Add optional parameters if provided
+        if target_node:
+            params["target"] = target_node
+        if target_vmid:
+            params["newid"] = target_vmid
+        if target_storage:
+            params["storage"] = target_storage
+        # The clone call sets the description itself, so there is no need
+        # to wait for the (possibly long) clone task before configuring it
+        if description:
+            params["description"] = description
+        
+        # Clone the template; the result is the clone task's UPID
+        task_id = self.proxmox.nodes(node).qemu(template_vmid).clone.post(**params)
+        
+        return self._task_response("template_clone", f"Template {template_vmid} clone initiated with name '{name}'", task_id)
 
+    @proxmox_op("update template {vmid}")
     def update_template(self, node: str, vmid: str, name: Optional[str] = None,
                        description: Optional[str] = None, 
                        cores: Optional[int] = None,
@@ -216,43 +288,46 @@ class TemplateTools(ProxmoxTool):
         Returns:
             List of Content objects containing operation result
         """
-        try:
-            # Verify this is actually a template
-            vm_config = self.proxmox.nodes(node).qemu(vmid).config.get()
-            if vm_config.get('template') != 1:
-                return self._format_response({
-                    "success": False,
-                    "message": f"VM {vmid} is not a template"
-                }, "template_operation")
-            
-            # Prepare update parameters
-            params = {}
-            if name:
-                params["name"] = name
-            if description:
-                params["description"] = description
-            if cores:
-                params["cores"] = cores
-            if memory:
-                params["memory"] = memory
-            
-            # No parameters provided
-            if not params:
-                return self._format_response({
-                    "success": False,
-                    "message": "No update parameters provided"
-                }, "template_operation")
-            
-            # Update template config
-            self.proxmox.nodes(node).qemu(vmid).config.put(**params)
-            
+        # Prepare update parameters
+        params = {}
+        if name:
+            params["name"] = name
+        if description:
+            params["description"] = description
+        if cores:
+            params["cores"] = cores
+        if memory:
+            params["memory"] = memory
+        
+        # No parameters provided
+        if not params:
             return self._format_response({
-                "success": True,
-                "message": f"Template {vmid} successfully updated"
+                "success": False,
+                "message": "No update parameters provided"
             }, "template_operation")
-        except Exception as e:
-            self._handle_error(f"update template {vmid}", e)
+        
+        # Verify this is actually a template
+        vm_config = self._vm_config(node, vmid)
+        if vm_config.get('template') != 1:
+            return self._not_template(vmid)
+        
+        # Only send values that differ from the current config; before
+        # skipping the update, confirm against a fresh copy in case the
+        # cached one is out of date
+        changes = _config_changes(vm_config, params)
+        if not changes:
+            self._invalidate_vm(node, vmid)
+            changes = _config_changes(self._vm_config(node, vmid), params)
+            if not changes:
+                return self._task_response("template_operation", f"Template {vmid} already up to date")
+        
+        # Update template config
+        self.proxmox.nodes(node).qemu(vmid).config.put(**changes)
+        self._invalidate_vm(node, vmid)
+        
+        return self._task_response("template_operation", f"Template {vmid} successfully updated")
 
+    @proxmox_op("delete template {vmid}")
     def delete_template(self, node: str, vmid: str) -> List[Content]:
         """Delete a template.
 
@@ -263,26 +338,21 @@ class TemplateTools(ProxmoxTool):
         Returns:
             List of Content objects containing operation result
         """
-        try:
-            # Verify this is actually a template
-            vm_config = self.proxmox.nodes(node).qemu(vmid).config.get()
-            if vm_config.get('template') != 1:
-                return self._format_response({
-                    "success": False,
-                    "message": f"VM {vmid} is not a template"
-                }, "template_operation")
-            
-            # Delete the template
-            result = self.proxmox.nodes(node).qemu(vmid).delete()
-            
-            return self._format_response({
-                "success": True,
-                "task_id": result,
-                "message": f"Template {vmid} deletion initiated"
-            }, "template_operation")
-        except Exception as e:
-            self._handle_error(f"delete template {vmid}", e)
+        # Verify this is actually a template. The deletion cannot be undone,
+        # so check a fresh config rather than one cached for up to
+        # CONFIG_CACHE_TTL, in which the VMID may have been reused
+        self._invalidate_vm(node, vmid)
+        vm_config = self._vm_config(node, vmid)
+        if vm_config.get('template') != 1:
+            return self._not_template(vmid)
+        
+        # Delete the template
+        result = self.proxmox.nodes(node).qemu(vmid).delete()
+        self._invalidate_vm(node, vmid)
+        
+        return self._task_response("template_operation", f"Template {vmid} deletion initiated", result)
 
+    @proxmox_op("import template from {url}")
     def import_template(self, node: str, storage: str, url: str, 
                        format: Optional[str] = None) -> List[Content]:
         """Import a template from a URL.
@@ -296,29 +366,23 @@ class TemplateTools(ProxmoxTool):
         Returns:
             List of Content objects containing operation result
         """
-        try:
-            # Prepare import parameters
-            params = {
-                "content": "vztmpl",
-                "storage": storage,
-                "url": url
-            }
-            
-            # Add optional parameters if provided
-            if format:
-                params["format"] = format
-            
-            # Import the template
-            result = self.proxmox.nodes(node).storage(storage).download_url.post(**params)
-            
-            return self._format_response({
-                "success": True,
-                "task_id": result,
-                "message": f"Template import from {url} initiated"
-            }, "template_operation")
-        except Exception as e:
-            self._handle_error(f"import template from {url}", e)
+        # Prepare import parameters
+        params = {
+            "content": "vztmpl",
+            "storage": storage,
+            "url": url
+        }
+        
+        # Add optional parameters if provided
+        if format:
+            params["format"] = format
+        
+        # Import the template
+        result = self.proxmox.nodes(node).storage(storage).download_url.post(**params)
+        
+        return self._task_response("template_operation", f"Template import from {url} initiated", result)
 
+    @proxmox_op("get template details for {vmid}")
     def get_template_details(self, node: str, vmid: str) -> List[Content]:
         """Get detailed information about a specific template.
 
@@ -329,45 +393,26 @@ class TemplateTools(ProxmoxTool):
         Returns:
             List of Content objects containing template details
         """
-        try:
-            # Get basic VM information
-            vm_info = self.proxmox.nodes(node).qemu(vmid).get()
-            
-            # Verify this is actually a template
-            if vm_info.get('template') != 1:
-                return self._format_response({
-                    "success": False,
-                    "message": f"VM {vmid} is not a template"
-                }, "template_operation")
-            
-            # Get detailed configuration
-            config = self.proxmox.nodes(node).qemu(vmid).config.get()
-            
-            # Combine information
-            template_details = {
-                "vmid": vmid,
-                "node": node,
-                "name": vm_info.get('name', f"vm-{vmid}"),
-                "description": config.get('description', 'No description'),
-                "cores": config.get('cores', 'N/A'),
-                "memory": config.get('memory', 'N/A'),
-                "os_type": config.get('ostype', 'N/A')
-            }
-            
-            # Get disk information
-            disks = {}
-            for key, value in config.items():
-                if key.startswith('scsi') or key.startswith('ide') or key.startswith('sata'):
-                    disks[key] = value
-            template_details['disks'] = disks
-            
-            # Get network information
-            networks = {}
-            for key, value in config.items():
-                if key.startswith('net'):
-                    networks[key] = value
-            template_details['networks'] = networks
-            
-            return self._format_response(template_details, "template_details")
-        except Exception as e:
-            self._handle_error(f"get template details for {vmid}", e)
+        # The config carries the template flag and name as well, so one
+        # request covers both the check and the details
+        config = self._vm_config(node, vmid)
+        
+        # Verify this is actually a template
+        if config.get('template') != 1:
+            return self._not_template(vmid)
+        
+        # Combine information
+        template_details = {
+            "vmid": vmid,
+            "node": node,
+            "name": config.get('name', f"vm-{vmid}"),
+            "description": config.get('description', 'No description'),
+            "cores": config.get('cores', 'N/A'),
+            "memory": config.get('memory', 'N/A'),
+            "os_type": config.get('ostype', 'N/A')
+        }
+        
+        # Get disk and network information
+        template_details['disks'], template_details['networks'] = _config_devices(config)
+        
+        return self._format_response(template_details, "template_details")
@@ -16,7 +16,6 @@ detailed VM information might be temporarily unavailable.
 from typing import List
 from mcp.types import TextContent as Content
 from .base import ProxmoxTool
-from .definitions import GET_VMS_DESC, EXECUTE_VM_COMMAND_DESC
 from .console.manager import VMConsoleManager
 
 class VMTools(ProxmoxTool):
@@ -74,41 +73,44 @@ class VMTools(ProxmoxTool):
             RuntimeError: If the cluster-wide VM query fails
         """
         try:
-            result = []
-            for node in self.proxmox.nodes.get():
-                node_name = node["node"]
-                vms = self.proxmox.nodes(node_name).qemu.get()
-                for vm in vms:
-                    vmid = vm["vmid"]
-                    # Get VM config for CPU cores
-                    try:
-                        config = self.proxmox.nodes(node_name).qemu(vmid).config.get()
-                        result.append({
-                            "vmid": vmid,
-                            "name": vm["name"],
-                            "status": vm["status"],
-                            "node": node_name,
-                            "cpus": config.get("cores", "N/A"),
-                            "memory": {
-                                "used": vm.get("mem", 0),
-                                "total": vm.get("maxmem", 0)
-                            }
-                        })
-                    except Exception:
-                        # Fallback if can't get config
-                        result.append({
-                            "vmid": vmid,
-                            "name": vm["name"],
-                            "status": vm["status"],
-                            "node": node_name,
-                            "cpus": "N/A",
-                            "memory": {
-                                "used": vm.get("mem", 0),
-                                "total": vm.get("maxmem", 0)
-                            }
-                        })
+            # List VMs on all nodes concurrently
+            node_names = [node["node"] for node in self._get_nodes_cached()]
+            node_vms = self._map_concurrent(
+                lambda node_name: self.proxmox.nodes(node_name).qemu.get(), node_names
+            )
+
+            def vm_info(item):
+                node_name, vm = item
+                vmid = vm["vmid"]
+                # Get VM config for CPU cores
+                try:
+                    config = self._vm_config(node_name, vmid)
+                    cpus = config.get("cores", "N/A")
+                except Exception:
+                    # Fallback if can't get config
+                    cpus = "N/A"
+                return {
+                    "vmid": vmid,
+                    "name": vm["name"],
+                    "status": vm["status"],
+                    "node": node_name,
+                    "cpus": cpus,
+                    "memory": {
+                        "used": vm.get("mem", 0),
+                        "total": vm.get("maxmem", 0)
+                    }
+                }
+
+            # Fetch every VM's config concurrently
+            result = self._map_concurrent(vm_info, [
+                (node_name, vm)
+                for node_name, vms in zip(node_names, node_vms)
+                for vm in vms
+            ])
             return self._format_response(result, "vms")
         except Exception as e:
+            # The node list may be stale; refetch it on the next call
+            self.invalidate_nodes()
             self._handle_error("get VMs", e)
 
     async def execute_command(self, node: str, vmid: str, command: str) -> List[Content]:
@@ -14,7 +14,7 @@ providing essential functionality for systems administrators.
 """
 from typing import Dict, List, Optional, Any
 from mcp.types import TextContent as Content
-from .base import ProxmoxTool
+from .base import ProxmoxTool, proxmox_op
 
 class VMLifecycleTools(ProxmoxTool):
     """Tools for managing VM lifecycle operations.
@@ -29,6 +29,7 @@ class VMLifecycleTools(ProxmoxTool):
     Essential for day-to-day VM administration and management tasks.
     """
 
+    @proxmox_op("start VM {vmid}")
     def start_vm(self, node: str, vmid: str) -> List[Content]:
         """Start a virtual machine.
 
@@ -39,16 +40,11 @@ class VMLifecycleTools(ProxmoxTool):
         Returns:
             List of Content objects containing operation result
         """
-        try:
-            result = self.proxmox.nodes(node).qemu(vmid).status.start.post()
-            return self._format_response({
-                "success": True,
-                "task_id": result.get("data"),
-                "message": f"VM {vmid} start initiated"
-            }, "vm_operation")
-        except Exception as e:
-            self._handle_error(f"start VM {vmid}", e)
+        result = self.proxmox.nodes(node).qemu(vmid).status.start.post()
+        self._invalidate_vm(node, vmid)
+        return self._task_response("vm_operation", f"VM {vmid} start initiated", result.get("data"))
 
+    @proxmox_op("stop VM {vmid}")
     def stop_vm(self, node: str, vmid: str) -> List[Content]:
         """Stop a virtual machine.
 
@@ -59,16 +55,11 @@ class VMLifecycleTools(ProxmoxTool):
         Returns:
             List of Content objects containing operation result
         """
-        try:
-            result = self.proxmox.nodes(node).qemu(vmid).status.stop.post()
-            return self._format_response({
-                "success": True,
-                "task_id": result.get("data"),
-                "message": f"VM {vmid} stop initiated"
-            }, "vm_operation")
-        except Exception as e:
-            self._handle_error(f"stop VM {vmid}", e)
+        result = self.proxmox.nodes(node).qemu(vmid).status.stop.post()
+        self._invalidate_vm(node, vmid)
+        return self._task_response("vm_operation", f"VM {vmid} stop initiated", result.get("data"))
 
+    @proxmox_op("reboot VM {vmid}")
     def reboot_vm(self, node: str, vmid: str) -> List[Content]:
         """Reboot a virtual machine.
 
@@ -79,16 +70,11 @@ class VMLifecycleTools(ProxmoxTool):
         Returns:
             List of Content objects containing operation result
         """
-        try:
-            result = self.proxmox.nodes(node).qemu(vmid).status.reboot.post()
-            return self._format_response({
-                "success": True,
-                "task_id": result.get("data"),
-                "message": f"VM {vmid} reboot initiated"
-            }, "vm_operation")
-        except Exception as e:
-            self._handle_error(f"reboot VM {vmid}", e)
+        result = self.proxmox.nodes(node).qemu(vmid).status.reboot.post()
+        self._invalidate_vm(node, vmid)
+        return self._task_response("vm_operation", f"VM {vmid} reboot initiated", result.get("data"))
 
+    @proxmox_op("create snapshot for VM {vmid}")
     def create_vm_snapshot(self, node: str, vmid: str, name: str, description: Optional[str] = None) -> List[Content]:
         """Create a snapshot of a virtual machine.
 
@@ -101,20 +87,14 @@ class VMLifecycleTools(ProxmoxTool):
         Returns:
             List of Content objects containing operation result
         """
-        try:
-            params = {"snapname": name}
-            if description:
-                params["description"] = description
-                
-            result = self.proxmox.nodes(node).qemu(vmid).snapshot.post(**params)
-            return self._format_response({
-                "success": True,
-                "task_id": result.get("data"),
-                "message": f"Snapshot '{name}' creation initiated for VM {vmid}"
-            }, "vm_snapshot")
-        except Exception as e:
-            self._handle_error(f"create snapshot for VM {vmid}", e)
+        params = {"snapname": name}
+        if description:
+            params["description"] = description
+            
+        result = self.proxmox.nodes(node).qemu(vmid).snapshot.post(**params)
+        return self._task_response("vm_snapshot", f"Snapshot '{name}' creation initiated for VM {vmid}", result.get("data"))
 
+    @proxmox_op("list snapshots for VM {vmid}")
     def list_vm_snapshots(self, node: str, vmid: str) -> List[Content]:
         """List all snapshots for a virtual machine.
 
@@ -125,22 +105,20 @@ class VMLifecycleTools(ProxmoxTool):
         Returns:
             List of Content objects containing snapshot information
         """
-        try:
-            result = self.proxmox.nodes(node).qemu(vmid).snapshot.get()
-            snapshots = []
+        result = self.proxmox.nodes(node).qemu(vmid).snapshot.get()
+        snapshots = [
+            {
+                "name": snapshot.get("name"),
+                "description": snapshot.get("description", ""),
+                "creation_time": snapshot.get("snaptime", 0),
+                "parent": snapshot.get("parent", "")
+            }
+            for snapshot in result
+        ]
             
-            for snapshot in result:
-                snapshots.append({
-                    "name": snapshot.get("name"),
-                    "description": snapshot.get("description", ""),
-                    "creation_time": snapshot.get("snaptime", 0),
-                    "parent": snapshot.get("parent", "")
-                })
-                
-            return self._format_response(snapshots, "vm_snapshots")
-        except Exception as e:
-            self._handle_error(f"list snapshots for VM {vmid}", e)
+        return self._format_response(snapshots, "vm_snapshots")
 
+    @proxmox_op("restore VM {vmid} to snapshot '{snapshot_name}'")
     def restore_vm_snapshot(self, node: str, vmid: str, snapshot_name: str) -> List[Content]:
         """Restore a virtual machine from a snapshot.
 
@@ -152,16 +130,11 @@ class VMLifecycleTools(ProxmoxTool):
         Returns:
             List of Content objects containing operation result
         """
-        try:
-            result = self.proxmox.nodes(node).qemu(vmid).snapshot(snapshot_name).rollback.post()
-            return self._format_response({
-                "success": True,
-                "task_id": result.get("data"),
-                "message": f"VM {vmid} restore to snapshot '{snapshot_name}' initiated"
-            }, "vm_snapshot_restore")
-        except Exception as e:
-            self._handle_error(f"restore VM {vmid} to snapshot '{snapshot_name}'", e)
+        result = self.proxmox.nodes(node).qemu(vmid).snapshot(snapshot_name).rollback.post()
+        self._invalidate_vm(node, vmid)
+        return self._task_response("vm_snapshot_restore", f"VM {vmid} restore to snapshot '{snapshot_name}' initiated", result.get("data"))
 
+    @proxmox_op("clone VM {vmid} to {target_vmid}")
     def clone_vm(self, node: str, vmid: str, target_vmid: str, target_node: Optional[str] = None, name: Optional[str] = None) -> List[Content]:
         """Clone a virtual machine.
 
@@ -175,60 +148,60 @@ class VMLifecycleTools(ProxmoxTool):
         Returns:
             List of Content objects containing operation result
         """
-        try:
-            params = {"newid": target_vmid}
-            if target_node:
-                params["target"] = target_node
-            if name:
-                params["name"] = name
-                
-            result = self.proxmox.nodes(node).qemu(vmid).clone.post(**params)
-            return self._format_response({
-                "success": True,
-                "task_id": result.get("data"),
-                "message": f"VM {vmid} clone to {target_vmid} initiated"
-            }, "vm_clone")
-        except Exception as e:
-            self._handle_error(f"clone VM {vmid} to {target_vmid}", e)
-
-    def get_vm_performance(self, node: str, vmid: str) -> List[Content]:
+        params = {"newid": target_vmid}
+        if target_node:
+            params["target"] = target_node
+        if name:
+            params["name"] = name
+            
+        result = self.proxmox.nodes(node).qemu(vmid).clone.post(**params)
+        return self._task_response("vm_clone", f"VM {vmid} clone to {target_vmid} initiated", result.get("data"))
+
+    @proxmox_op("get performance metrics for VM {vmid}")
+    def get_vm_performance(self, node: str, vmid: str, include_history: bool = False) -> List[Content]:
         """Get performance metrics for a virtual machine.
 
         Args:
             node: Host node name (e.g., 'pve1', 'proxmox-node2')
             vmid: VM ID number (e.g., '100', '101')
+            include_history: Whether to add the last hour of RRD data; it is
+                             skipped by default to save a request and a
+                             large payload
 
         Returns:
             List of Content objects containing performance metrics
         """
-        try:
-            # Get current VM status for basic metrics
-            status = self.proxmox.nodes(node).qemu(vmid).status.current.get()
-            
+        vm = self.proxmox.nodes(node).qemu(vmid)
+
+        def get_rrd_data():
             # Get RRD data for historical metrics if available
             try:
-                rrd_data = self.proxmox.nodes(node).qemu(vmid).rrddata.get(timeframe="hour")
+                return vm.rrddata.get(timeframe="hour")
             except Exception:
-                rrd_data = []
-                
-            # Compile performance metrics
-            metrics = {
-                "cpu_usage": status.get("cpu", 0),
-                "memory": {
-                    "used": status.get("mem", 0),
-                    "total": status.get("maxmem", 0)
-                },
-                "disk_io": {
-                    "read_bytes": status.get("diskread", 0),
-                    "write_bytes": status.get("diskwrite", 0)
-                },
-                "network": {
-                    "in_bytes": status.get("netin", 0),
-                    "out_bytes": status.get("netout", 0)
-                },
-                "historical": rrd_data
-            }
-                
-            return self._format_response(metrics, "vm_performance")
-        except Exception as e:
-            self._handle_error(f"get performance metrics for VM {vmid}", e)
+                return []
+        
+        if include_history:
+            # Get current VM status for basic metrics alongside the RRD data
+            status, rrd_data = self._parallel(vm.status.current.get, get_rrd_data)
+        else:
+            status, rrd_data = vm.status.current.get(), None
+            
+        # Compile performance metrics
+        metrics = {
+            "cpu_usage": status.get("cpu", 0),
+            "memory": {
+                "used": status.get("mem", 0),
+                "total": status.get("maxmem", 0)
+            },
+            "disk_io": {
+                "read_bytes": status.get("diskread", 0),
+                "write_bytes": status.get("diskwrite", 0)
+            },
+            "network": {
+                "in_bytes": status.get("netin", 0),
+                "out_bytes": status.get("netout", 0)
+            },
+            "historical": rrd_data
+        }
+            
+        return self._format_response(metrics, "vm_performance")
@@ -0,0 +1,33 @@
+"""
+Tests for the backup tools.
+"""
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+from proxmox_mcp.tools.backup import BackupTools
+
+
+@pytest.fixture
+def backup_tools():
+    """Fixture to create BackupTools whose listing yields ten backups."""
+    tools = BackupTools(MagicMock())
+    backups = [{"filename": f"backup-{i}", "timestamp": i} for i in (3, 7, 1, 9, 5, 0, 8, 2, 6, 4)]
+    tools._iter_backups = lambda storage, vmid: iter(backups)
+    return tools
+
+def test_list_backups_returns_newest_under_limit(backup_tools):
+    """Test that a limit keeps the newest backups and reports the total."""
+    response = backup_tools.list_backups(limit=3)
+
+    assert [backup["timestamp"] for backup in json.loads(response[0].text)] == [9, 8, 7]
+    assert response[1].text == "Showing the newest 3 of 10 backups (limit 3)"
+
+def test_list_backups_within_limit_is_a_plain_array(backup_tools):
+    """Test that an untruncated listing is a single array, newest first."""
+    response = backup_tools.list_backups(limit=20)
+
+    assert len(response) == 1
+    timestamps = [backup["timestamp"] for backup in json.loads(response[0].text)]
+    assert timestamps == list(range(9, -1, -1))
@@ -0,0 +1,96 @@
+"""
+Tests for the TTL result cache.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from proxmox_mcp.core.cache import TTLCache
+
+
+@pytest.fixture
+def clock():
+    """Fixture to control the time seen by the cache."""
+    with patch("proxmox_mcp.core.cache.time") as mock_time:
+        mock_time.monotonic.return_value = 1000.0
+        yield mock_time.monotonic
+
+def test_get_returns_value_until_expiry(clock):
+    """Test that entries are served until their TTL has passed."""
+    cache = TTLCache(ttl=10)
+    cache.set("key", "value")
+
+    clock.return_value = 1009.9
+    assert cache.get("key") == "value"
+
+    clock.return_value = 1010.0
+    assert cache.get("key") is None
+    assert cache.get("key", "default") == "default"
+
+def test_per_entry_ttl_overrides_default(clock):
+    """Test that an entry's own TTL replaces the cache TTL."""
+    cache = TTLCache(ttl=10)
+    cache.set("short", 1, ttl=1)
+    cache.set("forever", 2, ttl=float("inf"))
+
+    clock.return_value = 1005.0
+    assert cache.get("short") is None
+    assert cache.get("forever") == 2
+
+def test_full_cache_evicts_oldest_entry(clock):
+    """Test that storing into a full cache evicts the oldest entry."""
+    cache = TTLCache(ttl=10, maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    assert cache.get("c") == 3
+
+def test_full_cache_evicts_expired_entries_first(clock):
+    """Test that expired entries are evicted before live ones."""
+    cache = TTLCache(ttl=10, maxsize=2)
+    cache.set("old", 1)
+    cache.set("short", 2, ttl=1)
+
+    clock.return_value = 1002.0
+    cache.set("new", 3)
+
+    assert cache.get("old") == 1
+    assert cache.get("new") == 3
+    assert cache.stats()["size"] == 2
+
+def test_updating_key_does_not_evict(clock):
+    """Test that overwriting an existing key in a full cache keeps the others."""
+    cache = TTLCache(ttl=10, maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("a", 3)
+
+    assert cache.get("a") == 3
+    assert cache.get("b") == 2
+
+def test_invalidate_drops_matching_prefix(clock):
+    """Test that invalidate only drops tuple keys with the given prefix."""
+    cache = TTLCache(ttl=10)
+    cache.set(("config", "pve1", "100"), 1)
+    cache.set(("config", "pve2", "100"), 2)
+    cache.set("config", 3)
+
+    cache.invalidate(("config", "pve1"))
+
+    assert cache.get(("config", "pve1", "100")) is None
+    assert cache.get(("config", "pve2", "100")) == 2
+    assert cache.get("config") == 3
+
+def test_stats_count_hits_and_misses(clock):
+    """Test hit and miss counters."""
+    cache = TTLCache(ttl=10)
+    cache.set("key", "value")
+    cache.get("key")
+    cache.get("missing")
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
@@ -0,0 +1,68 @@
+"""
+Tests for the container tools.
+"""
+
+import asyncio
+import json
+from unittest.mock import MagicMock
+
+import pytest
+from proxmox_mcp.tools.container import ContainerTools
+
+
+@pytest.fixture
+def container_tools():
+    """Fixture to create ContainerTools on a mocked API."""
+    return ContainerTools(MagicMock())
+
+@pytest.mark.asyncio
+async def test_execute_commands_keeps_order(container_tools):
+    """Test that results are returned in command order, whatever order they finish in."""
+    async def run_command(node, vmid, command):
+        await asyncio.sleep(0.01 if command == "slow" else 0)
+        return {"success": True, "output": command, "exit_code": 0}
+
+    container_tools._run_command = run_command
+    response = await container_tools.execute_commands("node1", "100", ["slow", "fast"])
+    results = json.loads(response[0].text)
+
+    assert [result["command"] for result in results] == ["slow", "fast"]
+    assert [result["output"] for result in results] == ["slow", "fast"]
+
+@pytest.mark.asyncio
+async def test_execute_commands_isolates_failures(container_tools):
+    """Test that a failing command is reported without stopping the others."""
+    async def run_command(node, vmid, command):
+        if command == "bad":
+            raise RuntimeError("agent not running")
+        return {"success": True, "output": "ok", "exit_code": 0}
+
+    container_tools._run_command = run_command
+    response = await container_tools.execute_commands("node1", "100", ["good", "bad"])
+    results = json.loads(response[0].text)
+
+    assert results[0]["success"] is True
+    assert results[1] == {
+        "command": "bad", "success": False, "output": "agent not running", "exit_code": 1
+    }
+
+@pytest.mark.asyncio
+async def test_execute_commands_limits_concurrency(container_tools):
+    """Test that no more than `concurrency` commands run at once."""
+    running = 0
+    peak = 0
+
+    async def run_command(node, vmid, command):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return {"success": True, "output": "", "exit_code": 0}
+
+    container_tools._run_command = run_command
+    await container_tools.execute_commands(
+        "node1", "100", [str(i) for i in range(6)], concurrency=2
+    )
+
+    assert peak == 2
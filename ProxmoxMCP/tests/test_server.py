@@ -4,6 +4,9 @@ Tests for the Proxmox MCP server.
 
 import os
 import json
+import signal
+import subprocess
+import sys
 import pytest
 from unittest.mock import Mock, patch
 
@@ -222,3 +225,48 @@ async def test_execute_vm_command_with_error(server, mock_proxmox):
     assert result["output"] == ""
     assert result["error"] == "command not found"
     assert result["exit_code"] == 1
+
+_SHUTDOWN_SCRIPT = """
+import sys
+from unittest.mock import patch
+
+from proxmox_mcp import server
+
+server.SHUTDOWN_GRACE = 0.5
+with patch("proxmox_mcp.core.proxmox.ProxmoxAPI"):
+    instance = server.ProxmoxMCPServer(sys.argv[1])
+instance.start()
+"""
+
+@pytest.mark.skipif(sys.platform == "win32", reason="needs POSIX signals")
+def test_sigterm_with_stdin_open_stops_server(tmp_path):
+    """Test that SIGTERM ends the server while the client keeps stdin open."""
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps({
+        "proxmox": {"host": "test.proxmox.com", "port": 8006, "verify_ssl": False},
+        "auth": {"user": "test@pve", "token_name": "test_token", "token_value": "test_value"},
+        "logging": {"level": "DEBUG", "file": str(tmp_path / "server.log")}
+    }))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    process = subprocess.Popen(
+        [sys.executable, "-c", _SHUTDOWN_SCRIPT, str(config_path)],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, env=env,
+    )
+    try:
+        # Wait until the server answers, so it is reading stdin
+        process.stdin.write(json.dumps({
+            "jsonrpc": "2.0", "id": 1, "method": "initialize",
+            "params": {
+                "protocolVersion": "2024-11-05", "capabilities": {},
+                "clientInfo": {"name": "test", "version": "1.0"},
+            },
+        }).encode() + b"\n")
+        process.stdin.flush()
+        assert json.loads(process.stdout.readline())["id"] == 1
+
+        process.send_signal(signal.SIGTERM)
+        assert process.wait(timeout=5) == 0
+    finally:
+        if process.poll() is None:
+            process.kill()
+            process.wait()
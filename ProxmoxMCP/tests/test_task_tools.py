@@ -0,0 +1,148 @@
+"""
+Tests for the task tools.
+"""
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from proxmox_mcp.tools.task import TaskTools
+
+UPID = "UPID:node1:0000AB12:00000001:65000000:qmclone:100:root@pam:"
+
+@pytest.fixture
+def mock_proxmox():
+    """Fixture to mock a proxmoxer API object."""
+    return MagicMock()
+
+@pytest.fixture
+def task_tools(mock_proxmox):
+    """Fixture to create TaskTools on the mocked API."""
+    return TaskTools(mock_proxmox)
+
+@pytest.fixture
+def task_endpoint(mock_proxmox):
+    """Fixture for the nodes(node).tasks(upid) resource of the mocked API."""
+    return mock_proxmox.nodes.return_value.tasks.return_value
+
+def parse(response):
+    """Decode the JSON payload of a tool response."""
+    return json.loads(response[0].text)
+
+def make_tasks(node_name, starttimes):
+    """Build a node's task list, newest first as Proxmox returns it."""
+    return [
+        {"upid": f"UPID:{node_name}:{start}", "type": "qmstart", "status": "OK", "starttime": start}
+        for start in starttimes
+    ]
+
+@pytest.mark.asyncio
+async def test_await_task_polls_until_stopped(task_tools, task_endpoint):
+    """Test that await_task polls with a growing interval until the task stops."""
+    task_endpoint.status.get.side_effect = [
+        {"status": "running"},
+        {"status": "running"},
+        {"status": "stopped", "exitstatus": "OK"},
+    ]
+    task_endpoint.log.get.return_value = [{"n": 1, "t": "TASK OK"}]
+
+    with patch("proxmox_mcp.tools.base.asyncio.sleep", new=AsyncMock()) as sleep:
+        result = parse(await task_tools.await_task(UPID, timeout=60))
+
+    assert [call.args[0] for call in sleep.await_args_list] == [1.0, 2.0]
+    assert result["finished"] is True
+    assert result["success"] is True
+    assert result["log"] == ["TASK OK"]
+
+@pytest.mark.asyncio
+async def test_await_task_timeout(task_tools, task_endpoint):
+    """Test that await_task reports an unfinished task once the timeout expires."""
+    task_endpoint.status.get.return_value = {"status": "running"}
+    task_endpoint.log.get.return_value = [{"n": 1, "t": "starting"}]
+
+    result = parse(await task_tools.await_task(UPID, timeout=0))
+
+    assert result["finished"] is False
+    assert result["success"] is False
+    assert result["status"] == "running"
+
+def test_get_tasks_merges_node_shards(task_tools, mock_proxmox):
+    """Test that get_tasks asks each node for a share and merges them newest first."""
+    nodes = {"node1": MagicMock(), "node2": MagicMock()}
+    mock_proxmox.nodes.get.return_value = [{"node": "node1"}, {"node": "node2"}]
+    mock_proxmox.nodes.side_effect = nodes.__getitem__
+    nodes["node1"].tasks.get.return_value = make_tasks("node1", [90, 70, 50, 30, 10])
+    nodes["node2"].tasks.get.return_value = make_tasks("node2", [80, 60, 40, 20, 0])
+
+    result = parse(task_tools.get_tasks(limit=6))
+
+    assert [task["starttime"] for task in result] == [90, 80, 70, 60, 50, 40]
+    assert [task["node"] for task in result[:2]] == ["node1", "node2"]
+    nodes["node1"].tasks.get.assert_called_once_with(limit=5)
+    nodes["node2"].tasks.get.assert_called_once_with(limit=5)
+
+def test_get_tasks_refetches_full_shards(task_tools, mock_proxmox):
+    """Test that a node that filled its share is queried again for the full limit."""
+    nodes = {"node1": MagicMock(), "node2": MagicMock()}
+    mock_proxmox.nodes.get.return_value = [{"node": "node1"}, {"node": "node2"}]
+    mock_proxmox.nodes.side_effect = nodes.__getitem__
+    busy = make_tasks("node1", range(100, 88, -1))
+    nodes["node1"].tasks.get.side_effect = lambda limit: busy[:limit]
+    nodes["node2"].tasks.get.return_value = make_tasks("node2", [10])
+
+    result = parse(task_tools.get_tasks(limit=12))
+
+    assert [task["starttime"] for task in result] == list(range(100, 88, -1))
+    assert [call.kwargs["limit"] for call in nodes["node1"].tasks.get.call_args_list] == [6, 12]
+    nodes["node2"].tasks.get.assert_called_once_with(limit=6)
+
+def test_stopped_task_status_is_cached(task_tools, task_endpoint):
+    """Test that the status of a stopped task is only fetched once."""
+    task_endpoint.status.get.return_value = {"status": "stopped", "exitstatus": "OK"}
+    task_endpoint.log.get.return_value = [{"n": 1, "t": "TASK OK"}]
+
+    first = parse(task_tools.get_task_status(UPID))
+    second = parse(task_tools.get_task_status(UPID))
+
+    assert first == second
+    assert first["log"] == ["TASK OK"]
+    task_endpoint.status.get.assert_called_once()
+
+def test_task_status_not_cached_when_log_fails(task_tools, task_endpoint):
+    """Test that a status whose log could not be fetched is fetched again."""
+    task_endpoint.status.get.return_value = {"status": "stopped", "exitstatus": "OK"}
+    task_endpoint.log.get.side_effect = [Exception("timeout"), [{"n": 1, "t": "TASK OK"}]]
+
+    assert parse(task_tools.get_task_status(UPID))["log"] == []
+    assert parse(task_tools.get_task_status(UPID))["log"] == ["TASK OK"]
+    assert task_endpoint.status.get.call_count == 2
+
+def test_task_log_is_fetched_incrementally(task_tools, task_endpoint):
+    """Test that only new log lines are requested, starting after the last line number."""
+    task_endpoint.log.get.side_effect = [
+        [{"n": 1, "t": "no content"}],
+        [{"n": 1, "t": "first"}, {"n": 2, "t": "second"}],
+        [{"n": 3, "t": "third"}],
+    ]
+
+    assert task_tools._get_task_log("node1", UPID) == ("no content",)
+    assert task_tools._get_task_log("node1", UPID) == ("first", "second")
+    assert task_tools._get_task_log("node1", UPID) == ("first", "second", "third")
+    assert [call.kwargs["start"] for call in task_endpoint.log.get.call_args_list] == [0, 0, 2]
+
+def test_get_tasks_for_vmid_queries_hosting_node(task_tools, mock_proxmox):
+    """Test that a vmid query only asks the node hosting the guest."""
+    nodes = {"node1": MagicMock(), "node2": MagicMock()}
+    mock_proxmox.nodes.side_effect = nodes.__getitem__
+    mock_proxmox.cluster.resources.get.return_value = [
+        {"vmid": 100, "node": "node2"},
+        {"vmid": 101, "node": "node1"},
+    ]
+    nodes["node2"].tasks.get.return_value = make_tasks("node2", [50])
+
+    result = parse(task_tools.get_tasks(limit=10, vmid="100"))
+
+    assert [task["node"] for task in result] == ["node2"]
+    nodes["node2"].tasks.get.assert_called_once_with(limit=10, vmid="100")
+    nodes["node1"].tasks.get.assert_not_called()
+    mock_proxmox.nodes.get.assert_not_called()
@@ -0,0 +1,32 @@
+"""
+Tests for the template tools.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+from proxmox_mcp.tools.template import TemplateTools
+
+
+@pytest.fixture
+def mock_proxmox():
+    """Fixture to mock a proxmoxer API object."""
+    return MagicMock()
+
+@pytest.fixture
+def template_tools(mock_proxmox):
+    """Fixture to create TemplateTools on the mocked API."""
+    return TemplateTools(mock_proxmox)
+
+def test_delete_template_rechecks_cached_config(template_tools, mock_proxmox):
+    """Test that a VMID reused since its config was cached is not deleted."""
+    qemu = mock_proxmox.nodes.return_value.qemu.return_value
+    qemu.config.get.return_value = {"template": 1}
+    template_tools.get_template_details("node1", "100")
+
+    # The template was removed and the VMID re-created as an ordinary VM
+    qemu.config.get.return_value = {"name": "database"}
+    response = template_tools.delete_template("node1", "100")
+
+    assert "not a template" in response[0].text
+    qemu.delete.assert_not_called()
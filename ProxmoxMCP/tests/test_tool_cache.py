@@ -0,0 +1,72 @@
+"""
+Tests for the server-level cache of inventory tool results.
+"""
+
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+from mcp.server.fastmcp.exceptions import ToolError
+from mcp.types import TextContent as Content
+from proxmox_mcp import server as server_module
+from proxmox_mcp.server import ProxmoxMCPServer
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    """Fixture to write a minimal configuration file."""
+    path = tmp_path / "config.json"
+    path.write_text(json.dumps({
+        "proxmox": {"host": "test.proxmox.com", "port": 8006, "verify_ssl": False},
+        "auth": {"user": "test@pve", "token_name": "test_token", "token_value": "test_value"},
+        "logging": {"level": "DEBUG"}
+    }))
+    return str(path)
+
+@pytest.fixture
+def server(config_file):
+    """Fixture to create a server whose node and VM tool groups are mocks."""
+    with patch("proxmox_mcp.core.proxmox.ProxmoxAPI"), \
+            patch.dict(server_module._MANAGER_CACHE, clear=True):
+        server = ProxmoxMCPServer(config_file)
+    node_tools = Mock()
+    node_tools.get_nodes.side_effect = lambda: [
+        Content(type="text", text=f"call {node_tools.get_nodes.call_count}")
+    ]
+    server._tool_groups["node_tools"] = node_tools
+    server._tool_groups["vm_lifecycle_tools"] = Mock()
+    return server
+
+async def call_text(server, name, arguments):
+    """Call a tool and return the text of its first content item."""
+    response = await server.mcp.call_tool(name, arguments)
+    return response[0].text
+
+@pytest.mark.asyncio
+async def test_cached_tool_reuses_result(server):
+    """Test that a cached tool is only run once within the TTL."""
+    assert await call_text(server, "get_nodes", {}) == "call 1"
+    assert await call_text(server, "get_nodes", {}) == "call 1"
+
+    assert server._tool_groups["node_tools"].get_nodes.call_count == 1
+
+@pytest.mark.asyncio
+async def test_write_tool_clears_cache(server):
+    """Test that a state-changing tool drops the cached results."""
+    server._tool_groups["vm_lifecycle_tools"].start_vm.return_value = [
+        Content(type="text", text="started")
+    ]
+    await call_text(server, "get_nodes", {})
+
+    assert await call_text(server, "start_vm", {"node": "node1", "vmid": "100"}) == "started"
+    assert await call_text(server, "get_nodes", {}) == "call 2"
+
+@pytest.mark.asyncio
+async def test_failed_write_tool_clears_cache(server):
+    """Test that the cache is dropped even when the write fails."""
+    server._tool_groups["vm_lifecycle_tools"].start_vm.side_effect = RuntimeError("failed")
+    await call_text(server, "get_nodes", {})
+
+    with pytest.raises(ToolError):
+        await call_text(server, "start_vm", {"node": "node1", "vmid": "100"})
+    assert await call_text(server, "get_nodes", {}) == "call 2"
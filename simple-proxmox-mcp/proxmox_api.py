@@ -4,34 +4,98 @@ Simple script to directly interact with the Proxmox API.
 This script can be called with specific parameters to perform different operations.
 """
 import json
+import os
 import sys
-import urllib3
 import argparse
+import threading
 import time
-from proxmoxer import ProxmoxAPI
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-# Disable SSL warnings
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+# proxmoxer, requests and urllib3 are imported when connecting, so argument
+# errors and --help return without loading the HTTP stack
+
+# Worker threads for per-node requests; the calls are network-bound, so
+# querying all nodes at once costs about as long as the slowest node
+MAX_WORKERS = 16
+_EXECUTOR = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+
+# Seconds that cluster-wide listings (nodes, resources, storage, status)
+# are reused for, so back-to-back actions in one process do not fetch
+# them again; actions that change VMs drop them. Dropping bumps the
+# generation, so a fetch that was already running is not stored after it
+CACHE_TTL = 2.0
+_CACHE = {}
+_cache_generation = 0
+_CACHE_LOCK = threading.Lock()
+
+# Keep-alive connections kept per host; sized so every worker thread can
+# hold one alongside the main thread
+POOL_MAXSIZE = 2 * MAX_WORKERS
 
 def connect_to_proxmox(host, user, token_name, token_value):
     """Connect to Proxmox API."""
-    try:
-        proxmox = ProxmoxAPI(
-            host,
-            user=user,
-            token_name=token_name,
-            token_value=token_value,
-            verify_ssl=False
-        )
-        return proxmox
-    except Exception as e:
-        print(json.dumps({"error": f"Failed to connect to Proxmox API: {str(e)}"}))
-        sys.exit(1)
+    import urllib3
+    from proxmoxer import ProxmoxAPI
+
+    # Disable SSL warnings
+    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+    proxmox = ProxmoxAPI(
+        host,
+        user=user,
+        token_name=token_name,
+        token_value=token_value,
+        verify_ssl=False
+    )
+    configure_session(proxmox)
+    return proxmox
+
+def cached(proxmox, key, fetch, ttl=CACHE_TTL):
+    """Return a recent result of fetch() for this client, calling it on a miss."""
+    now = time.monotonic()
+    with _CACHE_LOCK:
+        entry = _CACHE.get((proxmox, key))
+        generation = _cache_generation
+    if entry is not None and now - entry[0] < ttl:
+        return entry[1]
+    result = fetch()
+    with _CACHE_LOCK:
+        if generation == _cache_generation:
+            _CACHE[(proxmox, key)] = (now, result)
+    return result
+
+def invalidate_cache(proxmox):
+    """Drop this client's cached listings after changing the cluster."""
+    global _cache_generation
+    with _CACHE_LOCK:
+        _cache_generation += 1
+        for key in [key for key in _CACHE if key[0] is proxmox]:
+            del _CACHE[key]
+
+def configure_session(proxmox):
+    """Mount a pooled, retrying adapter on the client's HTTP session.
+
+    proxmoxer's https backend keeps one requests session per ProxmoxAPI;
+    a larger pool lets the concurrent node queries and task polling reuse
+    established TLS connections instead of opening new ones.
+    """
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = getattr(proxmox, "_store", {}).get("session")
+    if session is None or not hasattr(session, "mount"):
+        return
+    session.mount("https://", HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=Retry(total=2, backoff_factor=0.2,
+                          allowed_methods=frozenset({'GET', 'HEAD', 'OPTIONS'}))
+    ))
 
 def get_nodes(proxmox):
     """Get all nodes in the Proxmox cluster."""
     try:
-        nodes = proxmox.nodes.get()
+        nodes = cached(proxmox, 'nodes', proxmox.nodes.get)
         return nodes
     except Exception as e:
         return {"error": f"Failed to get nodes: {str(e)}"}
@@ -44,43 +108,82 @@ def get_node_status(proxmox, node):
     except Exception as e:
         return {"error": f"Failed to get status for node {node}: {str(e)}"}
 
+def get_node_vms(proxmox, nodes, label):
+    """Get the VM lists of several nodes concurrently.
+
+    Returns a dict of node name to VM list in the order of nodes, and a
+    list of error messages for nodes whose request failed (left out of
+    the dict).
+    """
+    futures = {
+        _EXECUTOR.submit(proxmox.nodes(node['node']).qemu.get): node['node']
+        for node in nodes
+    }
+    results = {}
+    errors = []
+    for future in as_completed(futures):
+        node_name = futures[future]
+        try:
+            results[node_name] = future.result()
+        except Exception as e:
+            errors.append(f"Failed to get {label} for node {node_name}: {str(e)}")
+
+    # Keep the node order of the listing
+    return {node['node']: results[node['node']] for node in nodes if node['node'] in results}, errors
+
+def get_vms_by_node(proxmox, label):
+    """Get every node's VMs (including templates), keyed by node name.
+
+    Returns the dict and a list of per-node error messages. Uses a single /cluster/resources request; falls back to querying each
+    node when that endpoint is not permitted for the API token.
+    """
+    try:
+        resources = cached(proxmox, 'resources', proxmox.cluster.resources.get)
+    except Exception:
+        return get_node_vms(proxmox, cached(proxmox, 'nodes', proxmox.nodes.get), label)
+
+    vms_by_node = {}
+    for resource in resources:
+        resource_type = resource.get('type')
+        if resource_type == 'node':
+            # List nodes without VMs too
+            vms_by_node.setdefault(resource['node'], [])
+        elif resource_type == 'qemu':
+            vms_by_node.setdefault(resource['node'], []).append(resource)
+    return vms_by_node, []
+
 def get_vms(proxmox):
     """Get all VMs across the cluster."""
     try:
-        nodes = proxmox.nodes.get()
         vms = []
-        vms_by_node = {}
-
-        for node in nodes:
-            node_name = node['node']
-            try:
-                node_vms = proxmox.nodes(node_name).qemu.get()
-                vms.extend(node_vms)
-                vms_by_node[node_name] = node_vms
-            except Exception as e:
-                print(json.dumps({"error": f"Failed to get VMs for node {node_name}: {str(e)}"}))
-
-        # Count total VMs and running VMs
-        total_vms = len(vms)
-        running_vms = [vm for vm in vms if vm['status'] == 'running']
-        total_running = len(running_vms)
-
-        # Count VMs by node
+        total_running = 0
         node_stats = {}
+
+        # Count VMs and running VMs per node in one pass
+        vms_by_node, errors = get_vms_by_node(proxmox, "VMs")
         for node_name, node_vms in vms_by_node.items():
-            node_running = [vm for vm in node_vms if vm['status'] == 'running']
+            node_running = [
+                {"vmid": vm['vmid'], "name": vm['name'], "status": vm['status']}
+                for vm in node_vms if vm['status'] == 'running'
+            ]
             node_stats[node_name] = {
                 "total": len(node_vms),
                 "running": len(node_running),
-                "running_vms": [{"vmid": vm['vmid'], "name": vm['name'], "status": vm['status']} for vm in node_running]
+                "running_vms": node_running
             }
+            total_running += len(node_running)
+            vms.extend(node_vms)
+        total_vms = len(vms)
 
-        return {
+        result = {
             "total_vms": total_vms,
             "total_running": total_running,
             "nodes": node_stats,
             "vms": vms
         }
+        if errors:
+            result["errors"] = errors
+        return result
     except Exception as e:
         return {"error": f"Failed to get VMs: {str(e)}"}
 
@@ -95,7 +198,7 @@ def execute_vm_command(proxmox, node, vmid, command):
 def get_storage(proxmox):
     """Get storage pools across the cluster."""
     try:
-        storage = proxmox.storage.get()
+        storage = cached(proxmox, 'storage', proxmox.storage.get)
         return storage
     except Exception as e:
         return {"error": f"Failed to get storage: {str(e)}"}
@@ -103,7 +206,7 @@ def get_storage(proxmox):
 def get_cluster_status(proxmox):
     """Get overall Proxmox cluster health and configuration status."""
     try:
-        status = proxmox.cluster.status.get()
+        status = cached(proxmox, 'cluster_status', proxmox.cluster.status.get)
         return status
     except Exception as e:
         return {"error": f"Failed to get cluster status: {str(e)}"}
@@ -111,28 +214,26 @@ def get_cluster_status(proxmox):
 def get_templates(proxmox):
     """Get all VM templates across the cluster."""
     try:
-        nodes = proxmox.nodes.get()
         templates = []
 
-        for node in nodes:
-            node_name = node['node']
-            try:
-                node_vms = proxmox.nodes(node_name).qemu.get()
-                # Filter for templates
-                node_templates = [vm for vm in node_vms if vm.get('template') == 1]
+        vms_by_node, errors = get_vms_by_node(proxmox, "templates")
+        for node_name, node_vms in vms_by_node.items():
+            # Filter for templates
+            node_templates = [vm for vm in node_vms if vm.get('template') == 1]
 
-                # Add node information to each template
-                for template in node_templates:
-                    template['node'] = node_name
+            # Add node information to each template
+            for template in node_templates:
+                template['node'] = node_name
 
-                templates.extend(node_templates)
-            except Exception as e:
-                print(json.dumps({"error": f"Failed to get templates for node {node_name}: {str(e)}"}))
+            templates.extend(node_templates)
 
-        return {
+        result = {
             "total_templates": len(templates),
             "templates": templates
         }
+        if errors:
+            result["errors"] = errors
+        return result
     except Exception as e:
         return {"error": f"Failed to get templates: {str(e)}"}
 
@@ -157,6 +258,7 @@ def clone_template(proxmox, node, template_vmid, new_vm_name, target_node=None,
 
         # Submit clone task
         task_result = proxmox.nodes(node).qemu(template_vmid).clone.post(**clone_params)
+        invalidate_cache(proxmox)
 
         # Get task ID from result
         task_id = None
@@ -180,15 +282,18 @@ def get_next_vmid(proxmox):
     try:
         next_id = proxmox.cluster.nextid.get()
         return next_id
-    except Exception as e:
-        # Fallback: Use a random ID in the typical range
-        import random
-        return random.randint(100, 999)
+    except Exception:
+        # Fallback: the lowest free ID, from the (briefly cached) cluster
+        # resources. A random pick could collide with an existing guest
+        resources = cached(proxmox, 'resources', proxmox.cluster.resources.get)
+        used = {int(r['vmid']) for r in resources if 'vmid' in r}
+        return next(vmid for vmid in range(100, 1000000000) if vmid not in used)
 
 def start_vm(proxmox, node, vmid):
     """Start a VM."""
     try:
         result = proxmox.nodes(node).qemu(vmid).status.start.post()
+        invalidate_cache(proxmox)
         task_id = None
         if isinstance(result, dict):
             task_id = result.get('data')
@@ -207,6 +312,7 @@ def stop_vm(proxmox, node, vmid):
     """Stop a VM (shutdown)."""
     try:
         result = proxmox.nodes(node).qemu(vmid).status.shutdown.post()
+        invalidate_cache(proxmox)
         task_id = None
         if isinstance(result, dict):
             task_id = result.get('data')
@@ -225,6 +331,7 @@ def reboot_vm(proxmox, node, vmid):
     """Reboot a VM."""
     try:
         result = proxmox.nodes(node).qemu(vmid).status.reboot.post()
+        invalidate_cache(proxmox)
         task_id = None
         if isinstance(result, dict):
             task_id = result.get('data')
@@ -239,6 +346,41 @@ def reboot_vm(proxmox, node, vmid):
     except Exception as e:
         return {"error": f"Failed to reboot VM {vmid} on node {node}: {str(e)}"}
 
+def power_vms(proxmox, vmids, power_action):
+    """Apply a power action (start_vm, stop_vm or reboot_vm) to several VMs concurrently.
+
+    Each VM's node is looked up in one /cluster/resources listing.
+    """
+    try:
+        resources = cached(proxmox, 'resources', proxmox.cluster.resources.get)
+    except Exception as e:
+        return {"error": f"Failed to look up VM nodes: {str(e)}"}
+    vm_nodes = {str(r['vmid']): r['node'] for r in resources if r.get('type') == 'qemu'}
+
+    def run(vmid):
+        node = vm_nodes.get(str(vmid))
+        if node is None:
+            return {"vmid": vmid, "error": f"VM {vmid} not found"}
+        return {"vmid": vmid, "node": node, **power_action(proxmox, node, vmid)}
+
+    results = list(_EXECUTOR.map(run, vmids))
+    return {
+        "success": all("error" not in result for result in results),
+        "results": results
+    }
+
+def start_vms(proxmox, vmids):
+    """Start several VMs."""
+    return power_vms(proxmox, vmids, start_vm)
+
+def stop_vms(proxmox, vmids):
+    """Stop (shutdown) several VMs."""
+    return power_vms(proxmox, vmids, stop_vm)
+
+def reboot_vms(proxmox, vmids):
+    """Reboot several VMs."""
+    return power_vms(proxmox, vmids, reboot_vm)
+
 def update_vm_config(proxmox, node, vmid, cpu=None, memory=None, name=None, description=None):
     """Update VM configuration (CPU, memory, name, description)."""
     try:
@@ -259,6 +401,7 @@ def update_vm_config(proxmox, node, vmid, cpu=None, memory=None, name=None, desc
 
         # Apply the configuration changes
         proxmox.nodes(node).qemu(vmid).config.put(**config_params)
+        invalidate_cache(proxmox)
 
         return {
             "success": True,
@@ -284,41 +427,124 @@ def get_task_status(proxmox, node, task_id):
     except Exception as e:
         return {"error": f"Failed to get status for task {task_id} on node {node}: {str(e)}"}
 
-def wait_for_task(proxmox, node, task_id, timeout=300, interval=2):
-    """Wait for a task to complete."""
-    start_time = time.time()
-    while time.time() - start_time < timeout:
+def wait_for_task(proxmox, node, task_id, timeout=300, max_interval=5.0):
+    """Wait for a task to complete.
+
+    Polls quickly at first so short tasks return soon after finishing, then
+    backs off exponentially up to max_interval seconds for long ones.
+    """
+    status_endpoint = proxmox.nodes(node).tasks(task_id).status
+    deadline = time.monotonic() + timeout
+    delay = 0.1
+    while time.monotonic() < deadline:
         try:
-            status = proxmox.nodes(node).tasks(task_id).status.get()
+            status = status_endpoint.get()
             if status.get('status') == 'stopped':
                 return {
                     "success": status.get('exitstatus') == 'OK',
                     "status": status
                 }
-            time.sleep(interval)
+            time.sleep(max(0, min(delay, deadline - time.monotonic())))
+            delay = min(delay * 1.6, max_interval)
         except Exception as e:
             return {"error": f"Error checking task status: {str(e)}"}
 
     return {"error": f"Task {task_id} did not complete within {timeout} seconds"}
 
+# Action name -> (handler, required argument names, optional argument
+# names); handlers take the client followed by these arguments in order
+ACTIONS = {
+    # Basic operations
+    'get_nodes': (get_nodes, (), ()),
+    'get_node_status': (get_node_status, ('node',), ()),
+    'get_vms': (get_vms, (), ()),
+    'execute_vm_command': (execute_vm_command, ('node', 'vmid', 'command'), ()),
+    'get_storage': (get_storage, (), ()),
+    'get_cluster_status': (get_cluster_status, (), ()),
+
+    # Template operations
+    'get_templates': (get_templates, (), ()),
+    'clone_template': (clone_template, ('node', 'vmid', 'new_vm_name'),
+                       ('target_node', 'full_clone', 'storage')),
+
+    # VM power operations
+    'start_vm': (start_vm, ('node', 'vmid'), ()),
+    'stop_vm': (stop_vm, ('node', 'vmid'), ()),
+    'reboot_vm': (reboot_vm, ('node', 'vmid'), ()),
+    'start_vms': (start_vms, ('vmids',), ()),
+    'stop_vms': (stop_vms, ('vmids',), ()),
+    'reboot_vms': (reboot_vms, ('vmids',), ()),
+
+    # VM configuration operations
+    'update_vm_config': (update_vm_config, ('node', 'vmid'),
+                         ('cpu', 'memory', 'name', 'description')),
+    'get_vm_config': (get_vm_config, ('node', 'vmid'), ()),
+
+    # Task operations
+    'get_task_status': (get_task_status, ('node', 'task_id'), ()),
+    'wait_for_task': (wait_for_task, ('node', 'task_id'), ('timeout',)),
+}
+
+# Names used for required arguments in error messages
+ARG_LABELS = {
+    'node': 'node name',
+    'vmid': 'VM ID',
+    'vmids': 'VM IDs',
+    'command': 'command',
+    'new_vm_name': 'new VM name',
+    'template_vmid': 'template VM ID',
+    'task_id': 'task ID',
+}
+
+def required_message(action, required):
+    """Build the error message listing an action's required arguments."""
+    labels = [ARG_LABELS[name] for name in required]
+    if len(labels) == 1:
+        names = labels[0]
+    elif len(labels) == 2:
+        names = f"{labels[0]} and {labels[1]}"
+    else:
+        names = f"{', '.join(labels[:-1])}, and {labels[-1]}"
+    verb = "is" if len(labels) == 1 and not labels[0].endswith("s") else "are"
+    return f"{names[0].upper()}{names[1:]} {verb} required for {action}"
+
+def dispatch(proxmox, action, arguments):
+    """Run an action with a dict of arguments and return its result.
+
+    Arguments the action does not take are ignored, and optional ones that
+    are missing or None keep the handler's default.
+    """
+    handler, required, optional = ACTIONS[action]
+    if not all(arguments.get(name) for name in required):
+        return {"error": required_message(action, required)}
+    options = {name: arguments[name] for name in optional if arguments.get(name) is not None}
+    return handler(proxmox, *(arguments[name] for name in required), **options)
+
+# Credential options -> environment variable used when the option is omitted
+CREDENTIAL_OPTIONS = (
+    ('--host', 'PROXMOX_HOST', 'Proxmox host'),
+    ('--user', 'PROXMOX_USER', 'Proxmox user'),
+    ('--token-name', 'PROXMOX_TOKEN_NAME', 'Proxmox API token name'),
+    ('--token-value', 'PROXMOX_TOKEN_VALUE', 'Proxmox API token value'),
+)
+
 def main():
     """Main function to parse arguments and call the appropriate function."""
     parser = argparse.ArgumentParser(description='Interact with Proxmox API')
-    parser.add_argument('--host', required=True, help='Proxmox host')
-    parser.add_argument('--user', required=True, help='Proxmox user')
-    parser.add_argument('--token-name', required=True, help='Proxmox API token name')
-    parser.add_argument('--token-value', required=True, help='Proxmox API token value')
+    # Credentials may come from the environment instead, which keeps the
+    # token out of the process list
+    for flag, variable, help_text in CREDENTIAL_OPTIONS:
+        parser.add_argument(flag, default=os.environ.get(variable),
+                            required=variable not in os.environ,
+                            help=f'{help_text} (default: ${variable})')
     parser.add_argument('--action', required=True,
-                        choices=['get_nodes', 'get_node_status', 'get_vms',
-                                'execute_vm_command', 'get_storage', 'get_cluster_status',
-                                'get_templates', 'clone_template', 'start_vm', 'stop_vm',
-                                'reboot_vm', 'update_vm_config', 'get_vm_config',
-                                'get_task_status', 'wait_for_task'],
+                        choices=ACTIONS,
                         help='Action to perform')
 
     # Common parameters
     parser.add_argument('--node', help='Node name (required for node-specific operations)')
     parser.add_argument('--vmid', help='VM ID (required for VM-specific operations)')
+    parser.add_argument('--vmids', help='Comma-separated VM IDs (required for start_vms, stop_vms and reboot_vms)')
 
     # Parameters for execute_vm_command
     parser.add_argument('--command', help='Command to execute (required for execute_vm_command)')
@@ -339,102 +565,39 @@ def main():
     parser.add_argument('--task-id', help='Task ID (required for task-related operations)')
     parser.add_argument('--timeout', type=int, default=300, help='Timeout in seconds (for wait_for_task)')
 
+    # Output formatting
+    parser.add_argument('--pretty', action='store_true', help='Indent the JSON output for reading')
+
     args = parser.parse_args()
+    if args.vmids is not None:
+        args.vmids = [vmid.strip() for vmid in args.vmids.split(',') if vmid.strip()]
+
+    # Check the action's required arguments before connecting
+    required = ACTIONS[args.action][1]
+    if not all(getattr(args, name) for name in required):
+        print(json.dumps({"error": required_message(args.action, required)}))
+        sys.exit(1)
 
     # Connect to Proxmox
-    proxmox = connect_to_proxmox(args.host, args.user, args.token_name, args.token_value)
+    try:
+        proxmox = connect_to_proxmox(args.host, args.user, args.token_name, args.token_value)
+    except Exception as e:
+        print(json.dumps({"error": f"Failed to connect to Proxmox API: {str(e)}"}))
+        sys.exit(1)
 
     # Perform the requested action
-    result = None
-
-    # Basic operations
-    if args.action == 'get_nodes':
-        result = get_nodes(proxmox)
-    elif args.action == 'get_node_status':
-        if not args.node:
-            print(json.dumps({"error": "Node name is required for get_node_status"}))
-            sys.exit(1)
-        result = get_node_status(proxmox, args.node)
-    elif args.action == 'get_vms':
-        result = get_vms(proxmox)
-    elif args.action == 'execute_vm_command':
-        if not args.node or not args.vmid or not args.command:
-            print(json.dumps({"error": "Node name, VM ID, and command are required for execute_vm_command"}))
-            sys.exit(1)
-        result = execute_vm_command(proxmox, args.node, args.vmid, args.command)
-    elif args.action == 'get_storage':
-        result = get_storage(proxmox)
-    elif args.action == 'get_cluster_status':
-        result = get_cluster_status(proxmox)
-
-    # Template operations
-    elif args.action == 'get_templates':
-        result = get_templates(proxmox)
-    elif args.action == 'clone_template':
-        if not args.node or not args.vmid or not args.new_vm_name:
-            print(json.dumps({"error": "Node name, template VM ID, and new VM name are required for clone_template"}))
-            sys.exit(1)
-        result = clone_template(
-            proxmox,
-            args.node,
-            args.vmid,
-            args.new_vm_name,
-            args.target_node,
-            args.full_clone,
-            args.storage
-        )
-
-    # VM power operations
-    elif args.action == 'start_vm':
-        if not args.node or not args.vmid:
-            print(json.dumps({"error": "Node name and VM ID are required for start_vm"}))
-            sys.exit(1)
-        result = start_vm(proxmox, args.node, args.vmid)
-    elif args.action == 'stop_vm':
-        if not args.node or not args.vmid:
-            print(json.dumps({"error": "Node name and VM ID are required for stop_vm"}))
-            sys.exit(1)
-        result = stop_vm(proxmox, args.node, args.vmid)
-    elif args.action == 'reboot_vm':
-        if not args.node or not args.vmid:
-            print(json.dumps({"error": "Node name and VM ID are required for reboot_vm"}))
-            sys.exit(1)
-        result = reboot_vm(proxmox, args.node, args.vmid)
-
-    # VM configuration operations
-    elif args.action == 'update_vm_config':
-        if not args.node or not args.vmid:
-            print(json.dumps({"error": "Node name and VM ID are required for update_vm_config"}))
-            sys.exit(1)
-        result = update_vm_config(
-            proxmox,
-            args.node,
-            args.vmid,
-            args.cpu,
-            args.memory,
-            args.name,
-            args.description
-        )
-    elif args.action == 'get_vm_config':
-        if not args.node or not args.vmid:
-            print(json.dumps({"error": "Node name and VM ID are required for get_vm_config"}))
-            sys.exit(1)
-        result = get_vm_config(proxmox, args.node, args.vmid)
-
-    # Task operations
-    elif args.action == 'get_task_status':
-        if not args.node or not args.task_id:
-            print(json.dumps({"error": "Node name and task ID are required for get_task_status"}))
-            sys.exit(1)
-        result = get_task_status(proxmox, args.node, args.task_id)
-    elif args.action == 'wait_for_task':
-        if not args.node or not args.task_id:
-            print(json.dumps({"error": "Node name and task ID are required for wait_for_task"}))
-            sys.exit(1)
-        result = wait_for_task(proxmox, args.node, args.task_id, args.timeout)
-
-    # Print the result as JSON
-    print(json.dumps(result, indent=2))
+    result = dispatch(proxmox, args.action, vars(args))
+
+    # Print the result as JSON. Output is compact by default since it is
+    # normally parsed by the MCP server; json.dumps() then runs the C
+    # encoder in one shot. Indented output goes through the pure-Python
+    # encoder either way, so it is written out piece by piece rather than
+    # building the whole document in memory first
+    if args.pretty:
+        json.dump(result, sys.stdout, indent=2)
+    else:
+        sys.stdout.write(json.dumps(result, separators=(',', ':')))
+    sys.stdout.write("\n")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,15 +1,21 @@
 #!/usr/bin/env python3
 """
 Simple MCP server for Proxmox API.
-This server implements the MCP protocol and uses the proxmox_api.py script to interact with the Proxmox API.
+This server implements the MCP protocol and uses the proxmox_api module to interact with the Proxmox API.
 """
+import functools
 import json
 import logging
 import os
+import queue
 import sys
-import subprocess
+import threading
+import time
 import argparse
-from typing import Dict, Any, Optional, List, Union
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Dict, Any, Final, List
+
+import proxmox_api
 
 # Configure logging
 logging.basicConfig(
@@ -25,469 +31,527 @@ logger = logging.getLogger("simple-proxmox-mcp")
 # Get the absolute path to the script directory
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 CONFIG_PATH = os.path.join(SCRIPT_DIR, "config.json")
-API_SCRIPT_PATH = os.path.join(SCRIPT_DIR, "proxmox_api.py")
+
+# Proxmox client shared by all tool calls, so its keep-alive connection
+# pool and cached listings carry over between requests; created on first
+# use and again only when the credentials in config.json change
+_proxmox = None
+_proxmox_credentials = None
+_proxmox_lock = threading.Lock()
+
+# Worker threads for interactive requests: read-only requests a client
+# sends without waiting for the previous reply run concurrently, and their
+# responses are still written in request order. Every other request is a
+# barrier: it runs alone on _WRITE_EXECUTOR once all earlier requests are
+# done, and later requests only start after it
+MAX_WORKERS = 8
+_EXECUTOR = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+_WRITE_EXECUTOR = ThreadPoolExecutor(max_workers=1)
+
+# Successful results of read-only actions are reused for RESPONSE_TTL
+# seconds, since clients often repeat a query; every other action may
+# change the cluster, so finishing one drops them. Dropping also bumps
+# the generation, so a read that was already running when the cluster
+# changed does not store its (possibly stale) result afterwards
+RESPONSE_TTL = 5.0
+READ_ONLY_ACTIONS = frozenset({
+    "get_nodes", "get_node_status", "get_vms", "get_storage",
+    "get_cluster_status", "get_templates", "get_vm_config",
+})
+_responses = {}
+_responses_generation = 0
+_responses_lock = threading.Lock()
+
+@functools.lru_cache(maxsize=1)
+def _read_config(mtime: float) -> Dict[str, Any]:
+    """Parse config.json; cached per modification time."""
+    with open(CONFIG_PATH, "r") as f:
+        return json.load(f)
 
 def load_config() -> Dict[str, Any]:
-    """Load configuration from config.json."""
+    """Load configuration from config.json, parsing it again only after it changes."""
     try:
-        with open(CONFIG_PATH, "r") as f:
-            config = json.load(f)
-        return config
+        return _read_config(os.path.getmtime(CONFIG_PATH))
     except Exception as e:
         logger.error(f"Failed to load configuration: {e}")
-        sys.exit(1)
-
-def run_proxmox_api(action: str, **kwargs) -> Dict[str, Any]:
-    """Run the proxmox_api.py script with the specified action and arguments."""
+        raise
+
+def drop_responses() -> None:
+    """Drop the stored read results, including those of reads still running."""
+    global _responses_generation
+    with _responses_lock:
+        _responses_generation += 1
+        _responses.clear()
+
+def get_proxmox():
+    """Return the shared Proxmox client, reconnecting when the credentials change."""
+    global _proxmox, _proxmox_credentials
     config = load_config()
+    credentials = (
+        config["proxmox"]["host"],
+        config["auth"]["user"],
+        config["auth"]["token_name"],
+        config["auth"]["token_value"]
+    )
+    with _proxmox_lock:
+        if _proxmox is None or credentials != _proxmox_credentials:
+            if _proxmox is not None:
+                logger.info("Configuration changed, reconnecting to Proxmox")
+                proxmox_api.invalidate_cache(_proxmox)
+                drop_responses()
+            _proxmox = proxmox_api.connect_to_proxmox(*credentials)
+            _proxmox_credentials = credentials
+        return _proxmox
 
-    cmd = [
-        sys.executable,
-        API_SCRIPT_PATH,
-        "--host", config["proxmox"]["host"],
-        "--user", config["auth"]["user"],
-        "--token-name", config["auth"]["token_name"],
-        "--token-value", config["auth"]["token_value"],
-        "--action", action
-    ]
-
-    # Add additional arguments
-    for key, value in kwargs.items():
-        if value is None:
-            continue
-
-        # Handle boolean flags differently
-        if isinstance(value, bool):
-            if value:
-                cmd.append(f"--{key.replace('_', '-')}")
-        else:
-            cmd.extend([f"--{key.replace('_', '-')}", str(value)])
-
+def run_proxmox_api(action: str, **kwargs) -> Dict[str, Any]:
+    """Run a proxmox_api action in-process with the specified arguments."""
     try:
-        logger.info(f"Running command: {' '.join(cmd)}")
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        return json.loads(result.stdout)
-    except subprocess.CalledProcessError as e:
-        logger.error(f"Command failed with exit code {e.returncode}: {e.stderr}")
-        return {"error": f"Command failed: {e.stderr}"}
-    except json.JSONDecodeError as e:
-        logger.error(f"Failed to parse JSON output: {e}")
-        return {"error": f"Failed to parse JSON output: {e}"}
+        if action not in READ_ONLY_ACTIONS:
+            logger.info("Running action: %s", action)
+            try:
+                return proxmox_api.dispatch(get_proxmox(), action, kwargs)
+            finally:
+                drop_responses()
+
+        key = (action, json.dumps(kwargs, sort_keys=True))
+        now = time.monotonic()
+        with _responses_lock:
+            entry = _responses.get(key)
+            generation = _responses_generation
+        if entry is not None and now - entry[0] < RESPONSE_TTL:
+            return entry[1]
+
+        logger.info("Running action: %s", action)
+        result = proxmox_api.dispatch(get_proxmox(), action, kwargs)
+        # Errors and partial listings are not reused
+        if not (isinstance(result, dict) and ("error" in result or "errors" in result)):
+            with _responses_lock:
+                if generation == _responses_generation:
+                    _responses[key] = (now, result)
+        return result
     except Exception as e:
-        logger.error(f"Error running command: {e}")
-        return {"error": f"Error running command: {e}"}
+        logger.error(f"Error running action {action}: {e}")
+        return {"error": f"Error running action {action}: {e}"}
+
+# Tool name -> (proxmox_api action, tool arguments renamed for the action,
+# defaults for arguments the tool call leaves out)
+TOOLS = {
+    # Basic operations
+    "get_nodes": ("get_nodes", {}, {}),
+    "get_node_status": ("get_node_status", {}, {}),
+    "get_vms": ("get_vms", {}, {}),
+    "execute_vm_command": ("execute_vm_command", {}, {}),
+    "get_storage": ("get_storage", {}, {}),
+    "get_cluster_status": ("get_cluster_status", {}, {}),
+
+    # Template operations
+    "get_templates": ("get_templates", {}, {}),
+    "clone_template": ("clone_template", {"template_vmid": "vmid"}, {"full_clone": True}),
+
+    # VM power operations
+    "start_vm": ("start_vm", {}, {}),
+    "stop_vm": ("stop_vm", {}, {}),
+    "reboot_vm": ("reboot_vm", {}, {}),
+    "start_vms": ("start_vms", {}, {}),
+    "stop_vms": ("stop_vms", {}, {}),
+    "reboot_vms": ("reboot_vms", {}, {}),
+
+    # VM configuration operations
+    "update_vm_config": ("update_vm_config", {}, {}),
+    "get_vm_config": ("get_vm_config", {}, {}),
+
+    # Task operations
+    "get_task_status": ("get_task_status", {}, {}),
+    "wait_for_task": ("wait_for_task", {}, {}),
+}
 
 def handle_mcp_request(request: Dict[str, Any]) -> Dict[str, Any]:
     """Handle an MCP request."""
     try:
         tool_name = request.get("tool")
-        arguments = request.get("arguments", {})
-
-        # Basic operations
-        if tool_name == "get_nodes":
-            return run_proxmox_api("get_nodes")
-        elif tool_name == "get_node_status":
-            node = arguments.get("node")
-            if not node:
-                return {"error": "Node name is required for get_node_status"}
-            return run_proxmox_api("get_node_status", node=node)
-        elif tool_name == "get_vms":
-            return run_proxmox_api("get_vms")
-        elif tool_name == "execute_vm_command":
-            node = arguments.get("node")
-            vmid = arguments.get("vmid")
-            command = arguments.get("command")
-            if not node or not vmid or not command:
-                return {"error": "Node name, VM ID, and command are required for execute_vm_command"}
-            return run_proxmox_api("execute_vm_command", node=node, vmid=vmid, command=command)
-        elif tool_name == "get_storage":
-            return run_proxmox_api("get_storage")
-        elif tool_name == "get_cluster_status":
-            return run_proxmox_api("get_cluster_status")
-
-        # Template operations
-        elif tool_name == "get_templates":
-            return run_proxmox_api("get_templates")
-        elif tool_name == "clone_template":
-            node = arguments.get("node")
-            template_vmid = arguments.get("template_vmid")
-            new_vm_name = arguments.get("new_vm_name")
-            target_node = arguments.get("target_node")
-            full_clone = arguments.get("full_clone", True)
-            storage = arguments.get("storage")
-
-            if not node or not template_vmid or not new_vm_name:
-                return {"error": "Node name, template VM ID, and new VM name are required for clone_template"}
-
-            return run_proxmox_api(
-                "clone_template",
-                node=node,
-                vmid=template_vmid,
-                new_vm_name=new_vm_name,
-                target_node=target_node,
-                full_clone=full_clone,
-                storage=storage
-            )
-
-        # VM power operations
-        elif tool_name == "start_vm":
-            node = arguments.get("node")
-            vmid = arguments.get("vmid")
-
-            if not node or not vmid:
-                return {"error": "Node name and VM ID are required for start_vm"}
-
-            return run_proxmox_api("start_vm", node=node, vmid=vmid)
-        elif tool_name == "stop_vm":
-            node = arguments.get("node")
-            vmid = arguments.get("vmid")
-
-            if not node or not vmid:
-                return {"error": "Node name and VM ID are required for stop_vm"}
+        arguments = request.get("arguments") or {}
 
-            return run_proxmox_api("stop_vm", node=node, vmid=vmid)
-        elif tool_name == "reboot_vm":
-            node = arguments.get("node")
-            vmid = arguments.get("vmid")
-
-            if not node or not vmid:
-                return {"error": "Node name and VM ID are required for reboot_vm"}
-
-            return run_proxmox_api("reboot_vm", node=node, vmid=vmid)
-
-        # VM configuration operations
-        elif tool_name == "update_vm_config":
-            node = arguments.get("node")
-            vmid = arguments.get("vmid")
-            cpu = arguments.get("cpu")
-            memory = arguments.get("memory")
-            name = arguments.get("name")
-            description = arguments.get("description")
-
-            if not node or not vmid:
-                return {"error": "Node name and VM ID are required for update_vm_config"}
-
-            return run_proxmox_api(
-                "update_vm_config",
-                node=node,
-                vmid=vmid,
-                cpu=cpu,
-                memory=memory,
-                name=name,
-                description=description
-            )
-        elif tool_name == "get_vm_config":
-            node = arguments.get("node")
-            vmid = arguments.get("vmid")
-
-            if not node or not vmid:
-                return {"error": "Node name and VM ID are required for get_vm_config"}
-
-            return run_proxmox_api("get_vm_config", node=node, vmid=vmid)
-
-        # Task operations
-        elif tool_name == "get_task_status":
-            node = arguments.get("node")
-            task_id = arguments.get("task_id")
-
-            if not node or not task_id:
-                return {"error": "Node name and task ID are required for get_task_status"}
-
-            return run_proxmox_api("get_task_status", node=node, task_id=task_id)
-        elif tool_name == "wait_for_task":
-            node = arguments.get("node")
-            task_id = arguments.get("task_id")
-            timeout = arguments.get("timeout", 300)
+        tool = TOOLS.get(tool_name)
+        if tool is None:
+            return {"error": f"Unknown tool: {tool_name}"}
+        action, renames, defaults = tool
 
-            if not node or not task_id:
-                return {"error": "Node name and task ID are required for wait_for_task"}
+        required = _REQUIRED[tool_name]
+        if not all(arguments.get(name) for name in required):
+            return {"error": proxmox_api.required_message(tool_name, required)}
 
-            return run_proxmox_api("wait_for_task", node=node, task_id=task_id, timeout=timeout)
-        else:
-            return {"error": f"Unknown tool: {tool_name}"}
+        action_arguments = dict(defaults)
+        for name, value in arguments.items():
+            action_arguments[renames.get(name, name)] = value
+        return run_proxmox_api(action, **action_arguments)
     except Exception as e:
         logger.error(f"Error handling MCP request: {e}")
         return {"error": f"Error handling MCP request: {e}"}
 
-def mcp_server_info() -> Dict[str, Any]:
-    """Return information about the MCP server."""
-    return {
-        "name": "simple-proxmox-mcp",
-        "version": "1.1.0",
-        "description": "Simple MCP server for Proxmox API with VM management capabilities",
-        "tools": [
-            # Basic operations
-            {
-                "name": "get_nodes",
-                "description": "List all nodes in the Proxmox cluster with their status, CPU, memory, and role information.",
-                "input_schema": {
-                    "type": "object",
-                    "properties": {},
-                    "required": []
-                }
-            },
-            {
-                "name": "get_node_status",
-                "description": "Get detailed status information for a specific Proxmox node.",
-                "input_schema": {
-                    "type": "object",
-                    "properties": {
-                        "node": {
-                            "type": "string",
-                            "description": "Name/ID of node to query (e.g. 'pve1', 'proxmox-node2')"
-                        }
+# Server information and tool schemas; built once at import since they
+# never change, with the indented JSON for --info and the interactive
+# ready line encoded up front. Shared by every caller, so never modified
+_SERVER_INFO: Final[Dict[str, Any]] = {
+    "name": "simple-proxmox-mcp",
+    "version": "1.1.0",
+    "description": "Simple MCP server for Proxmox API with VM management capabilities",
+    "tools": [
+        # Basic operations
+        {
+            "name": "get_nodes",
+            "description": "List all nodes in the Proxmox cluster with their status, CPU, memory, and role information.",
+            "input_schema": {
+                "type": "object",
+                "properties": {},
+                "required": []
+            }
+        },
+        {
+            "name": "get_node_status",
+            "description": "Get detailed status information for a specific Proxmox node.",
+            "input_schema": {
+                "type": "object",
+                "properties": {
+                    "node": {
+                        "type": "string",
+                        "description": "Name/ID of node to query (e.g. 'pve1', 'proxmox-node2')"
+                    }
+                },
+                "required": ["node"]
+            }
+        },
+        {
+            "name": "get_vms",
+            "description": "List all virtual machines across the cluster with their status and resource usage.",
+            "input_schema": {
+                "type": "object",
+                "properties": {},
+                "required": []
+            }
+        },
+        {
+            "name": "execute_vm_command",
+            "description": "Execute commands in a VM via QEMU guest agent.",
+            "input_schema": {
+                "type": "object",
+                "properties": {
+                    "node": {
+                        "type": "string",
+                        "description": "Host node name (e.g. 'pve1', 'proxmox-node2')"
                     },
-                    "required": ["node"]
-                }
-            },
-            {
-                "name": "get_vms",
-                "description": "List all virtual machines across the cluster with their status and resource usage.",
-                "input_schema": {
-                    "type": "object",
-                    "properties": {},
-                    "required": []
-                }
-            },
-            {
-                "name": "execute_vm_command",
-                "description": "Execute commands in a VM via QEMU guest agent.",
-                "input_schema": {
-                    "type": "object",
-                    "properties": {
-                        "node": {
-                            "type": "string",
-                            "description": "Host node name (e.g. 'pve1', 'proxmox-node2')"
-                        },
-                        "vmid": {
-                            "type": "string",
-                            "description": "VM ID number (e.g. '100', '101')"
-                        },
-                        "command": {
-                            "type": "string",
-                            "description": "Shell command to run (e.g. 'uname -a', 'systemctl status nginx')"
-                        }
+                    "vmid": {
+                        "type": "string",
+                        "description": "VM ID number (e.g. '100', '101')"
                     },
-                    "required": ["node", "vmid", "command"]
-                }
-            },
-            {
-                "name": "get_storage",
-                "description": "List storage pools across the cluster with their usage and configuration.",
-                "input_schema": {
-                    "type": "object",
-                    "properties": {},
-                    "required": []
-                }
-            },
-            {
-                "name": "get_cluster_status",
-                "description": "Get overall Proxmox cluster health and configuration status.",
-                "input_schema": {
-                    "type": "object",
-                    "properties": {},
-                    "required": []
-                }
-            },
-
-            # Template operations
-            {
-                "name": "get_templates",
-                "description": "List all VM templates available across the cluster.",
-                "input_schema": {
-                    "type": "object",
-                    "properties": {},
-                    "required": []
-                }
-            },
-            {
-                "name": "clone_template",
-                "description": "Clone a VM template to create a new VM.",
-                "input_schema": {
-                    "type": "object",
-                    "properties": {
-                        "node": {
-                            "type": "string",
-                            "description": "Node where the template is located"
-                        },
-                        "template_vmid": {
-                            "type": "string",
-                            "description": "VM ID of the template to clone"
-                        },
-                        "new_vm_name": {
-                            "type": "string",
-                            "description": "Name for the new VM"
-                        },
-                        "target_node": {
-                            "type": "string",
-                            "description": "Target node for the new VM (optional)"
-                        },
-                        "full_clone": {
-                            "type": "boolean",
-                            "description": "Whether to perform a full clone (true) or linked clone (false)"
-                        },
-                        "storage": {
-                            "type": "string",
-                            "description": "Storage for the new VM (optional)"
-                        }
+                    "command": {
+                        "type": "string",
+                        "description": "Shell command to run (e.g. 'uname -a', 'systemctl status nginx')"
+                    }
+                },
+                "required": ["node", "vmid", "command"]
+            }
+        },
+        {
+            "name": "get_storage",
+            "description": "List storage pools across the cluster with their usage and configuration.",
+            "input_schema": {
+                "type": "object",
+                "properties": {},
+                "required": []
+            }
+        },
+        {
+            "name": "get_cluster_status",
+            "description": "Get overall Proxmox cluster health and configuration status.",
+            "input_schema": {
+                "type": "object",
+                "properties": {},
+                "required": []
+            }
+        },
+
+        # Template operations
+        {
+            "name": "get_templates",
+            "description": "List all VM templates available across the cluster.",
+            "input_schema": {
+                "type": "object",
+                "properties": {},
+                "required": []
+            }
+        },
+        {
+            "name": "clone_template",
+            "description": "Clone a VM template to create a new VM.",
+            "input_schema": {
+                "type": "object",
+                "properties": {
+                    "node": {
+                        "type": "string",
+                        "description": "Node where the template is located"
+                    },
+                    "template_vmid": {
+                        "type": "string",
+                        "description": "VM ID of the template to clone"
+                    },
+                    "new_vm_name": {
+                        "type": "string",
+                        "description": "Name for the new VM"
+                    },
+                    "target_node": {
+                        "type": "string",
+                        "description": "Target node for the new VM (optional)"
+                    },
+                    "full_clone": {
+                        "type": "boolean",
+                        "description": "Whether to perform a full clone (true) or linked clone (false)"
+                    },
+                    "storage": {
+                        "type": "string",
+                        "description": "Storage for the new VM (optional)"
+                    }
+                },
+                "required": ["node", "template_vmid", "new_vm_name"]
+            }
+        },
+
+        # VM power operations
+        {
+            "name": "start_vm",
+            "description": "Start a VM.",
+            "input_schema": {
+                "type": "object",
+                "properties": {
+                    "node": {
+                        "type": "string",
+                        "description": "Node where the VM is located"
                     },
-                    "required": ["node", "template_vmid", "new_vm_name"]
-                }
-            },
-
-            # VM power operations
-            {
-                "name": "start_vm",
-                "description": "Start a VM.",
-                "input_schema": {
-                    "type": "object",
-                    "properties": {
-                        "node": {
-                            "type": "string",
-                            "description": "Node where the VM is located"
-                        },
-                        "vmid": {
-                            "type": "string",
-                            "description": "VM ID to start"
-                        }
+                    "vmid": {
+                        "type": "string",
+                        "description": "VM ID to start"
+                    }
+                },
+                "required": ["node", "vmid"]
+            }
+        },
+        {
+            "name": "stop_vm",
+            "description": "Shutdown a VM gracefully.",
+            "input_schema": {
+                "type": "object",
+                "properties": {
+                    "node": {
+                        "type": "string",
+                        "description": "Node where the VM is located"
+                    },
+                    "vmid": {
+                        "type": "string",
+                        "description": "VM ID to shutdown"
+                    }
+                },
+                "required": ["node", "vmid"]
+            }
+        },
+        {
+            "name": "reboot_vm",
+            "description": "Reboot a VM gracefully.",
+            "input_schema": {
+                "type": "object",
+                "properties": {
+                    "node": {
+                        "type": "string",
+                        "description": "Node where the VM is located"
                     },
-                    "required": ["node", "vmid"]
-                }
-            },
-            {
-                "name": "stop_vm",
-                "description": "Shutdown a VM gracefully.",
-                "input_schema": {
-                    "type": "object",
-                    "properties": {
-                        "node": {
-                            "type": "string",
-                            "description": "Node where the VM is located"
-                        },
-                        "vmid": {
-                            "type": "string",
-                            "description": "VM ID to shutdown"
-                        }
+                    "vmid": {
+                        "type": "string",
+                        "description": "VM ID to reboot"
+                    }
+                },
+                "required": ["node", "vmid"]
+            }
+        },
+        {
+            "name": "start_vms",
+            "description": "Start several VMs at once.",
+            "input_schema": {
+                "type": "object",
+                "properties": {
+                    "vmids": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "VM IDs to start"
+                    }
+                },
+                "required": ["vmids"]
+            }
+        },
+        {
+            "name": "stop_vms",
+            "description": "Shutdown several VMs gracefully at once.",
+            "input_schema": {
+                "type": "object",
+                "properties": {
+                    "vmids": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "VM IDs to shutdown"
+                    }
+                },
+                "required": ["vmids"]
+            }
+        },
+        {
+            "name": "reboot_vms",
+            "description": "Reboot several VMs gracefully at once.",
+            "input_schema": {
+                "type": "object",
+                "properties": {
+                    "vmids": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "VM IDs to reboot"
+                    }
+                },
+                "required": ["vmids"]
+            }
+        },
+
+        # VM configuration operations
+        {
+            "name": "update_vm_config",
+            "description": "Update VM configuration (CPU, memory, name, description).",
+            "input_schema": {
+                "type": "object",
+                "properties": {
+                    "node": {
+                        "type": "string",
+                        "description": "Node where the VM is located"
                     },
-                    "required": ["node", "vmid"]
-                }
-            },
-            {
-                "name": "reboot_vm",
-                "description": "Reboot a VM gracefully.",
-                "input_schema": {
-                    "type": "object",
-                    "properties": {
-                        "node": {
-                            "type": "string",
-                            "description": "Node where the VM is located"
-                        },
-                        "vmid": {
-                            "type": "string",
-                            "description": "VM ID to reboot"
-                        }
+                    "vmid": {
+                        "type": "string",
+                        "description": "VM ID to update"
                     },
-                    "required": ["node", "vmid"]
-                }
-            },
-
-            # VM configuration operations
-            {
-                "name": "update_vm_config",
-                "description": "Update VM configuration (CPU, memory, name, description).",
-                "input_schema": {
-                    "type": "object",
-                    "properties": {
-                        "node": {
-                            "type": "string",
-                            "description": "Node where the VM is located"
-                        },
-                        "vmid": {
-                            "type": "string",
-                            "description": "VM ID to update"
-                        },
-                        "cpu": {
-                            "type": "integer",
-                            "description": "Number of CPU cores"
-                        },
-                        "memory": {
-                            "type": "integer",
-                            "description": "Memory in MB"
-                        },
-                        "name": {
-                            "type": "string",
-                            "description": "New name for the VM"
-                        },
-                        "description": {
-                            "type": "string",
-                            "description": "Description for the VM"
-                        }
+                    "cpu": {
+                        "type": "integer",
+                        "description": "Number of CPU cores"
                     },
-                    "required": ["node", "vmid"]
-                }
-            },
-            {
-                "name": "get_vm_config",
-                "description": "Get detailed VM configuration.",
-                "input_schema": {
-                    "type": "object",
-                    "properties": {
-                        "node": {
-                            "type": "string",
-                            "description": "Node where the VM is located"
-                        },
-                        "vmid": {
-                            "type": "string",
-                            "description": "VM ID to query"
-                        }
+                    "memory": {
+                        "type": "integer",
+                        "description": "Memory in MB"
                     },
-                    "required": ["node", "vmid"]
-                }
-            },
-
-            # Task operations
-            {
-                "name": "get_task_status",
-                "description": "Get the status of a task.",
-                "input_schema": {
-                    "type": "object",
-                    "properties": {
-                        "node": {
-                            "type": "string",
-                            "description": "Node where the task is running"
-                        },
-                        "task_id": {
-                            "type": "string",
-                            "description": "Task ID to query"
-                        }
+                    "name": {
+                        "type": "string",
+                        "description": "New name for the VM"
                     },
-                    "required": ["node", "task_id"]
-                }
-            },
-            {
-                "name": "wait_for_task",
-                "description": "Wait for a task to complete.",
-                "input_schema": {
-                    "type": "object",
-                    "properties": {
-                        "node": {
-                            "type": "string",
-                            "description": "Node where the task is running"
-                        },
-                        "task_id": {
-                            "type": "string",
-                            "description": "Task ID to wait for"
-                        },
-                        "timeout": {
-                            "type": "integer",
-                            "description": "Timeout in seconds (default: 300)"
-                        }
+                    "description": {
+                        "type": "string",
+                        "description": "Description for the VM"
+                    }
+                },
+                "required": ["node", "vmid"]
+            }
+        },
+        {
+            "name": "get_vm_config",
+            "description": "Get detailed VM configuration.",
+            "input_schema": {
+                "type": "object",
+                "properties": {
+                    "node": {
+                        "type": "string",
+                        "description": "Node where the VM is located"
                     },
-                    "required": ["node", "task_id"]
-                }
+                    "vmid": {
+                        "type": "string",
+                        "description": "VM ID to query"
+                    }
+                },
+                "required": ["node", "vmid"]
             }
-        ]
-    }
+        },
+
+        # Task operations
+        {
+            "name": "get_task_status",
+            "description": "Get the status of a task.",
+            "input_schema": {
+                "type": "object",
+                "properties": {
+                    "node": {
+                        "type": "string",
+                        "description": "Node where the task is running"
+                    },
+                    "task_id": {
+                        "type": "string",
+                        "description": "Task ID to query"
+                    }
+                },
+                "required": ["node", "task_id"]
+            }
+        },
+        {
+            "name": "wait_for_task",
+            "description": "Wait for a task to complete.",
+            "input_schema": {
+                "type": "object",
+                "properties": {
+                    "node": {
+                        "type": "string",
+                        "description": "Node where the task is running"
+                    },
+                    "task_id": {
+                        "type": "string",
+                        "description": "Task ID to wait for"
+                    },
+                    "timeout": {
+                        "type": "integer",
+                        "description": "Timeout in seconds (default: 300)"
+                    }
+                },
+                "required": ["node", "task_id"]
+            }
+        }
+    ]
+}
+_SERVER_INFO_JSON: Final = json.dumps(_SERVER_INFO, indent=2)
+_READY_JSON: Final = json.dumps({"status": "ready", "server": _SERVER_INFO})
+
+# Required arguments of each tool, read once from its input schema
+_REQUIRED: Final = {
+    tool["name"]: tuple(tool["input_schema"]["required"])
+    for tool in _SERVER_INFO["tools"]
+}
+
+def is_read_only(request: Any) -> bool:
+    """Return whether a request can run concurrently with other reads."""
+    tool = TOOLS.get(request.get("tool")) if isinstance(request, dict) else None
+    # Unknown tools and malformed requests only produce an error reply
+    return tool is None or tool[0] in READ_ONLY_ACTIONS
+
+def run_after(earlier: List[Future], request: Any) -> Dict[str, Any]:
+    """Handle a request once the earlier requests it must follow are done."""
+    wait(earlier)
+    return handle_mcp_request(request)
+
+def mcp_server_info() -> Dict[str, Any]:
+    """Return information about the MCP server."""
+    return _SERVER_INFO
+
+def send_line(line: str) -> None:
+    """Send one line to the client as a single write, then flush it."""
+    sys.stdout.write(line + "\n")
+    sys.stdout.flush()
+
+def write_responses(pending: queue.Queue) -> None:
+    """Write the responses of queued requests in request order, until None is queued."""
+    while True:
+        future = pending.get()
+        if future is None:
+            return
+        # Encode once for both the log and the reply
+        payload = json.dumps(future.result())
+        logger.info("Sending response: %s", payload)
+        send_line(payload)
 
 def main():
     """Main function to run the MCP server."""
@@ -501,7 +565,7 @@ def main():
 
     # Print server information and exit
     if args.info:
-        print(json.dumps(mcp_server_info(), indent=2))
+        print(_SERVER_INFO_JSON)
         return
 
     # Run a specific tool once and exit
@@ -520,43 +584,57 @@ def main():
 
     # Run the MCP server in interactive mode
     logger.info("Starting MCP server in interactive mode")
-    print(json.dumps({"status": "ready", "server": mcp_server_info()}))
-    sys.stdout.flush()
+    send_line(_READY_JSON)
+
+    # Requests are handled by the worker threads; a writer thread sends
+    # each response once it and all earlier ones are done
+    pending = queue.Queue()
+    writer = threading.Thread(target=write_responses, args=(pending,), daemon=True)
+    writer.start()
+
+    # The last barrier request and the reads submitted since
+    barrier = []
+    reads = []
 
     try:
         while True:
+            # One request per line; readline() returns "" at EOF
+            line = sys.stdin.readline()
+            if not line:
+                logger.info("Input closed, stopping MCP server")
+                break
+
+            if not line.strip():
+                continue
+
+            logger.info("Received request: %s", line.strip())
             try:
-                # Use a more robust way to read from stdin
-                line = ""
-                while True:
-                    char = sys.stdin.read(1)
-                    if not char:  # EOF
-                        break
-                    line += char
-                    if char == '\n':
-                        break
-
-                if not line.strip():
-                    continue
-
-                logger.info(f"Received request: {line.strip()}")
                 request = json.loads(line)
-                response = handle_mcp_request(request)
-                logger.info(f"Sending response: {json.dumps(response)}")
-                print(json.dumps(response))
-                sys.stdout.flush()
-
-                if args.once:
-                    logger.info("Exiting after one request (--once flag)")
-                    break
             except json.JSONDecodeError as e:
-                print(json.dumps({"error": f"Failed to parse request: {e}"}))
-                sys.stdout.flush()
+                error = Future()
+                error.set_result({"error": f"Failed to parse request: {e}"})
+                pending.put(error)
+                continue
+            if is_read_only(request):
+                future = _EXECUTOR.submit(run_after, barrier, request)
+                reads.append(future)
+            else:
+                future = _WRITE_EXECUTOR.submit(run_after, barrier + reads, request)
+                barrier, reads = [future], []
+            pending.put(future)
+
+            if args.once:
+                logger.info("Exiting after one request (--once flag)")
+                break
     except KeyboardInterrupt:
         logger.info("MCP server stopped by user")
     except Exception as e:
         logger.error(f"Error in MCP server: {e}")
         sys.exit(1)
+    finally:
+        # Send the responses still outstanding before exiting
+        pending.put(None)
+        writer.join()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
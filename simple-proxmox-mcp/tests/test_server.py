@@ -0,0 +1,137 @@
+"""
+Tests for the simple Proxmox MCP server.
+"""
+
+import importlib
+import io
+import json
+import os
+import sys
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    """Fixture to import the server with its log file kept out of the tree."""
+    monkeypatch.chdir(tmp_path)
+    module = importlib.import_module("server")
+    module.drop_responses()
+    with patch.object(module, "get_proxmox", return_value=Mock()):
+        yield module
+
+def run_interactive(server, requests, capsys):
+    """Feed requests to the interactive loop and return the replies it wrote."""
+    stdin = io.StringIO("".join(json.dumps(request) + "\n" for request in requests))
+    with patch.object(sys, "stdin", stdin), patch.object(sys, "argv", ["server.py"]):
+        server.main()
+    lines = capsys.readouterr().out.splitlines()
+    assert json.loads(lines[0])["status"] == "ready"
+    return [json.loads(line) for line in lines[1:]]
+
+def test_replies_follow_request_order(server, capsys):
+    """Test that concurrent requests are answered in the order they were sent."""
+    finished = []
+    lock = threading.Lock()
+
+    def dispatch(proxmox, action, arguments):
+        time.sleep(0.2 if action == "get_nodes" else 0)
+        with lock:
+            finished.append(action)
+        return {"action": action}
+
+    with patch.object(server.proxmox_api, "dispatch", side_effect=dispatch):
+        replies = run_interactive(server, [
+            {"tool": "get_nodes", "arguments": {}},
+            {"tool": "get_storage", "arguments": {}},
+        ], capsys)
+
+    assert finished == ["get_storage", "get_nodes"]
+    assert replies == [{"action": "get_nodes"}, {"action": "get_storage"}]
+
+def test_read_after_write_sees_the_write(server, capsys):
+    """Test that a read pipelined after a write runs once the write is done."""
+    vm = {"name": "old"}
+    events = []
+
+    def dispatch(proxmox, action, arguments):
+        if action == "update_vm_config":
+            events.append("write started")
+            time.sleep(0.2)
+            vm["name"] = arguments["name"]
+            events.append("write done")
+            return {"success": True}
+        events.append("read")
+        return dict(vm)
+
+    vm_args = {"node": "pve", "vmid": "100"}
+    with patch.object(server.proxmox_api, "dispatch", side_effect=dispatch):
+        replies = run_interactive(server, [
+            {"tool": "get_vm_config", "arguments": vm_args},
+            {"tool": "update_vm_config", "arguments": {**vm_args, "name": "new"}},
+            {"tool": "get_vm_config", "arguments": vm_args},
+        ], capsys)
+
+    assert events == ["read", "write started", "write done", "read"]
+    assert replies == [{"name": "old"}, {"success": True}, {"name": "new"}]
+
+def test_writes_run_one_at_a_time_in_order(server, capsys):
+    """Test that pipelined writes neither overlap nor change order."""
+    events = []
+
+    def dispatch(proxmox, action, arguments):
+        events.append(f"{action} started")
+        time.sleep(0.1 if action == "stop_vm" else 0)
+        events.append(f"{action} done")
+        return {"action": action}
+
+    vm_args = {"node": "pve", "vmid": "100"}
+    with patch.object(server.proxmox_api, "dispatch", side_effect=dispatch):
+        run_interactive(server, [
+            {"tool": "stop_vm", "arguments": vm_args},
+            {"tool": "start_vm", "arguments": vm_args},
+        ], capsys)
+
+    assert events == ["stop_vm started", "stop_vm done", "start_vm started", "start_vm done"]
+
+def test_invalid_request_keeps_its_place(server, capsys):
+    """Test that an unparsable line gets an error reply in its position."""
+    stdin = io.StringIO('not json\n{"tool": "get_nodes", "arguments": {}}\n')
+    with patch.object(server.proxmox_api, "dispatch", return_value=["pve"]), \
+            patch.object(sys, "stdin", stdin), patch.object(sys, "argv", ["server.py"]):
+        server.main()
+    replies = [json.loads(line) for line in capsys.readouterr().out.splitlines()[1:]]
+
+    assert "Failed to parse request" in replies[0]["error"]
+    assert replies[1] == ["pve"]
+
+def test_read_results_are_reused(server):
+    """Test that a read-only action is dispatched once within the TTL."""
+    with patch.object(server.proxmox_api, "dispatch", return_value=["pve"]) as dispatch:
+        assert server.run_proxmox_api("get_nodes") == ["pve"]
+        assert server.run_proxmox_api("get_nodes") == ["pve"]
+
+    assert dispatch.call_count == 1
+
+def test_write_action_drops_read_results(server):
+    """Test that any other action makes the next read go to Proxmox again."""
+    with patch.object(server.proxmox_api, "dispatch", return_value=["pve"]) as dispatch:
+        server.run_proxmox_api("get_nodes")
+        server.run_proxmox_api("start_vm", node="pve", vmid="100")
+        server.run_proxmox_api("get_nodes")
+
+    assert [call.args[1] for call in dispatch.call_args_list] == [
+        "get_nodes", "start_vm", "get_nodes"
+    ]
+
+def test_errors_are_not_reused(server):
+    """Test that failed reads are retried on the next call."""
+    with patch.object(server.proxmox_api, "dispatch", return_value={"error": "down"}) as dispatch:
+        server.run_proxmox_api("get_nodes")
+        server.run_proxmox_api("get_nodes")
+
+    assert dispatch.call_count == 2
@@ -1,70 +1,88 @@
 #!/usr/bin/env python3
 """
-Simple script to test the ProxmoxMCP server directly using subprocess.
+Simple script to test the simple Proxmox MCP server directly using subprocess.
+
+The server (simple-proxmox-mcp/server.py) reads its credentials from
+config.json in its own directory.
 """
 import json
+import os
 import subprocess
 import sys
 import urllib3
-import warnings
 
 # Disable SSL warnings
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
-def run_mcp_tool(tool_name, arguments=None):
-    """Run an MCP tool and return the result."""
+# Interpreter for the server under test (it needs proxmoxer); override it
+# through the environment instead of editing this script
+SERVER_PYTHON = os.environ.get(
+    "PROXMOX_MCP_PYTHON",
+    "/home/student/vscode/new-proxmox-mcp/ProxmoxMCP/.venv-py312/bin/python"
+)
+
+# The simple server speaks the line protocol used below: a ready line,
+# then one {"tool": ..., "arguments": ...} request and one reply per line
+SERVER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "simple-proxmox-mcp", "server.py")
+
+def start_server():
+    """Start the server in interactive mode and wait until it is ready.
+
+    All tests share this one process, sending one JSON request per line,
+    so the interpreter and server modules are only loaded once.
+    """
+    cmd = [SERVER_PYTHON, SERVER_SCRIPT]
+    print(f"Starting server: {' '.join(cmd)}")
+
+    server = subprocess.Popen(
+        cmd,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        text=True,
+        bufsize=1
+    )
+
+    ready = server.stdout.readline().strip()
+    if not ready:
+        print(f"Error: Server exited with code {server.wait()} before it was ready")
+        return None
+    print("Server ready")
+    return server
+
+def stop_server(server):
+    """Close the server's input and wait for it to exit."""
+    server.stdin.close()
+    server.wait()
+
+def run_mcp_tool(server, tool_name, arguments=None):
+    """Run an MCP tool on the running server and return the result."""
     if arguments is None:
         arguments = {}
-        
-    cmd = [
-        "/home/student/vscode/new-proxmox-mcp/ProxmoxMCP/.venv-py312/bin/python",
-        "-m", "proxmox_mcp.server",
-        "--tool", tool_name,
-        "--once"
-    ]
-    
-    if arguments:
-        cmd.extend(["--arguments", json.dumps(arguments)])
-    
-    env = {
-        "PROXMOX_MCP_CONFIG": "/home/student/vscode/new-proxmox-mcp/ProxmoxMCP/proxmox-config/config.json"
-    }
-    
-    print(f"Running command: {' '.join(cmd)}")
+
+    print(f"Running tool: {tool_name}")
     print(f"With arguments: {arguments}")
-    
+
+    server.stdin.write(json.dumps({"tool": tool_name, "arguments": arguments}) + "\n")
+    server.stdin.flush()
+
+    output = server.stdout.readline().strip()
+    if not output:
+        print(f"Error: Server exited with code {server.wait()}")
+        return None
+    print(f"Raw output: {output}")
+
     try:
-        result = subprocess.run(
-            cmd,
-            env=env,
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        
-        output = result.stdout.strip()
-        print(f"Raw output: {output}")
-        
-        try:
-            data = json.loads(output)
-            return data
-        except json.JSONDecodeError:
-            print("Error: Failed to parse JSON output")
-            return None
-            
-    except subprocess.CalledProcessError as e:
-        print(f"Error: Command failed with exit code {e.returncode}")
-        print(f"Stdout: {e.stdout}")
-        print(f"Stderr: {e.stderr}")
+        data = json.loads(output)
+        return data
+    except json.JSONDecodeError:
+        print("Error: Failed to parse JSON output")
         return None
 
-def main():
-    """Test the ProxmoxMCP server."""
-    print("Testing ProxmoxMCP server...")
-    
+def run_tests(server):
+    """Run each tool test against the server."""
     # Test get_nodes
     print("\n=== Testing get_nodes ===")
-    nodes = run_mcp_tool("get_nodes")
+    nodes = run_mcp_tool(server, "get_nodes")
     if nodes:
         print(json.dumps(nodes, indent=2))
     
@@ -72,22 +90,35 @@ def main():
     if nodes and len(nodes) > 0:
         node_name = nodes[0]["node"]
         print(f"\n=== Testing get_node_status for {node_name} ===")
-        node_status = run_mcp_tool("get_node_status", {"node": node_name})
+        node_status = run_mcp_tool(server, "get_node_status", {"node": node_name})
         if node_status:
             print(json.dumps(node_status, indent=2))
     
     # Test get_cluster_status
     print("\n=== Testing get_cluster_status ===")
-    cluster_status = run_mcp_tool("get_cluster_status")
+    cluster_status = run_mcp_tool(server, "get_cluster_status")
     if cluster_status:
         print(json.dumps(cluster_status, indent=2))
     
     # Test get_storage
     print("\n=== Testing get_storage ===")
-    storage = run_mcp_tool("get_storage")
+    storage = run_mcp_tool(server, "get_storage")
     if storage:
         print(json.dumps(storage, indent=2))
-    
+
+def main():
+    """Test the simple Proxmox MCP server."""
+    print("Testing simple Proxmox MCP server...")
+
+    server = start_server()
+    if server is None:
+        return 1
+
+    try:
+        run_tests(server)
+    finally:
+        stop_server(server)
+
     print("\nTests completed!")
     return 0
 